@@ -0,0 +1,201 @@
+"""
+AI Analysis Result Cache
+Persists Claude responses keyed by a hash of the rendered prompt, system
+prompt, model and max_tokens so identical assessments are answered instantly
+and without a billable call. Local SQLite by default; set REDIS_URL to share
+results across containers (see the redis service in docker-compose.yaml).
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from content_cache import content_key
+
+
+def analysis_key(prompt: str, system_prompt: str, model: str, max_tokens: int) -> str:
+    """Canonical cache key for one Claude request"""
+    return content_key("ai-analysis", model, max_tokens, system_prompt, prompt)
+
+
+def is_cacheable(text: str) -> bool:
+    """Errors and missing-key notices must never be replayed from the cache"""
+    return bool(text) and not text.lstrip().startswith("⚠️") and "⚠️ **Error**" not in text
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class SQLiteCacheBackend:
+    """Single-file cache with TTL expiry and least-recently-used eviction"""
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ai_results ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ai_results_accessed ON ai_results (accessed_at)")
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM ai_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM ai_results WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE ai_results SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: str):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_results (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now),
+            )
+            self._conn.execute("DELETE FROM ai_results WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM ai_results WHERE key IN ("
+                " SELECT key FROM ai_results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM ai_results WHERE expires_at > ?", (time.time(),)
+            ).fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM ai_results")
+
+
+class RedisCacheBackend:
+    """Shared cache on Redis: native key TTL plus a sorted set tracking recency for eviction"""
+
+    def __init__(self, url: str, ttl_seconds: int, max_entries: int, prefix: str = "assessment:ai:"):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("REDIS_URL is set but the redis package is missing. Run: pip install redis")
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self._index = prefix + "lru"
+
+    def get(self, key: str):
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            self.client.zrem(self._index, key)
+            return None
+        self.client.zadd(self._index, {key: time.time()})
+        return value.decode("utf-8")
+
+    def set(self, key: str, value: str):
+        pipe = self.client.pipeline()
+        pipe.set(self.prefix + key, value.encode("utf-8"), ex=self.ttl_seconds)
+        pipe.zadd(self._index, {key: time.time()})
+        pipe.execute()
+        overflow = self.client.zcard(self._index) - self.max_entries
+        if overflow > 0:
+            evicted = [k.decode("utf-8") for k, _ in self.client.zpopmin(self._index, overflow)]
+            self.client.delete(*[self.prefix + k for k in evicted])
+
+    def __len__(self):
+        return self.client.zcard(self._index)
+
+    def clear(self):
+        keys = [self.prefix + k.decode("utf-8") for k in self.client.zrange(self._index, 0, -1)]
+        if keys:
+            self.client.delete(*keys)
+        self.client.delete(self._index)
+
+
+# =============================================================================
+# FRONT END
+# =============================================================================
+
+class AnalysisCache:
+    """Hit/miss accounting around a backend; cache failures never block an analysis"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # generate_many workers look up concurrently
+
+    def get(self, prompt: str, system_prompt: str, model: str, max_tokens: int):
+        try:
+            value = self.backend.get(analysis_key(prompt, system_prompt, model, max_tokens))
+        except Exception:
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, prompt: str, system_prompt: str, model: str, max_tokens: int, text: str, stop_reason: str = None):
+        """Store text unless it is an error or was cut off at max_tokens"""
+        if stop_reason == "max_tokens" or not is_cacheable(text):
+            return
+        try:
+            self.backend.set(analysis_key(prompt, system_prompt, model, max_tokens), text)
+        except Exception:
+            pass  # Best-effort: a full disk or unreachable Redis only costs a fresh call next time
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        try:
+            entries = len(self.backend)
+        except Exception:
+            entries = None
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_ai_cache() -> AnalysisCache:
+    """Process-wide cache configured from REDIS_URL / AI_CACHE_* environment variables"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            ttl = int(float(os.environ.get("AI_CACHE_TTL_HOURS", "168")) * 3600)
+            max_entries = int(os.environ.get("AI_CACHE_MAX_ENTRIES", "500"))
+            redis_url = os.environ.get("REDIS_URL")
+            if redis_url:
+                backend = RedisCacheBackend(redis_url, ttl, max_entries)
+            else:
+                path = os.environ.get("AI_CACHE_PATH") or os.path.join(
+                    tempfile.gettempdir(), "aws-assessment", "ai_cache.sqlite3")
+                backend = SQLiteCacheBackend(path, ttl, max_entries)
+            _cache = AnalysisCache(backend)
+        return _cache
@@ -0,0 +1,159 @@
+"""
+Shared Anthropic Client
+One long-lived, connection-pooled client per process, retry with backoff on
+rate-limit (429) and overloaded (529) responses, and a bounded concurrent
+fan-out for generating several analyses at once. Set ANTHROPIC_BASE_URL to
+tools/stub_anthropic_server.py to exercise all of this offline.
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from instrumentation import observe, record_tokens
+
+RETRY_STATUSES = {429, 529}
+
+_client = None
+_client_key = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide client reused across sessions; None when no API key is configured"""
+    global _client, _client_key
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        return None
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            import anthropic
+            # Retries are handled here so backoff and attempt counts are visible to callers
+            _client = anthropic.Anthropic(api_key=api_key, max_retries=0)
+            _client_key = api_key
+        return _client
+
+
+def max_concurrency() -> int:
+    return max(1, int(os.environ.get("AI_MAX_CONCURRENCY", "3")))
+
+
+def retry_delay(error, attempt: int, base_delay: float = 1.0, max_delay: float = 30.0):
+    """Seconds to wait before retrying error, or None when it should not be retried"""
+    if getattr(error, "status_code", None) not in RETRY_STATUSES:
+        return None
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), max_delay)
+        except ValueError:
+            pass
+    # Exponential backoff with full jitter so concurrent requests do not retry in lockstep
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+def create_message(prompt: str, system: str, model: str, max_tokens: int, max_attempts: int = 4) -> dict:
+    """Blocking call with backoff; returns text plus timing, attempts, token usage and stop_reason"""
+    client = get_client()
+    if client is None:
+        raise RuntimeError("ANTHROPIC_API_KEY is not configured")
+
+    start = time.perf_counter()
+    for attempt in range(1, max_attempts + 1):
+        try:
+            response = client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                system=system,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            break
+        except Exception as e:
+            delay = retry_delay(e, attempt)
+            if delay is None or attempt == max_attempts:
+                observe("claude_message", time.perf_counter() - start, f"{type(e).__name__}: {e}",
+                        model=model, attempts=attempt)
+                raise
+            time.sleep(delay)
+
+    result = {
+        "text": "".join(block.text for block in response.content if getattr(block, "type", "") == "text"),
+        "latency_s": time.perf_counter() - start,
+        "attempts": attempt,
+        "input_tokens": response.usage.input_tokens,
+        "output_tokens": response.usage.output_tokens,
+        "stop_reason": response.stop_reason,
+    }
+    observe("claude_message", result["latency_s"], model=model, attempts=attempt,
+            input_tokens=result["input_tokens"], output_tokens=result["output_tokens"])
+    record_tokens(model, result["input_tokens"], result["output_tokens"])
+    return result
+
+
+def stream_text(prompt: str, system: str, model: str, max_tokens: int, timings: dict, max_attempts: int = 4):
+    """Yield text chunks; retries only before the first token so output is never duplicated
+
+    timings receives ttft_s, total_s, attempts and, once the stream completes, token usage and
+    stop_reason. stop_reason stays None when the stream failed, so a partial answer is recognisable.
+    """
+    # Filled before the client is created so callers can always read every field
+    start = time.perf_counter()
+    timings.update(ttft_s=None, total_s=0.0, attempts=0, input_tokens=None, output_tokens=None, stop_reason=None)
+    client = get_client()
+    if client is None:
+        raise RuntimeError("ANTHROPIC_API_KEY is not configured")
+
+    error = None
+    try:
+        for attempt in range(1, max_attempts + 1):
+            timings["attempts"] = attempt
+            try:
+                with client.messages.stream(
+                    model=model,
+                    max_tokens=max_tokens,
+                    system=system,
+                    messages=[{"role": "user", "content": prompt}],
+                ) as stream:
+                    for text in stream.text_stream:
+                        if timings["ttft_s"] is None:
+                            timings["ttft_s"] = time.perf_counter() - start
+                        yield text
+                    final = stream.get_final_message()
+                    timings.update(input_tokens=final.usage.input_tokens, output_tokens=final.usage.output_tokens,
+                                   stop_reason=final.stop_reason)
+                return
+            except Exception as e:
+                delay = retry_delay(e, attempt)
+                if timings["ttft_s"] is not None or delay is None or attempt == max_attempts:
+                    error = f"{type(e).__name__}: {e}"
+                    raise
+                time.sleep(delay)
+    finally:
+        timings["total_s"] = time.perf_counter() - start
+        observe("claude_stream", timings["total_s"], error, model=model, **timings)
+        record_tokens(model, timings["input_tokens"], timings["output_tokens"], timings["ttft_s"])
+
+
+def generate_many(prompts: dict, system: str, model: str, max_tokens: int, concurrency: int = None):
+    """Run {name: prompt} concurrently over the shared client, yielding (name, result) as each finishes
+
+    result is create_message's dict, or {"error": str, "latency_s": float} on failure.
+    """
+    if not prompts:
+        return
+    workers = min(concurrency or max_concurrency(), len(prompts))
+
+    def run(prompt):
+        start = time.perf_counter()
+        try:
+            return create_message(prompt, system, model, max_tokens)
+        except Exception as e:
+            return {"error": str(e), "latency_s": time.perf_counter() - start}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="claude") as pool:
+        futures = {pool.submit(run, prompt): name for name, prompt in prompts.items()}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
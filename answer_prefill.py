@@ -0,0 +1,220 @@
+"""
+Answer Prefill
+Suggests questionnaire answers from uploaded documents. Extracted text is cut
+into overlapping passages and indexed with BM25 (NumPy inverted index); each
+question's text, context and domain retrieve its top passages, and one small
+prompt per question asks Claude for a 1-5 answer from those passages only.
+Questions without any matching passage are skipped without a request. Prompts
+are deterministic for the same documents, so they are answered from the AI
+result cache on re-runs.
+"""
+
+import json
+import re
+import time
+
+import numpy as np
+
+from ai_client import generate_many
+
+PASSAGE_WORDS = 180
+PASSAGE_OVERLAP = 40
+TOP_PASSAGES = 3
+PREFILL_MAX_TOKENS = 400
+CONFIDENCE_LEVELS = ("high", "medium", "low")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from has have how if in into is it its of on or our "
+    "that the their there these this to was were what when where which who will with without you your "
+    "we us all any are not no yes".split()
+)
+
+
+def tokenize(text: str) -> list:
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) > 1 and token not in STOPWORDS]
+
+
+def split_passages(documents: list, words: int = PASSAGE_WORDS, overlap: int = PASSAGE_OVERLAP) -> list:
+    """[(name, text)] -> [{"source", "text"}] windows of words, overlapping so no sentence is cut off entirely"""
+    passages = []
+    step = max(1, words - overlap)
+    for name, text in documents:
+        tokens = text.split()
+        for start in range(0, max(1, len(tokens) - overlap), step):
+            window = tokens[start:start + words]
+            if window:
+                passages.append({"source": name, "text": " ".join(window)})
+    return passages
+
+
+class PassageIndex:
+    """Okapi BM25 over passages, stored as a term -> (passage ids, term frequencies) inverted index"""
+
+    def __init__(self, passages: list, k1: float = 1.5, b: float = 0.75):
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+        self.vocabulary = {}
+        term_ids, doc_ids, counts = [], [], []
+        lengths = np.zeros(len(passages), dtype=np.float64)
+        for doc, passage in enumerate(passages):
+            tokens = tokenize(passage["text"])
+            lengths[doc] = len(tokens)
+            ids = np.fromiter((self.vocabulary.setdefault(t, len(self.vocabulary)) for t in tokens),
+                              dtype=np.int64, count=len(tokens))
+            unique, tf = np.unique(ids, return_counts=True)
+            term_ids.append(unique)
+            doc_ids.append(np.full(len(unique), doc, dtype=np.int64))
+            counts.append(tf)
+
+        terms = np.concatenate(term_ids) if term_ids else np.zeros(0, dtype=np.int64)
+        order = np.argsort(terms, kind="stable")
+        self.postings_doc = np.concatenate(doc_ids)[order] if doc_ids else np.zeros(0, dtype=np.int64)
+        tf = np.concatenate(counts)[order].astype(np.float64) if counts else np.zeros(0)
+        df = np.bincount(terms, minlength=len(self.vocabulary))
+        self.indptr = np.concatenate([[0], np.cumsum(df)])
+        self.idf = np.log1p((len(passages) - df + 0.5) / (df + 0.5))
+
+        # Precompute each posting's BM25 term weight; a query is then a sum of slices
+        average = lengths.mean() if len(passages) else 0.0
+        norm = k1 * (1 - b + b * lengths[self.postings_doc] / (average or 1.0))
+        self.postings_weight = tf * (k1 + 1) / (tf + norm)
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+    def scores(self, query: str) -> np.ndarray:
+        scores = np.zeros(len(self.passages))
+        for term in set(tokenize(query)):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            lo, hi = self.indptr[term_id], self.indptr[term_id + 1]
+            np.add.at(scores, self.postings_doc[lo:hi], self.idf[term_id] * self.postings_weight[lo:hi])
+        return scores
+
+    def search(self, query: str, k: int = TOP_PASSAGES) -> list:
+        """Top k (passage, score) pairs with a positive score, best first"""
+        scores = self.scores(query)
+        if not len(scores):
+            return []
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.passages[i], float(scores[i])) for i in top if scores[i] > 0]
+
+
+# =============================================================================
+# PROMPTS
+# =============================================================================
+
+def question_query(q: dict, domain: str) -> str:
+    return f"{q['question']} {q.get('context', '')} {domain}"
+
+
+def prefill_prompt(q: dict, domain: str, hits: list) -> str:
+    """Small per-question prompt: the question, its five options and only the retrieved passages"""
+    options = "\n".join(f"{i}. {option}" for i, option in enumerate(q["options"], 1))
+    excerpts = "\n\n".join(f"[{n}] ({passage['source']}) {passage['text']}" for n, (passage, _) in enumerate(hits, 1))
+    return f"""
+Answer one assessment question for an organisation using only the documentation excerpts below.
+
+Domain: {domain}
+Question {q['id']}: {q['question']}
+Why it matters: {q.get('context', '')}
+
+Options:
+{options}
+
+Excerpts:
+{excerpts}
+
+Respond with only JSON, no prose:
+{{"answer": <option number 1-5, or null if the excerpts do not say>, "confidence": "high" | "medium" | "low", "rationale": "<one sentence citing the excerpt numbers>"}}
+"""
+
+
+def parse_suggestion(text: str):
+    """{"answer", "confidence", "rationale"} from a prefill response; None when unusable"""
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        return None
+    try:
+        data = json.loads(text[start:end + 1])
+        answer = data.get("answer")
+        answer = int(answer) if answer is not None else None
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if answer is not None and not 1 <= answer <= 5:
+        return None
+    confidence = str(data.get("confidence", "low")).lower()
+    return {
+        "answer": answer,
+        "confidence": confidence if confidence in CONFIDENCE_LEVELS else "low",
+        "rationale": str(data.get("rationale") or ""),
+    }
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+def suggest_answers(documents: list, catalogs: dict, system: str, model: str, cache=None,
+                    top_k: int = TOP_PASSAGES, on_result=None) -> tuple:
+    """Suggested answers for every question in catalogs ({kind: domains}) from [(name, text)]
+
+    Returns ({kind: {qid: suggestion}}, stats). A suggestion is parse_suggestion's dict plus
+    "sources"; questions without retrieved passages or with an unusable response are absent.
+    on_result(done, total) reports progress as each request finishes.
+    """
+    started = time.perf_counter()
+    index = PassageIndex(split_passages(documents))
+    prompts, sources = {}, {}
+    for kind, domains in catalogs.items():
+        for dname, ddata in domains.items():
+            for q in ddata["questions"]:
+                hits = index.search(question_query(q, dname), top_k)
+                if hits:
+                    prompts[(kind, q["id"])] = prefill_prompt(q, dname, hits)
+                    sources[(kind, q["id"])] = sorted({passage["source"] for passage, _ in hits})
+    retrieval_s = time.perf_counter() - started
+
+    suggestions = {kind: {} for kind in catalogs}
+    stats = {"passages": len(index), "questions": sum(len(d["questions"]) for domains in catalogs.values()
+                                                     for d in domains.values()),
+             "retrieved": len(prompts), "requests": 0, "cached": 0, "errors": 0,
+             "input_tokens": 0, "output_tokens": 0, "retrieval_s": retrieval_s}
+
+    def accept(key, text):
+        suggestion = parse_suggestion(text)
+        if suggestion is not None and suggestion["answer"] is not None:
+            suggestions[key[0]][key[1]] = dict(suggestion, sources=sources[key])
+        return suggestion
+
+    pending = {}
+    for key, prompt in prompts.items():
+        cached = cache.get(prompt, system, model, PREFILL_MAX_TOKENS) if cache else None
+        if cached is not None and accept(key, cached) is not None:
+            stats["cached"] += 1
+        else:
+            pending[key] = prompt
+    done = stats["cached"]
+    if on_result:
+        on_result(done, len(prompts))
+
+    for key, result in generate_many(pending, system, model, PREFILL_MAX_TOKENS):
+        done += 1
+        stats["requests"] += 1
+        if "error" in result:
+            stats["errors"] += 1
+        else:
+            stats["input_tokens"] += result.get("input_tokens") or 0
+            stats["output_tokens"] += result.get("output_tokens") or 0
+            if accept(key, result["text"]) is not None and cache:
+                cache.put(pending[key], system, model, PREFILL_MAX_TOKENS, result["text"], result["stop_reason"])
+        if on_result:
+            on_result(done, len(prompts))
+
+    stats["total_s"] = time.perf_counter() - started
+    return suggestions, stats
@@ -9,8 +9,16 @@ import json
 import os
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import io
 import base64
+import time
+
+from ai_cache import get_ai_cache
+from ai_client import create_message, max_concurrency, stream_text
+from catalog_index import CatalogIndex
+from document_analysis import (chunk_budget, chunk_documents, map_chunks, max_chunks, merge_findings,
+                               reduce_prompt, stage_stats)
+from document_extraction import extract_cached, extraction_cache, finished_result, submit_extraction
+from instrumentation import register_caches, start_metrics_server, timer
 
 # Configure page
 st.set_page_config(
@@ -277,6 +285,10 @@ if 'ai_analysis' not in st.session_state:
     st.session_state.ai_analysis = None
 if 'document_content' not in st.session_state:
     st.session_state.document_content = None
+if 'doc_extractions' not in st.session_state:
+    st.session_state.doc_extractions = {}  # {uploaded file_id: Future of extract_text result}
+if 'ai_timings' not in st.session_state:
+    st.session_state.ai_timings = {}  # {analysis_type: [{ttft_s, total_s}]}
 
 # Assessment Questionnaire Data
 CONTROL_TOWER_DOMAINS = {
@@ -698,6 +710,10 @@ GOLDEN_ARCHITECTURE_DOMAINS = {
     }
 }
 
+# Lookup tables compiled once at import (id -> question/domain, score -> option label)
+CT_INDEX = CatalogIndex(CONTROL_TOWER_DOMAINS)
+GA_INDEX = CatalogIndex(GOLDEN_ARCHITECTURE_DOMAINS)
+
 
 def calculate_domain_score(responses: Dict[str, int], domain_questions: List[Dict]) -> float:
     """Calculate weighted score for a domain."""
@@ -761,82 +777,138 @@ def render_score_gauge(score: float, label: str):
     """, unsafe_allow_html=True)
 
 
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+CLAUDE_MAX_TOKENS = 4096
+DEFAULT_SYSTEM_PROMPT = "You are an expert AWS Solutions Architect specializing in Control Tower migrations and serverless golden architectures. Provide detailed, actionable insights."
+
+
 def call_claude_api(prompt: str, system_prompt: str = None) -> str:
     """Call Claude API for AI-driven analysis."""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        return "⚠️ ANTHROPIC_API_KEY not configured. Please set the environment variable to enable AI analysis."
     try:
-        import anthropic
-        
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            return "⚠️ ANTHROPIC_API_KEY not configured. Please set the environment variable to enable AI analysis."
-        
-        client = anthropic.Anthropic(api_key=api_key)
-        
-        messages = [{"role": "user", "content": prompt}]
-        
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4096,
-            system=system_prompt or "You are an expert AWS Solutions Architect specializing in Control Tower migrations and serverless golden architectures. Provide detailed, actionable insights.",
-            messages=messages
-        )
-        
-        return response.content[0].text
-        
+        return create_message(prompt, system_prompt or DEFAULT_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS)["text"]
     except ImportError:
         return "⚠️ Anthropic library not installed. Run: pip install anthropic"
     except Exception as e:
         return f"⚠️ AI Analysis Error: {str(e)}"
 
 
+def stream_claude_api(prompt: str, timings: dict, system_prompt: str = None):
+    """Streaming variant of call_claude_api; yields text chunks and fills timings."""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        timings.update(ttft_s=None, total_s=0.0)
+        yield "⚠️ ANTHROPIC_API_KEY not configured. Please set the environment variable to enable AI analysis."
+        return
+    try:
+        yield from stream_text(prompt, system_prompt or DEFAULT_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS, timings)
+    except ImportError:
+        yield "⚠️ Anthropic library not installed. Run: pip install anthropic"
+    except Exception as e:
+        separator = "\n\n" if timings.get("ttft_s") is not None else ""
+        yield f"{separator}⚠️ AI Analysis Error: {str(e)}"
+
+
+def ai_result_cache():
+    """Shared AI result cache, or None (with a caption) when its backend is unavailable."""
+    try:
+        return get_ai_cache()
+    except Exception as e:
+        st.caption(f"⚠️ AI result cache unavailable: {e}")
+        return None
+
+
+def stream_analysis(prompt: str, analysis_type: str) -> str:
+    """Render a streamed analysis in place and record its latency under analysis_type."""
+    cache = ai_result_cache()
+    cached = cache.get(prompt, DEFAULT_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS) if cache else None
+    if cached is not None:
+        st.markdown(cached)
+        st.session_state.ai_timings.setdefault(analysis_type, []).append({"ttft_s": 0.0, "total_s": 0.0, "cached": True})
+        st.caption("⚡ Served from the AI result cache (no API call)")
+        return cached
+    
+    timings = {}
+    streamed = st.write_stream(stream_claude_api(prompt, timings))
+    text = (streamed if isinstance(streamed, str) else "".join(map(str, streamed))).strip()
+    # Only a stream that finished is cached; a failure mid-answer leaves stop_reason unset
+    if cache and timings.get("stop_reason") is not None:
+        cache.put(prompt, DEFAULT_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS, text, timings["stop_reason"])
+    st.session_state.ai_timings.setdefault(analysis_type, []).append(timings)
+    first_token = f"{timings['ttft_s']:.1f}s" if timings["ttft_s"] is not None else "n/a"
+    st.caption(f"⏱️ First token {first_token} • complete in {timings['total_s']:.1f}s")
+    return text
+
+
 def extract_document_content(uploaded_file) -> str:
     """Extract content from uploaded documents."""
-    content = ""
-    file_type = uploaded_file.type
+    result = extract_cached(uploaded_file.name, uploaded_file.type, uploaded_file.getvalue())
+    return result["error"] or result["text"]
+
+
+@st.fragment(run_every=1.0)
+def render_extraction_progress(futures: dict):
+    """Poll background extractions without rerunning the whole app; reruns it once all are done."""
+    done = sum(future.done() for future in futures.values())
+    if done == len(futures):
+        st.rerun()
+    st.progress(done / len(futures), text=f"⏳ Extracting documents... {done}/{len(futures)} done")
+
+
+def analyze_documents(documents: List[tuple]) -> str:
+    """Map-reduce analysis of [(name, text)]: concurrent per-chunk findings, merged into one
+    streamed gap report, with token usage and latency per stage."""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        message = "⚠️ ANTHROPIC_API_KEY not configured. Please set the environment variable to enable AI analysis."
+        st.markdown(message)
+        return message
     
-    try:
-        if file_type == "application/pdf":
-            try:
-                import pypdf
-                pdf_reader = pypdf.PdfReader(io.BytesIO(uploaded_file.read()))
-                for page in pdf_reader.pages:
-                    content += page.extract_text() + "\n"
-            except ImportError:
-                try:
-                    import PyPDF2
-                    pdf_reader = PyPDF2.PdfReader(io.BytesIO(uploaded_file.read()))
-                    for page in pdf_reader.pages:
-                        content += page.extract_text() + "\n"
-                except ImportError:
-                    content = "PDF extraction requires pypdf or PyPDF2 library."
-                    
-        elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            try:
-                import docx
-                doc = docx.Document(io.BytesIO(uploaded_file.read()))
-                for para in doc.paragraphs:
-                    content += para.text + "\n"
-            except ImportError:
-                content = "DOCX extraction requires python-docx library."
-                
-        elif file_type == "application/vnd.openxmlformats-officedocument.presentationml.presentation":
-            try:
-                from pptx import Presentation
-                prs = Presentation(io.BytesIO(uploaded_file.read()))
-                for slide in prs.slides:
-                    for shape in slide.shapes:
-                        if hasattr(shape, "text"):
-                            content += shape.text + "\n"
-            except ImportError:
-                content = "PPTX extraction requires python-pptx library."
-                
-        elif file_type in ["text/plain", "application/json"]:
-            content = uploaded_file.read().decode("utf-8")
-            
-    except Exception as e:
-        content = f"Error extracting content: {str(e)}"
+    started = time.perf_counter()
+    chunks = chunk_documents(documents, chunk_budget())
+    skipped = chunks[max_chunks():]
+    chunks = chunks[:max_chunks()]
+    stages = [stage_stats("chunk", started, input_tokens=sum(chunk["tokens"] for chunk in chunks), chunks=len(chunks))]
+    if skipped:
+        st.warning(f"Only the first {len(chunks)} of {len(chunks) + len(skipped)} document chunks are analysed (DOC_MAX_CHUNKS)")
+    
+    domains = {
+        "Control Tower": list(CONTROL_TOWER_DOMAINS),
+        "Golden Architecture": list(GOLDEN_ARCHITECTURE_DOMAINS),
+    }
+    with st.status(f"Analysing {len(chunks)} chunks ({min(len(chunks), max_concurrency())} at a time)...",
+                   expanded=True) as status:
+        def on_result(index, result):
+            sources = ", ".join(chunks[index]["sources"])
+            if "error" in result:
+                st.write(f"⚠️ Chunk {index + 1} ({sources}) failed: {result['error']}")
+            elif result["findings"] is None:
+                st.write(f"⚠️ Chunk {index + 1} ({sources}) returned no usable findings")
+            else:
+                timing = "cached" if result["cached"] else f"{result['latency_s']:.1f}s"
+                st.write(f"✅ Chunk {index + 1} ({sources}): {len(result['findings'])} findings ({timing})")
+        
+        results, map_stage = map_chunks(chunks, domains, DEFAULT_SYSTEM_PROMPT, CLAUDE_MODEL, ai_result_cache(), on_result)
+        stages.append(map_stage)
+        status.update(label=f"Analysed {len(chunks)} chunks", state="complete", expanded=False)
+    
+    merge_started = time.perf_counter()
+    merged = merge_findings(results, domains)
+    unparsed = sum(result.get("findings") is None for result in results.values())
+    prompt = reduce_prompt(merged, len(chunks), unparsed)
+    stages.append(stage_stats("merge", merge_started))
+    
+    report = stream_analysis(prompt, "📑 Document Analysis")
+    timings = st.session_state.ai_timings["📑 Document Analysis"][-1]
+    stages.append({"stage": "reduce", "requests": 0 if timings.get("cached") else 1,
+                   "input_tokens": timings.get("input_tokens") or 0, "output_tokens": timings.get("output_tokens") or 0,
+                   "latency_s": timings["total_s"] or 0.0, "cached": int(bool(timings.get("cached")))})
     
-    return content
+    with st.expander("📊 Token usage and latency per stage"):
+        st.dataframe(stages, hide_index=True, use_container_width=True)
+        st.caption(f"Total {time.perf_counter() - started:.1f}s • "
+                   f"{sum(stage['input_tokens'] for stage in stages[1:]):,} input / "
+                   f"{sum(stage['output_tokens'] for stage in stages):,} output tokens")
+    return report
 
 
 def generate_assessment_report(ct_scores: Dict, ga_scores: Dict, ai_analysis: str = None) -> str:
@@ -990,11 +1062,7 @@ def main():
                     
                     current_idx = 0
                     if q_id in st.session_state.ct_responses:
-                        current_val = st.session_state.ct_responses[q_id]
-                        for idx, (opt, val) in enumerate(question["options"].items()):
-                            if val == current_val:
-                                current_idx = idx
-                                break
+                        current_idx = CT_INDEX.option_index(q_id, st.session_state.ct_responses[q_id])
                     
                     selected = st.radio(
                         f"Select response for {q_id}",
@@ -1040,11 +1108,7 @@ def main():
                     
                     current_idx = 0
                     if q_id in st.session_state.ga_responses:
-                        current_val = st.session_state.ga_responses[q_id]
-                        for idx, (opt, val) in enumerate(question["options"].items()):
-                            if val == current_val:
-                                current_idx = idx
-                                break
+                        current_idx = GA_INDEX.option_index(q_id, st.session_state.ga_responses[q_id])
                     
                     selected = st.radio(
                         f"Select response for {q_id}",
@@ -1095,55 +1159,40 @@ def main():
         if uploaded_files:
             st.markdown("### 📑 Uploaded Documents")
             
-            all_content = ""
+            # Extract in worker processes; each upload is submitted once and polled until done
+            extractions = st.session_state.doc_extractions
+            current_ids = {file.file_id for file in uploaded_files}
+            for file_id in [file_id for file_id in extractions if file_id not in current_ids]:
+                extractions.pop(file_id).cancel()
             for file in uploaded_files:
-                with st.expander(f"📄 {file.name}"):
-                    content = extract_document_content(file)
-                    all_content += f"\n\n--- Document: {file.name} ---\n{content}"
-                    st.text_area("Content Preview", content[:2000] + "..." if len(content) > 2000 else content, height=200)
+                if file.file_id not in extractions:
+                    extractions[file.file_id] = submit_extraction(file.name, file.type, file.getvalue())
+            futures = {file.file_id: extractions[file.file_id] for file in uploaded_files}
             
-            st.session_state.document_content = all_content
+            all_content = None
+            if not all(future.done() for future in futures.values()):
+                render_extraction_progress(futures)
+            else:
+                parts, documents = [], []
+                for file in uploaded_files:
+                    result = finished_result(futures[file.file_id], file.name, file.size)
+                    content = result["text"]
+                    with st.expander(f"📄 {file.name}"):
+                        if result["error"]:
+                            st.warning(result["error"])
+                        if result["truncated"]:
+                            st.caption(f"⚠️ Only the first {result['pages']} pages/sections were extracted")
+                        timing = "from cache" if result.get("cached") else f"extracted in {result['seconds']:.1f}s"
+                        st.caption(f"{result['pages']} pages/sections • {result['bytes'] / 1024:.0f} KB • {timing}")
+                        st.text_area("Content Preview", content[:2000] + "..." if len(content) > 2000 else content, height=200)
+                    parts.append(f"\n\n--- Document: {file.name} ---\n{content}")
+                    documents.append((file.name, content))
+                all_content = "".join(parts)
+                st.session_state.document_content = all_content
             
-            if st.button("🤖 Analyze Documents with AI", type="primary"):
-                with st.spinner("Analyzing documents..."):
-                    analysis_prompt = f"""
-Analyze the following AWS-related documentation and provide a comprehensive assessment for:
-
-1. **Control Tower Migration Readiness**:
-   - Current multi-account strategy
-   - Governance and guardrails maturity
-   - Security and identity posture
-   - Network architecture readiness
-   - Operational capabilities
-
-2. **Golden Architecture (Serverless) Readiness**:
-   - Serverless compute adoption
-   - API and integration patterns
-   - Data and storage architecture
-   - Security implementation
-   - Observability and DevOps maturity
-
-For each area, provide:
-- Current state assessment (1-5 scale)
-- Key gaps identified
-- Specific recommendations
-- Priority ranking (High/Medium/Low)
-
-Documentation Content:
-{all_content[:15000]}
-
-Provide structured, actionable insights for enterprise implementation.
-"""
-                    
-                    analysis = call_claude_api(analysis_prompt)
-                    st.session_state.ai_analysis = analysis
-                    
-                    st.markdown("### 🔍 AI Analysis Results")
-                    st.markdown(f"""
-                    <div class="ai-response">
-                        {analysis}
-                    </div>
-                    """, unsafe_allow_html=True)
+            if st.button("🤖 Analyze Documents with AI", type="primary", disabled=all_content is None):
+                st.markdown("### 🔍 AI Analysis Results")
+                st.session_state.ai_analysis = analyze_documents(documents)
     
     # Tab 4: AI Insights
     with tab4:
@@ -1184,7 +1233,7 @@ Provide structured, actionable insights for enterprise implementation.
         )
         
         if st.button("🚀 Generate AI Analysis", type="primary"):
-            with st.spinner("Generating comprehensive analysis..."):
+            with st.spinner("Preparing analysis request..."):
                 
                 scores_summary = f"""
 Control Tower Assessment Scores:
@@ -1338,16 +1387,14 @@ For each:
                 
                 selected_prompt = analysis_prompts.get(analysis_type, analysis_prompts["🎯 Gap Analysis & Prioritization"])
                 
-                analysis_result = call_claude_api(selected_prompt)
-                st.session_state.ai_analysis = analysis_result
-                
-                st.markdown("### 📋 Analysis Results")
-                st.markdown(f"""
-                <div class="ai-response">
-                    <h4>🤖 AI-Generated {analysis_type}</h4>
-                </div>
-                """, unsafe_allow_html=True)
-                st.markdown(analysis_result)
+            
+            st.markdown("### 📋 Analysis Results")
+            st.markdown(f"""
+            <div class="ai-response">
+                <h4>🤖 AI-Generated {analysis_type}</h4>
+            </div>
+            """, unsafe_allow_html=True)
+            st.session_state.ai_analysis = stream_analysis(selected_prompt, analysis_type)
     
     # Tab 5: Reports & Export
     with tab5:
@@ -1474,11 +1521,11 @@ For each:
                             st.progress(score / 100)
                             
                             # Show question responses
-                            domain_data = CONTROL_TOWER_DOMAINS.get(domain, {})
-                            for q in domain_data.get("questions", []):
-                                if q["id"] in st.session_state.ct_responses:
+                            for qid in CT_INDEX.domain_ids.get(domain, ()):
+                                q = CT_INDEX.questions[qid]
+                                if qid in st.session_state.ct_responses:
                                     response_val = st.session_state.ct_responses[q["id"]]
-                                    response_text = [k for k, v in q["options"].items() if v == response_val][0]
+                                    response_text = CT_INDEX.option_label(q["id"], response_val)
                                     st.markdown(f"**Q:** {q['question']}")
                                     st.markdown(f"**A:** {response_text} (Score: {response_val}/5)")
                                     st.markdown("---")
@@ -1492,15 +1539,18 @@ For each:
                             st.progress(score / 100)
                             
                             # Show question responses
-                            domain_data = GOLDEN_ARCHITECTURE_DOMAINS.get(domain, {})
-                            for q in domain_data.get("questions", []):
-                                if q["id"] in st.session_state.ga_responses:
+                            for qid in GA_INDEX.domain_ids.get(domain, ()):
+                                q = GA_INDEX.questions[qid]
+                                if qid in st.session_state.ga_responses:
                                     response_val = st.session_state.ga_responses[q["id"]]
-                                    response_text = [k for k, v in q["options"].items() if v == response_val][0]
+                                    response_text = GA_INDEX.option_label(q["id"], response_val)
                                     st.markdown(f"**Q:** {q['question']}")
                                     st.markdown(f"**A:** {response_text} (Score: {response_val}/5)")
                                     st.markdown("---")
 
 
 if __name__ == "__main__":
-    main()
+    start_metrics_server()
+    register_caches({"extraction": extraction_cache})
+    with timer("script_run", app="document_analysis"):
+        main()
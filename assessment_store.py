@@ -0,0 +1,340 @@
+"""
+AWS Enterprise Assessment Platform - Assessment Store
+Server-side persistence of responses, organisation metadata and AI analysis
+per assessment id, so a browser refresh or a different Fargate task can resume
+the same assessment. Saves are write-behind: each answer change is queued as
+one key in a WriteBehindBuffer, coalesced per assessment and applied in
+batches, so a click costs a dict update rather than a backend write.
+
+Backends: embedded SQLite (default) or DynamoDB / any DynamoDB-compatible
+endpoint such as DynamoDB Local (ASSESSMENT_STORE=dynamodb).
+
+Change keys: "ct:<question id>" / "ga:<question id>" (score, None clears the
+answer), "metadata" (dict) and "ai_analysis" (str or None).
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from write_behind import WriteBehindBuffer
+
+SECTIONS = {"ct": "ct_responses", "ga": "ga_responses"}
+
+
+def empty_record() -> dict:
+    return {"metadata": {}, "ct_responses": {}, "ga_responses": {}, "ai_analysis": None, "updated_at": None}
+
+
+def apply_changes_to_record(record: dict, changes: dict) -> dict:
+    """Overlay change keys onto a record in place"""
+    for key, value in changes.items():
+        section, _, qid = key.partition(":")
+        if qid and section in SECTIONS:
+            if value is None:
+                record[SECTIONS[section]].pop(qid, None)
+            else:
+                record[SECTIONS[section]][qid] = value
+        else:
+            record[key] = value
+    return record
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class AssessmentStore:
+    """Backend interface: whole-record reads and batched per-key writes
+
+    A record is {"metadata": dict, "ct_responses": {qid: int}, "ga_responses": {qid: int},
+    "ai_analysis": str | None, "updated_at": float}.
+    """
+
+    def load(self, assessment_id: str):
+        """Return the stored record, or None for an unknown id"""
+        raise NotImplementedError
+
+    def load_all(self) -> dict:
+        """Every stored record as {assessment_id: record}, for portfolio analytics and benchmarks;
+        ai_analysis is not read (always None) since no aggregate uses it"""
+        raise NotImplementedError
+
+    def apply_changes(self, batch: dict):
+        """Apply {assessment_id: ChangeSet}, atomically per assessment at least"""
+        raise NotImplementedError
+
+    def delete(self, assessment_id: str):
+        raise NotImplementedError
+
+
+class SQLiteAssessmentStore(AssessmentStore):
+    """Embedded store; one row per assessment plus one row per answered question"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS assessments ("
+            " assessment_id TEXT PRIMARY KEY, metadata TEXT NOT NULL DEFAULT '{}',"
+            " ai_analysis TEXT, updated_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " assessment_id TEXT NOT NULL, section TEXT NOT NULL, question_id TEXT NOT NULL,"
+            " score INTEGER NOT NULL, PRIMARY KEY (assessment_id, section, question_id));"
+        )
+
+    def load(self, assessment_id: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata, ai_analysis, updated_at FROM assessments WHERE assessment_id = ?",
+                (assessment_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            answers = self._conn.execute(
+                "SELECT section, question_id, score FROM responses WHERE assessment_id = ?", (assessment_id,)
+            ).fetchall()
+        record = empty_record()
+        record.update(metadata=json.loads(row[0]), ai_analysis=row[1], updated_at=row[2])
+        for section, qid, score in answers:
+            record[SECTIONS[section]][qid] = score
+        return record
+
+    def load_all(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT assessment_id, metadata, updated_at FROM assessments").fetchall()
+            answers = self._conn.execute("SELECT assessment_id, section, question_id, score FROM responses").fetchall()
+        records = {}
+        for assessment_id, metadata, updated_at in rows:
+            record = records[assessment_id] = empty_record()
+            record.update(metadata=json.loads(metadata), updated_at=updated_at)
+        for assessment_id, section, qid, score in answers:
+            if assessment_id in records:
+                records[assessment_id][SECTIONS[section]][qid] = score
+        return records
+
+    def apply_changes(self, batch: dict):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for assessment_id, change_set in batch.items():
+                    self._conn.execute(
+                        "INSERT INTO assessments (assessment_id, updated_at) VALUES (?, ?)"
+                        " ON CONFLICT (assessment_id) DO UPDATE SET updated_at = excluded.updated_at",
+                        (assessment_id, now),
+                    )
+                    upserts, deletes = [], []
+                    for key, value in change_set.changes.items():
+                        section, _, qid = key.partition(":")
+                        if qid and section in SECTIONS:
+                            if value is None:
+                                deletes.append((assessment_id, section, qid))
+                            else:
+                                upserts.append((assessment_id, section, qid, value))
+                        elif key == "metadata":
+                            self._conn.execute("UPDATE assessments SET metadata = ? WHERE assessment_id = ?",
+                                               (json.dumps(value), assessment_id))
+                        elif key == "ai_analysis":
+                            self._conn.execute("UPDATE assessments SET ai_analysis = ? WHERE assessment_id = ?",
+                                               (value, assessment_id))
+                    self._conn.executemany(
+                        "DELETE FROM responses WHERE assessment_id = ? AND section = ? AND question_id = ?", deletes)
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO responses (assessment_id, section, question_id, score)"
+                        " VALUES (?, ?, ?, ?)", upserts)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, assessment_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE assessment_id = ?", (assessment_id,))
+            self._conn.execute("DELETE FROM assessments WHERE assessment_id = ?", (assessment_id,))
+
+
+class DynamoDBAssessmentStore(AssessmentStore):
+    """One item per assessment keyed on assessment_id, one top-level "ct:<qid>" attribute per
+    answer so a change is a single SET/REMOVE; works against DynamoDB Local via endpoint_url"""
+
+    def __init__(self, table_name: str, endpoint_url: str = None, region_name: str = None):
+        try:
+            import boto3
+        except ImportError:
+            raise ImportError("ASSESSMENT_STORE=dynamodb requires boto3. Run: pip install boto3")
+        resource = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name=region_name)
+        self.table = resource.Table(table_name)
+
+    def load(self, assessment_id: str):
+        item = self.table.get_item(Key={"assessment_id": assessment_id}, ConsistentRead=True).get("Item")
+        if item is None:
+            return None
+        return self._record(item)
+
+    @staticmethod
+    def _aggregate_projection() -> dict:
+        """scan kwargs reading only what aggregates use: id, metadata, updated_at and the answers"""
+        from assessment_core import CT_QUESTIONS, GA_QUESTIONS
+        attributes = ["assessment_id", "metadata", "updated_at"] + [
+            f"{section}:{q['id']}" for section, catalog in (("ct", CT_QUESTIONS), ("ga", GA_QUESTIONS))
+            for ddata in catalog.values() for q in ddata["questions"]
+        ]
+        names = {f"#a{i}": name for i, name in enumerate(attributes)}
+        return {"ProjectionExpression": ", ".join(names), "ExpressionAttributeNames": names}
+
+    def load_all(self) -> dict:
+        records, kwargs = {}, self._aggregate_projection()
+        while True:
+            page = self.table.scan(**kwargs)
+            for item in page.get("Items", []):
+                records[item["assessment_id"]] = self._record(item)
+            if "LastEvaluatedKey" not in page:
+                return records
+            kwargs["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+
+    @staticmethod
+    def _record(item: dict) -> dict:
+        record = empty_record()
+        record.update(
+            metadata=dict(item.get("metadata", {})),
+            ai_analysis=item.get("ai_analysis"),
+            updated_at=float(item["updated_at"]) if "updated_at" in item else None,
+        )
+        for name, value in item.items():
+            section, _, qid = name.partition(":")
+            if qid and section in SECTIONS:
+                record[SECTIONS[section]][qid] = int(value)  # DynamoDB returns numbers as Decimal
+        return record
+
+    def apply_changes(self, batch: dict):
+        from decimal import Decimal
+        for assessment_id, change_set in batch.items():
+            names = {"#updated_at": "updated_at"}
+            values = {":updated_at": Decimal(str(time.time()))}
+            sets, removes = ["#updated_at = :updated_at"], []
+            for i, (key, value) in enumerate(change_set.changes.items()):
+                names[f"#k{i}"] = key
+                if value is None:
+                    removes.append(f"#k{i}")
+                else:
+                    values[f":v{i}"] = value
+                    sets.append(f"#k{i} = :v{i}")
+            expression = "SET " + ", ".join(sets)
+            if removes:
+                expression += " REMOVE " + ", ".join(removes)
+            self.table.update_item(
+                Key={"assessment_id": assessment_id},
+                UpdateExpression=expression,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+            )
+
+    def delete(self, assessment_id: str):
+        self.table.delete_item(Key={"assessment_id": assessment_id})
+
+
+# =============================================================================
+# WRITE-BEHIND AUTOSAVE
+# =============================================================================
+
+_store = None
+_buffer = None
+_store_lock = threading.Lock()
+_flush_listeners = []
+
+
+def add_flush_listener(listener):
+    """Call listener(assessment_id, record) with the stored record after each successful flush
+    that changed the assessment's responses or metadata"""
+    _flush_listeners.append(listener)
+
+
+def _apply_batch(batch: dict):
+    _store.apply_changes(batch)
+    if not _flush_listeners:
+        return
+    for assessment_id, change_set in batch.items():
+        # Listeners aggregate responses and metadata; an AI-analysis-only save needs no re-read
+        if all(key == "ai_analysis" for key in change_set.changes):
+            continue
+        try:
+            record = _store.load(assessment_id)
+            for listener in _flush_listeners:
+                listener(assessment_id, record)
+        except Exception:
+            pass  # Listeners are derived views; they must never fail (and so retry) the write
+
+
+def get_assessment_store():
+    """(store, buffer) configured from ASSESSMENT_STORE; (None, None) when persistence is off"""
+    global _store, _buffer
+    with _store_lock:
+        if _store is None:
+            kind = os.environ.get("ASSESSMENT_STORE", "sqlite").lower()
+            if kind in ("none", "off", ""):
+                return None, None
+            if kind == "dynamodb":
+                _store = DynamoDBAssessmentStore(
+                    os.environ.get("DYNAMODB_TABLE", "assessment-platform-assessments"),
+                    endpoint_url=os.environ.get("DYNAMODB_ENDPOINT_URL") or None,
+                    region_name=os.environ.get("AWS_REGION") or None,
+                )
+            else:
+                _store = SQLiteAssessmentStore(os.environ.get("ASSESSMENT_DB_PATH") or os.path.join(
+                    tempfile.gettempdir(), "aws-assessment", "assessments.sqlite3"))
+            _buffer = WriteBehindBuffer(
+                _apply_batch,
+                flush_interval=float(os.environ.get("AUTOSAVE_INTERVAL_SECONDS", "2")),
+                max_pending=int(os.environ.get("AUTOSAVE_MAX_PENDING", "500")),
+            )
+        return _store, _buffer
+
+
+def load_assessment(assessment_id: str):
+    """Stored record overlaid with changes still buffered on this task, or None if unknown"""
+    store, buffer = get_assessment_store()
+    if store is None:
+        return None
+    record = store.load(assessment_id)
+    pending = buffer.pending(assessment_id)
+    if record is None and not pending:
+        return None
+    return apply_changes_to_record(record or empty_record(), pending)
+
+
+def load_all_assessments() -> dict:
+    """Every stored assessment as {assessment_id: record}, after flushing this task's pending changes"""
+    store, buffer = get_assessment_store()
+    if store is None:
+        return {}
+    buffer.flush()
+    return store.load_all()
+
+
+def record_change(assessment_id: str, key: str, value):
+    """Queue one change for write-behind; returns the buffer's last error (None when healthy)"""
+    store, buffer = get_assessment_store()
+    if buffer is None:
+        return None
+    buffer.record(assessment_id, key, value)
+    return buffer.last_error
+
+
+def autosave_session(assessment_id: str):
+    """Handle to keep in the UI session; when the session is garbage collected its changes flush"""
+    store, buffer = get_assessment_store()
+    return buffer.session(assessment_id) if buffer is not None else None
+
+
+def autosave_metrics():
+    """Flush latency / batch size metrics of the write-behind buffer, or None when persistence is off"""
+    store, buffer = get_assessment_store()
+    return buffer.metrics() if buffer is not None else None
@@ -0,0 +1,201 @@
+"""
+AWS Enterprise Assessment Platform - Headless Batch Scoring
+Re-scores saved "Data Export" JSON files (a directory of *.json files or a
+single JSONL file) without Streamlit and writes scores, maturity levels and
+gaps as CSV or Parquet.
+
+Usage:
+    python batch_assess.py exports/ -o scores.csv --gaps-output gaps.csv
+    python batch_assess.py exports.jsonl -o scores.parquet --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from assessment_core import (
+    CT_QUESTIONS, GA_QUESTIONS, calc_scores, calc_combined, get_maturity, find_gaps
+)
+
+SCORE_FIELDS = [
+    "source", "organization", "assessor", "industry",
+    "ct_overall", "ct_maturity", "ct_answered",
+    "ga_overall", "ga_maturity", "ga_answered",
+    "combined", "combined_maturity",
+    "critical_gaps", "high_gaps", "medium_gaps",
+] + [f"CT: {d}" for d in CT_QUESTIONS] + [f"GA: {d}" for d in GA_QUESTIONS]
+
+GAP_FIELDS = ["source", "assessment", "id", "domain", "risk", "score", "question"]
+
+
+def iter_exports(path: Path):
+    """Yield (source, payload) pairs; payload is None when the worker should read the file itself"""
+    if path.is_dir():
+        for file_path in sorted(path.glob("*.json")):
+            yield str(file_path), None
+    elif path.suffix == ".jsonl":
+        with open(path, encoding="utf-8") as fh:
+            for line_no, line in enumerate(fh, 1):
+                if line.strip():
+                    yield f"{path}:{line_no}", line
+    else:
+        yield str(path), None
+
+
+def _responses(section: dict) -> dict:
+    """Normalise exported responses to {question_id: int}"""
+    return {qid: int(score) for qid, score in (section or {}).get("responses", {}).items()}
+
+
+def score_export(item: tuple) -> dict:
+    """Score one exported assessment - runs inside a worker process"""
+    source, payload = item
+    try:
+        if payload is None:
+            with open(source, encoding="utf-8") as fh:
+                payload = fh.read()
+        export = json.loads(payload)
+        metadata = export.get("metadata", {})
+        ct_responses = _responses(export.get("control_tower"))
+        ga_responses = _responses(export.get("golden_architecture"))
+    except (OSError, ValueError, AttributeError, TypeError) as e:
+        return {"source": source, "error": str(e)}
+
+    ct_scores = calc_scores(ct_responses, CT_QUESTIONS)
+    ga_scores = calc_scores(ga_responses, GA_QUESTIONS)
+    combined = calc_combined(ct_scores, ga_scores)
+    ct_gaps = find_gaps(ct_responses, CT_QUESTIONS)
+    ga_gaps = find_gaps(ga_responses, GA_QUESTIONS)
+    all_gaps = ct_gaps + ga_gaps
+
+    row = {
+        "source": source,
+        "organization": metadata.get("organization", ""),
+        "assessor": metadata.get("assessor", ""),
+        "industry": metadata.get("industry", ""),
+        "ct_overall": round(ct_scores["overall"], 2),
+        "ct_maturity": get_maturity(ct_scores["overall"])[0],
+        "ct_answered": ct_scores["total_answered"],
+        "ga_overall": round(ga_scores["overall"], 2),
+        "ga_maturity": get_maturity(ga_scores["overall"])[0],
+        "ga_answered": ga_scores["total_answered"],
+        "combined": round(combined, 2),
+        "combined_maturity": get_maturity(combined)[0],
+        "critical_gaps": len([g for g in all_gaps if g["risk"] == "critical"]),
+        "high_gaps": len([g for g in all_gaps if g["risk"] == "high"]),
+        "medium_gaps": len([g for g in all_gaps if g["risk"] == "medium"]),
+    }
+    for prefix, scores in (("CT", ct_scores), ("GA", ga_scores)):
+        for dname, data in scores["domains"].items():
+            row[f"{prefix}: {dname}"] = round(data["score"], 2) if data["answered"] > 0 else None
+
+    gaps = [
+        {"source": source, "assessment": label, "id": g["id"], "domain": g["domain"],
+         "risk": g["risk"], "score": g["score"], "question": g["question"]}
+        for label, gap_list in (("control_tower", ct_gaps), ("golden_architecture", ga_gaps))
+        for g in gap_list
+    ]
+    return {"source": source, "row": row, "gaps": gaps}
+
+
+def run_pool(items, workers: int, window: int = 64):
+    """Map score_export over items with a bounded number of in-flight tasks, preserving order"""
+    if workers <= 1:
+        yield from map(score_export, items)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(score_export, item))
+            if len(pending) >= workers * window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class TableWriter:
+    """Row sink that streams CSV or buffers rows for a single Parquet write"""
+
+    def __init__(self, path: Path, fields: list, fmt: str):
+        self.path = path
+        self.fields = fields
+        self.fmt = fmt
+        self.rows = []
+        self._fh = None
+        self._csv = None
+        if fmt == "csv":
+            self._fh = open(path, "w", newline="", encoding="utf-8")
+            self._csv = csv.DictWriter(self._fh, fieldnames=fields)
+            self._csv.writeheader()
+
+    def write(self, row: dict):
+        if self._csv:
+            self._csv.writerow(row)
+        else:
+            self.rows.append(row)
+
+    def close(self):
+        if self._fh:
+            self._fh.close()
+            return
+        try:
+            import pandas as pd
+        except ImportError:
+            raise SystemExit("Parquet output requires pandas and pyarrow. Run: pip install pandas pyarrow")
+        pd.DataFrame(self.rows, columns=self.fields).to_parquet(self.path, index=False)
+
+
+def detect_format(path: Path, requested: str) -> str:
+    if requested:
+        return requested
+    return "parquet" if path.suffix == ".parquet" else "csv"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Score saved assessment exports without the Streamlit UI")
+    parser.add_argument("input", type=Path, help="Directory of *.json exports, a .jsonl file or a single .json export")
+    parser.add_argument("-o", "--output", type=Path, default=Path("assessment_scores.csv"),
+                        help="Scores output file (.csv or .parquet)")
+    parser.add_argument("--gaps-output", type=Path, help="Optional gaps output file (.csv or .parquet)")
+    parser.add_argument("--format", choices=["csv", "parquet"], help="Override format detection from the file extension")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (1 = score in-process)")
+    args = parser.parse_args(argv)
+
+    if not args.input.exists():
+        parser.error(f"{args.input} does not exist")
+
+    scores_out = TableWriter(args.output, SCORE_FIELDS, detect_format(args.output, args.format))
+    gaps_out = None
+    if args.gaps_output:
+        gaps_out = TableWriter(args.gaps_output, GAP_FIELDS, detect_format(args.gaps_output, args.format))
+
+    scored, failed = 0, 0
+    try:
+        for result in run_pool(iter_exports(args.input), args.workers):
+            if "error" in result:
+                failed += 1
+                print(f"⚠️ Skipping {result['source']}: {result['error']}", file=sys.stderr)
+                continue
+            scored += 1
+            scores_out.write(result["row"])
+            if gaps_out:
+                for gap in result["gaps"]:
+                    gaps_out.write(gap)
+    finally:
+        scores_out.close()
+        if gaps_out:
+            gaps_out.close()
+
+    print(f"Scored {scored} assessment(s), skipped {failed} -> {args.output}", file=sys.stderr)
+    return 1 if failed and not scored else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
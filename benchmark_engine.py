@@ -0,0 +1,275 @@
+"""
+Benchmark Engine
+Industry benchmarks computed from stored assessments instead of the static
+BENCHMARKS table, in the same {industry: {"name", "avg", "top"}} shape.
+
+Scores are bounded to 0-100, so each (industry, calendar month) keeps one
+fixed-bin histogram sketch per metric: sketch memory does not grow with the
+number of assessments, counts are exact and means and quantiles are within
+half a bin. The last BENCHMARK_WINDOW_MONTHS months are merged for a rolling
+view. An assessment counts once BENCHMARK_MIN_COMPLETION of its questions are
+answered; a re-saved assessment replaces its previous contribution, for which
+only its month, industry and per-metric bin indices (int16, ~50 bytes) are
+kept per assessment. Industries with fewer than BENCHMARK_MIN_SAMPLES
+assessments keep their static values.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+
+from assessment_core import BENCHMARKS, CT_ENGINE, GA_ENGINE
+from scoring_engine import combined_scores
+
+logger = logging.getLogger(__name__)
+
+SKETCH_BINS = 200  # 0.5 score points per bin
+SECTIONS = {"ct": (CT_ENGINE, "ct_responses"), "ga": (GA_ENGINE, "ga_responses")}
+METRICS = ["ct", "ga", "combined"] + [f"{section}:{d}" for section, (engine, _) in SECTIONS.items()
+                                      for d in engine.domain_names]
+TOTAL_QUESTIONS = sum(engine.total_questions for engine, _ in SECTIONS.values())
+
+
+def bin_indices(values: np.ndarray, bins: int = SKETCH_BINS) -> np.ndarray:
+    """Sketch bin of each score as int16; -1 where NaN marks "not assessed" """
+    observed = ~np.isnan(values)
+    indices = np.full(values.shape, -1, dtype=np.int16)
+    indices[observed] = np.clip((values[observed] * bins / 100).astype(np.intp), 0, bins - 1)
+    return indices
+
+
+class HistogramSketch:
+    """Fixed-bin histograms over [0, 100] for several metrics; add, remove and merge are O(bins)"""
+
+    def __init__(self, metrics: int, bins: int = SKETCH_BINS):
+        self.bins = bins
+        self.counts = np.zeros((metrics, bins), dtype=np.int64)
+        self.midpoints = (np.arange(bins) + 0.5) * 100 / bins
+
+    def add(self, indices: np.ndarray, sign: int = 1):
+        """Add (sign=-1: remove) an (n x metrics) block of bin_indices; -1 entries are skipped"""
+        indices = np.atleast_2d(indices)
+        rows, cols = np.nonzero(indices >= 0)
+        np.add.at(self.counts, (cols, indices[rows, cols]), sign)
+
+    def merge(self, other: "HistogramSketch"):
+        self.counts += other.counts
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self.counts.sum(axis=1)
+
+    def means(self) -> np.ndarray:
+        samples = self.samples
+        return np.divide(self.counts @ self.midpoints, samples, out=np.full(len(samples), np.nan), where=samples > 0)
+
+    def quantiles(self, qs) -> np.ndarray:
+        """(len(qs) x metrics) bin-midpoint quantiles; NaN for metrics without samples"""
+        cumulative = self.counts.cumsum(axis=1)
+        samples = cumulative[:, -1]
+        result = np.full((len(qs), len(samples)), np.nan)
+        for i, q in enumerate(qs):
+            for metric in np.flatnonzero(samples):
+                rank = max(1, int(np.ceil(q * samples[metric])))
+                result[i, metric] = (np.searchsorted(cumulative[metric], rank) + 0.5) * 100 / self.bins
+        return result
+
+
+def month_of(timestamp: float) -> int:
+    """Months since year 0 for a Unix timestamp (UTC)"""
+    t = time.gmtime(timestamp)
+    return t.tm_year * 12 + t.tm_mon - 1
+
+
+def score_records(records: list) -> tuple:
+    """(metric values matrix with NaN for unassessed, answered share) for store records"""
+    overall, domains, answered = [], [], 0
+    for engine, field in SECTIONS.values():
+        scored = engine.score_matrix(engine.to_matrix([record.get(field) or {} for record in records]))
+        overall.append(scored["overall"])
+        domains.append(np.where(scored["answered"] > 0, scored["domain_scores"], np.nan))
+        answered = answered + scored["total_answered"]
+    combined, assessed = combined_scores(*overall)
+    # Scores start at 20 once a question is answered, so 0 means "not assessed"
+    ct, ga = (np.where(scores > 0, scores, np.nan) for scores in overall)
+    matrix = np.column_stack([ct, ga, np.where(assessed, combined, np.nan), *domains])
+    return matrix, answered / TOTAL_QUESTIONS
+
+
+class BenchmarkEngine:
+    """Rolling per-industry score sketches fed by completed assessments"""
+
+    def __init__(self, window_months: int = 12, min_completion: float = 0.8, min_samples: int = 5,
+                 static: dict = BENCHMARKS, clock=time.time):
+        self.window_months = window_months
+        self.min_completion = min_completion
+        self.min_samples = min_samples
+        self.static = static
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._buckets = {}  # {(month, industry): HistogramSketch}
+        self._contributions = {}  # {assessment_id: (month, industry, bin indices)} for replacement
+        self._snapshot = None
+        self.built_at = None
+
+    def _bucket(self, month: int, industry: str) -> HistogramSketch:
+        sketch = self._buckets.get((month, industry))
+        if sketch is None:
+            sketch = self._buckets[(month, industry)] = HistogramSketch(len(METRICS))
+        return sketch
+
+    def _retract(self, assessment_id: str):
+        previous = self._contributions.pop(assessment_id, None)
+        if previous is not None:
+            month, industry, indices = previous
+            sketch = self._buckets.get((month, industry))
+            if sketch is not None:
+                sketch.add(indices, sign=-1)
+
+    def _expire(self):
+        oldest = month_of(self.clock()) - self.window_months + 1
+        for key in [key for key in self._buckets if key[0] < oldest]:
+            del self._buckets[key]
+        for assessment_id in [a for a, (month, _, _) in self._contributions.items() if month < oldest]:
+            del self._contributions[assessment_id]
+
+    def _observe(self, assessment_id: str, record: dict, indices: np.ndarray, completion: float):
+        self._retract(assessment_id)
+        industry = (record.get("metadata") or {}).get("industry")
+        if industry not in self.static or completion < self.min_completion:
+            return
+        month = month_of(record.get("updated_at") or self.clock())
+        if month < month_of(self.clock()) - self.window_months + 1:
+            return
+        self._bucket(month, industry).add(indices)
+        self._contributions[assessment_id] = (month, industry, indices)
+
+    def rebuild(self, records: dict):
+        """Replace all sketches from {assessment_id: record}, scoring them in one vectorized pass"""
+        ids = list(records)
+        matrix, completion = score_records([records[a] for a in ids]) if ids else (None, None)
+        indices = bin_indices(matrix) if ids else None
+        with self._lock:
+            self._reset()
+            for row, assessment_id in enumerate(ids):
+                self._observe(assessment_id, records[assessment_id], indices[row], completion[row])
+            self.built_at = self.clock()
+
+    def observe(self, assessment_id: str, record: dict):
+        """Incremental update after an assessment was saved (record None: it was deleted)"""
+        if record is None:
+            with self._lock:
+                self._retract(assessment_id)
+                self._snapshot = None
+            return
+        matrix, completion = score_records([record])
+        with self._lock:
+            self._observe(assessment_id, record, bin_indices(matrix[0]), completion[0])
+            self._snapshot = None
+
+    def _merged(self) -> dict:
+        """{industry: HistogramSketch} over the rolling window"""
+        self._expire()
+        merged = {}
+        for (_, industry), sketch in self._buckets.items():
+            if industry not in merged:
+                merged[industry] = HistogramSketch(len(METRICS))
+            merged[industry].merge(sketch)
+        return merged
+
+    def snapshot(self) -> dict:
+        """{"benchmarks": BENCHMARKS-shaped dict, "domains": per-industry domain percentiles}"""
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            merged = self._merged()
+            benchmarks, domains = {}, {}
+            for industry, static in self.static.items():
+                sketch = merged.get(industry)
+                samples = int(sketch.samples[2]) if sketch is not None else 0
+                entry = dict(static, samples=samples, source="static")
+                if samples >= self.min_samples:
+                    top_quartile = sketch.quantiles([0.75])[0, 2]
+                    entry.update(avg=round(float(sketch.means()[2])), top=round(float(top_quartile)),
+                                 source="assessments")
+                benchmarks[industry] = entry
+                domains[industry] = self._domain_percentiles(sketch)
+            self._snapshot = {"benchmarks": benchmarks, "domains": domains}
+            return self._snapshot
+
+    def _domain_percentiles(self, sketch) -> dict:
+        result = {section: {} for section in SECTIONS}
+        if sketch is None:
+            return result
+        quantiles = sketch.quantiles([0.25, 0.5, 0.75, 0.9])
+        samples = sketch.samples
+        for col, metric in enumerate(METRICS):
+            section, _, dname = metric.partition(":")
+            if dname and samples[col] >= self.min_samples:
+                result[section][dname] = {
+                    "samples": int(samples[col]),
+                    **{f"p{p}": float(quantiles[i, col]) for i, p in enumerate((25, 50, 75, 90))},
+                }
+        return result
+
+    def benchmarks(self) -> dict:
+        """Drop-in replacement for BENCHMARKS (extra keys: samples, source)"""
+        return self.snapshot()["benchmarks"]
+
+
+_engine = None
+_engine_lock = threading.Lock()
+_rebuilding = False
+_retry_at = 0.0  # No store reload before this time after a failed one
+_failures = 0
+
+
+def _rebuild_from_store(engine: BenchmarkEngine, refresh: float):
+    """Background reload: readers keep the previous snapshot until rebuild() swaps it in"""
+    global _rebuilding, _retry_at, _failures
+    from assessment_store import load_all_assessments
+    try:
+        engine.rebuild(load_all_assessments())
+        failed = False
+    except Exception:
+        logger.exception("Benchmark rebuild from the assessment store failed")
+        failed = True
+    with _engine_lock:
+        _rebuilding = False
+        if failed:
+            # Exponential backoff (30s, 60s, ...) capped at the refresh interval
+            _failures += 1
+            _retry_at = time.time() + min(refresh, 30 * 2 ** (_failures - 1))
+        else:
+            _failures = 0
+
+
+def get_benchmark_engine() -> BenchmarkEngine:
+    """Process-wide engine, built from the assessment store and kept current by this task's
+    autosave flushes; reloaded every BENCHMARK_REFRESH_SECONDS to pick up saves made by other
+    tasks. Reloads run in a background thread, so callers never wait on the store: until the
+    first one finishes, benchmarks are the static values."""
+    global _engine, _rebuilding
+    from assessment_store import add_flush_listener
+    refresh = float(os.environ.get("BENCHMARK_REFRESH_SECONDS", "900"))
+    with _engine_lock:
+        if _engine is None:
+            _engine = BenchmarkEngine(
+                window_months=int(os.environ.get("BENCHMARK_WINDOW_MONTHS", "12")),
+                min_completion=float(os.environ.get("BENCHMARK_MIN_COMPLETION", "0.8")),
+                min_samples=int(os.environ.get("BENCHMARK_MIN_SAMPLES", "5")),
+            )
+            add_flush_listener(_engine.observe)
+        now = time.time()
+        stale = _engine.built_at is None or now - _engine.built_at > refresh
+        if stale and not _rebuilding and now >= _retry_at:
+            _rebuilding = True
+            threading.Thread(target=_rebuild_from_store, args=(_engine, refresh),
+                             name="benchmark-rebuild", daemon=True).start()
+    return _engine
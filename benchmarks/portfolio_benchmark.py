@@ -0,0 +1,59 @@
+"""
+Portfolio Benchmark
+Times aggregate_portfolio over synthetic assessment records (random answers
+for a random share of questions) at several portfolio sizes.
+
+Usage:
+    python benchmarks/portfolio_benchmark.py
+    python benchmarks/portfolio_benchmark.py --sizes 1000 10000 --runs 5
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from assessment_core import BENCHMARKS, CT_QUESTIONS, GA_QUESTIONS  # noqa: E402
+from portfolio import aggregate_portfolio  # noqa: E402
+
+
+def synthetic_records(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    catalogs = {
+        "ct_responses": [q["id"] for d in CT_QUESTIONS.values() for q in d["questions"]],
+        "ga_responses": [q["id"] for d in GA_QUESTIONS.values() for q in d["questions"]],
+    }
+    records = []
+    for _ in range(count):
+        record = {"metadata": {"industry": rng.choice(list(BENCHMARKS))}}
+        for field, ids in catalogs.items():
+            coverage = rng.random()
+            record[field] = {qid: rng.randint(1, 5) for qid in ids if rng.random() < coverage}
+        records.append(record)
+    return records
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time portfolio aggregation over synthetic assessments")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000], help="Portfolio sizes to measure")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per size (median reported)")
+    args = parser.parse_args(argv)
+
+    print(f"{'assessments':>12} {'aggregate (s)':>14}")
+    for size in args.sizes:
+        records = synthetic_records(size)
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            aggregate_portfolio(records)
+            timings.append(time.perf_counter() - start)
+        print(f"{size:>12} {statistics.median(timings):>14.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
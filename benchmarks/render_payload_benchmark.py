@@ -0,0 +1,94 @@
+"""
+Render Payload Benchmark
+Counts the elements one rerun of streamlit_app.py sends to the browser
+and their serialized size, per question view, with one tab open, via Streamlit's AppTest
+harness in a fresh interpreter. Size is the sum of each element's protobuf
+ByteSize (ForwardMsg envelopes excluded), which tracks the websocket payload.
+Pass --baseline-ref to measure a git revision side by side.
+
+Usage:
+    python benchmarks/render_payload_benchmark.py
+    python benchmarks/render_payload_benchmark.py --baseline-ref HEAD~1 --answered 40 --json payload.json
+    python benchmarks/render_payload_benchmark.py --tab "📊 Executive Dashboard"
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from startup_benchmark import APP_FILE, REPO_ROOT, export_ref
+
+VIEWS = ("domain", "all")
+
+PAYLOAD_PROBE = """
+import os, sys, json, logging
+logging.disable(logging.WARNING)
+os.environ["ASSESSMENT_STORE"] = "none"
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+from assessment_core import CT_QUESTIONS, GA_QUESTIONS
+
+def walk(node):
+    children = getattr(node, "children", None)
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if hasattr(proto, "ByteSize") else 0
+    if children is None:
+        return 1, size, int(node.type == "selectbox")
+    count, widgets = 0, 0
+    for child in children.values():
+        c, s, w = walk(child)
+        count, size, widgets = count + c, size + s, widgets + w
+    return count, size, widgets
+
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state["active_tab"] = {tab!r}
+for kind in ("ct", "ga"):
+    at.session_state[kind + "_question_view"] = {view!r}
+at.run()
+# Measure a rerun, as after answering a question; replaced responses dicts are re-adopted
+for kind, catalog in (("ct", CT_QUESTIONS), ("ga", GA_QUESTIONS)):
+    ids = [q["id"] for d in catalog.values() for q in d["questions"]]
+    at.session_state[kind + "_responses"] = {{qid: 3 for qid in ids[:{answered}]}}
+at.run()
+if at.exception:
+    raise SystemExit("App raised: " + str(at.exception[0].value))
+count, size, selectboxes = walk(at._tree)
+print(json.dumps({{"elements": count, "bytes": size, "selectboxes": selectboxes}}))
+"""
+
+
+def measure(root: Path, view: str, answered: int, tab: str) -> dict:
+    code = PAYLOAD_PROBE.format(root=str(root), app=str(root / APP_FILE), view=view, answered=answered, tab=tab)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure elements and payload bytes of one app rerun")
+    parser.add_argument("--answered", type=int, default=0, help="Pre-answered questions per catalog")
+    parser.add_argument("--tab", default="🎛️ Control Tower", help="Section open in the app (older revisions render all tabs)")
+    parser.add_argument("--baseline-ref", help="Git revision to measure for comparison, e.g. HEAD~1")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = {f"current/{view}": measure(REPO_ROOT, view, args.answered, args.tab) for view in VIEWS}
+    if args.baseline_ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            export_ref(args.baseline_ref, Path(tmp))
+            # Revisions without a question view ignore the setting and render every domain
+            results[f"baseline ({args.baseline_ref})"] = measure(Path(tmp), "all", args.answered, args.tab)
+
+    print(f"{'':<24} {'elements':>9} {'selectboxes':>12} {'payload (KiB)':>14}")
+    for label, r in results.items():
+        print(f"{label:<24} {r['elements']:>9} {r['selectboxes']:>12} {r['bytes'] / 1024:>14.1f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
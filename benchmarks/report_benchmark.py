@@ -0,0 +1,186 @@
+"""
+Report Benchmark
+Times each stage of scoring and reporting for seeded synthetic assessments:
+calc_scores, find_gaps, every dashboard plotly builder and report chart
+(uncached), the PDF report (cold caches, then with cached sections) and the
+markdown summary. Each stage is also run once under tracemalloc for its peak
+Python heap allocation. Results can be written as JSON and compared with an
+earlier run.
+
+Scenarios: empty (nothing answered), sparse (~20% answered), full (every
+question answered) and all_gaps (every question answered 1 or 2).
+
+Usage:
+    python benchmarks/report_benchmark.py
+    python benchmarks/report_benchmark.py --scenarios full all_gaps --runs 5 --json report.json
+    python benchmarks/report_benchmark.py --compare report.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+logging.disable(logging.WARNING)  # Bare-mode Streamlit warnings from importing the app
+
+import streamlit_app as app  # noqa: E402
+from assessment_core import (  # noqa: E402
+    BENCHMARKS, CT_QUESTIONS, GA_QUESTIONS, calc_combined, calc_scores, find_gaps
+)
+from content_cache import chart_cache, section_cache  # noqa: E402
+from report_charts import plan_report_charts  # noqa: E402
+from startup_benchmark import REPO_ROOT  # noqa: E402
+
+SCENARIOS = {
+    "empty": lambda rng: None,
+    "sparse": lambda rng: rng.randint(1, 5) if rng.random() < 0.2 else None,
+    "full": lambda rng: rng.randint(1, 5),
+    "all_gaps": lambda rng: rng.randint(1, 2),
+}
+INDUSTRY = "technology"
+
+
+def synthetic_responses(catalog: dict, scenario: str, seed: int) -> dict:
+    rng = random.Random(f"{seed}:{scenario}")
+    answer = SCENARIOS[scenario]
+    responses = {}
+    for ddata in catalog.values():
+        for q in ddata["questions"]:
+            value = answer(rng)
+            if value is not None:
+                responses[q["id"]] = value
+    return responses
+
+
+def stages(ct: dict, ga: dict) -> dict:
+    """{stage name: zero-argument callable} for one assessment"""
+    ct_scores, ga_scores = calc_scores(ct, CT_QUESTIONS), calc_scores(ga, GA_QUESTIONS)
+    combined = calc_combined(ct_scores, ga_scores)
+    ct_gaps, ga_gaps = find_gaps(ct, CT_QUESTIONS), find_gaps(ga, GA_QUESTIONS)
+    bench = BENCHMARKS[INDUSTRY]
+    uncached = lambda func: getattr(func, "uncached", func)  # noqa: E731
+
+    run = {
+        "calc_scores": lambda: (calc_scores(ct, CT_QUESTIONS), calc_scores(ga, GA_QUESTIONS)),
+        "find_gaps": lambda: (find_gaps(ct, CT_QUESTIONS), find_gaps(ga, GA_QUESTIONS)),
+    }
+    figures = {
+        "score_gauges": (app.create_ui_score_gauges,
+                         (ct_scores["overall"], ga_scores["overall"], combined, bench["avg"], bench["name"])),
+        "maturity_progress": (app.create_ui_maturity_progress_chart,
+                              (ct_scores["overall"], ga_scores["overall"], combined, bench["avg"])),
+        "industry_comparison": (app.create_ui_industry_comparison_chart, (combined, BENCHMARKS, INDUSTRY)),
+        "gap_donut": (app.create_ui_gap_donut_chart, (ct_gaps, ga_gaps)),
+        "gap_heatmap": (app.create_ui_gap_heatmap, (ct_gaps, ga_gaps, CT_QUESTIONS, GA_QUESTIONS)),
+    }
+    # The dashboard only draws domain charts once a catalog has answers
+    for section, scores, title in (("ct", ct_scores, "Control Tower"), ("ga", ga_scores, "Golden Architecture")):
+        if scores["total_answered"] > 0:
+            figures[f"{section}_radar"] = (app.create_ui_radar_chart, (scores["domains"], f"{title} Domain Maturity"))
+            figures[f"{section}_bar"] = (app.create_ui_horizontal_bar_chart, (scores["domains"], "Domain Scores"))
+    for name, (func, args) in figures.items():
+        run[f"figure:{name}"] = lambda func=func, args=args: uncached(func)(*args)
+    plan = plan_report_charts(ct_scores, ga_scores, combined, bench, ct_gaps, ga_gaps, BENCHMARKS, INDUSTRY)
+    for name, (func, args) in plan.items():
+        run[f"chart:{name}"] = lambda func=func, args=args: uncached(func)(*args)
+
+    pdf_args = ("Benchmark Corp", "Benchmark", INDUSTRY, ct, ga, CT_QUESTIONS, GA_QUESTIONS, BENCHMARKS, None)
+
+    def pdf_cold():
+        chart_cache.clear()
+        section_cache.clear()
+        return app.generate_pdf_report(*pdf_args)
+
+    run["pdf_cold"] = pdf_cold
+    run["pdf_warm"] = lambda: app.generate_pdf_report(*pdf_args)
+    run["markdown_report"] = lambda: app.generate_markdown_report(
+        "Benchmark Corp", "Benchmark", INDUSTRY, ct_scores, ga_scores, combined, ct_gaps, ga_gaps, BENCHMARKS, None)
+    return run
+
+
+def measure(func, runs: int) -> dict:
+    """Median / min wall time over runs, then one traced run for the peak heap allocation"""
+    timings = []
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            func()
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    return {"median_s": statistics.median(timings), "min_s": min(timings), "runs": runs, "peak_kib": peak / 1024}
+
+
+def run_metadata(seed: int, runs: int) -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "runs": runs,
+    }
+
+
+def print_results(results: dict, previous: dict = None):
+    header = f"{'scenario':<10} {'stage':<34} {'median (ms)':>12} {'peak (KiB)':>11}"
+    print(header + ("  vs previous" if previous else ""))
+    for scenario, scenario_results in results.items():
+        for stage, r in scenario_results.items():
+            if "error" in r:
+                print(f"{scenario:<10} {stage:<34} {'skipped':>12}  {r['error']}")
+                continue
+            line = f"{scenario:<10} {stage:<34} {r['median_s'] * 1000:>12.2f} {r['peak_kib']:>11.0f}"
+            before = (previous or {}).get(scenario, {}).get(stage, {})
+            if before.get("median_s"):
+                line += f"  {(r['median_s'] / before['median_s'] - 1) * 100:+6.1f}% time"
+                line += f", {(r['peak_kib'] / before['peak_kib'] - 1) * 100:+6.1f}% memory" if before.get("peak_kib") else ""
+            print(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time scoring, chart and report stages over synthetic assessments")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per stage (median reported)")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the synthetic responses")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Earlier --json output to print changes against")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for scenario in args.scenarios:
+        ct = synthetic_responses(CT_QUESTIONS, scenario, args.seed)
+        ga = synthetic_responses(GA_QUESTIONS, scenario, args.seed)
+        results[scenario] = {stage: measure(func, args.runs) for stage, func in stages(ct, ga).items()}
+
+    previous = json.loads(args.compare.read_text())["results"] if args.compare else None
+    print_results(results, previous)
+
+    if args.json:
+        args.json.write_text(json.dumps({"meta": run_metadata(args.seed, args.runs), "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
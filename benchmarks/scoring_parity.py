@@ -0,0 +1,87 @@
+"""
+Scoring Parity Check
+Scores seeded random response sets with both calc_scores and the vectorized
+ScoringEngine (calc_scores_batch) for each catalog and fails on any
+difference: per-domain score, answered, total and weight must match, and
+overall within --tolerance. Edge cases (nothing answered, one answer, every
+question answered, unknown question ids) are always included. Also prints
+the time each path took.
+
+Usage:
+    python benchmarks/scoring_parity.py
+    python benchmarks/scoring_parity.py --samples 2000 --seed 3
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from assessment_core import CT_ENGINE, CT_QUESTIONS, GA_ENGINE, GA_QUESTIONS, calc_scores, calc_scores_batch  # noqa: E402
+
+CATALOGS = {"ct": (CT_QUESTIONS, CT_ENGINE), "ga": (GA_QUESTIONS, GA_ENGINE)}
+
+
+def response_sets(catalog: dict, samples: int, seed: int) -> list:
+    rng = random.Random(seed)
+    ids = [q["id"] for d in catalog.values() for q in d["questions"]]
+    sets = [{}, {ids[0]: 3}, {qid: 5 for qid in ids}, {ids[-1]: 1, "UNKNOWN-1": 4}]
+    for _ in range(samples):
+        coverage = rng.random()
+        sets.append({qid: rng.randint(1, 5) for qid in ids if rng.random() < coverage})
+    return sets
+
+
+def mismatches(expected: dict, actual: dict, tolerance: float) -> list:
+    """Human-readable differences between two calc_scores-shaped results"""
+    problems = []
+    if abs(expected["overall"] - actual["overall"]) > tolerance:
+        problems.append(f"overall {expected['overall']!r} != {actual['overall']!r}")
+    for key in ("total_answered", "total_questions"):
+        if expected[key] != actual[key]:
+            problems.append(f"{key} {expected[key]!r} != {actual[key]!r}")
+    if expected["domains"].keys() != actual["domains"].keys():
+        problems.append(f"domains {sorted(expected['domains'])} != {sorted(actual['domains'])}")
+        return problems
+    for dname, domain in expected["domains"].items():
+        other = actual["domains"][dname]
+        if abs(domain["score"] - other["score"]) > tolerance:
+            problems.append(f"{dname} score {domain['score']!r} != {other['score']!r}")
+        for key in ("answered", "total", "weight"):
+            if domain[key] != other[key]:
+                problems.append(f"{dname} {key} {domain[key]!r} != {other[key]!r}")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check ScoringEngine results against calc_scores")
+    parser.add_argument("--samples", type=int, default=500, help="Random response sets per catalog")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--tolerance", type=float, default=1e-9)
+    args = parser.parse_args(argv)
+
+    failed = 0
+    print(f"{'catalog':<8} {'sets':>6} {'calc_scores (s)':>16} {'engine (s)':>11} {'mismatches':>11}")
+    for name, (catalog, engine) in CATALOGS.items():
+        sets = response_sets(catalog, args.samples, args.seed)
+        start = time.perf_counter()
+        expected = [calc_scores(responses, catalog) for responses in sets]
+        scalar_s = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = calc_scores_batch(sets, engine)
+        batch_s = time.perf_counter() - start
+
+        bad = [(i, problems) for i, (e, a) in enumerate(zip(expected, actual))
+               if (problems := mismatches(e, a, args.tolerance))]
+        print(f"{name:<8} {len(sets):>6} {scalar_s:>16.3f} {batch_s:>11.3f} {len(bad):>11}")
+        for i, problems in bad[:5]:
+            print(f"  set {i}: {'; '.join(problems[:3])}")
+        failed += len(bad)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Startup Benchmark
+Measures cold import time of streamlit_app.py and the time to the first
+full render (init + main() via Streamlit's AppTest harness), each in a fresh
+interpreter. Pass --baseline-ref to measure a git revision side by side.
+
+Usage:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --baseline-ref HEAD~1 --runs 7 --json startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP_FILE = "streamlit_app.py"
+
+IMPORT_PROBE = """
+import sys, time, logging
+logging.disable(logging.WARNING)
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+import streamlit_app
+elapsed = time.perf_counter() - t0
+heavy = [m for m in ("reportlab", "matplotlib", "plotly.graph_objects") if m in sys.modules]
+print(f"{{elapsed}}|{{','.join(heavy)}}")
+"""
+
+RENDER_PROBE = """
+import sys, time, logging
+logging.disable(logging.WARNING)
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+t0 = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=120).run()
+elapsed = time.perf_counter() - t0
+if at.exception:
+    raise SystemExit("App raised: " + str(at.exception[0].value))
+print(f"{{elapsed}}|")
+"""
+
+
+def run_probe(template: str, root: Path) -> tuple:
+    code = template.format(root=str(root), app=str(root / APP_FILE))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root, check=True)
+    elapsed, heavy = out.stdout.strip().splitlines()[-1].split("|", 1)
+    return float(elapsed), heavy
+
+
+def measure(root: Path, runs: int) -> dict:
+    imports, renders, heavy = [], [], ""
+    for _ in range(runs):
+        elapsed, heavy = run_probe(IMPORT_PROBE, root)
+        imports.append(elapsed)
+        renders.append(run_probe(RENDER_PROBE, root)[0])
+    return {
+        "import_s": statistics.median(imports),
+        "first_render_s": statistics.median(renders),
+        "heavy_modules_at_import": heavy.split(",") if heavy else [],
+        "runs": runs,
+    }
+
+
+def export_ref(ref: str, dest: Path):
+    """Materialise a git revision into dest without touching the working tree"""
+    archive = subprocess.run(["git", "archive", "--format=tar", ref], cwd=REPO_ROOT,
+                             capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(dest)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure app import and first-render time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement (median reported)")
+    parser.add_argument("--baseline-ref", help="Git revision to measure for comparison, e.g. HEAD~1")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = {"current": measure(REPO_ROOT, args.runs)}
+    if args.baseline_ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            export_ref(args.baseline_ref, Path(tmp))
+            results["baseline"] = measure(Path(tmp), args.runs)
+        results["baseline"]["ref"] = args.baseline_ref
+
+    print(f"{'':<10} {'import (s)':>11} {'first render (s)':>17}  heavy modules at import")
+    for label, r in results.items():
+        print(f"{label:<10} {r['import_s']:>11.3f} {r['first_render_s']:>17.3f}  "
+              f"{', '.join(r['heavy_modules_at_import']) or '-'}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Question Catalog Index
+Immutable lookup tables compiled once per question catalog, replacing linear
+scans over domains and questions. Works for both catalog shapes in the repo:
+option lists (response = 1-based position) and option dicts (label -> score).
+"""
+
+from collections import OrderedDict
+from types import MappingProxyType
+
+
+class CatalogIndex:
+    """Read-only id/domain/risk/option lookups for one catalog"""
+
+    def __init__(self, domains: dict):
+        questions, domain_of, position = {}, {}, {}
+        domain_ids, risk_ids, option_labels, option_positions = {}, {}, {}, {}
+        for dname, ddata in domains.items():
+            ids = []
+            for q in ddata["questions"]:
+                qid = q["id"]
+                questions[qid] = q
+                domain_of[qid] = dname
+                position[qid] = len(position)
+                ids.append(qid)
+                if "risk" in q:
+                    risk_ids.setdefault(q["risk"], []).append(qid)
+                options = q["options"]
+                if isinstance(options, dict):
+                    labels = {score: label for label, score in options.items()}
+                else:
+                    labels = {score: label for score, label in enumerate(options, 1)}
+                option_labels[qid] = MappingProxyType(labels)
+                option_positions[qid] = MappingProxyType({score: idx for idx, score in enumerate(labels)})
+            domain_ids[dname] = tuple(ids)
+
+        frozen = {
+            "questions": MappingProxyType(questions),
+            "domain_of": MappingProxyType(domain_of),
+            "position": MappingProxyType(position),
+            "domain_ids": MappingProxyType(domain_ids),
+            "risk_ids": MappingProxyType({risk: tuple(ids) for risk, ids in risk_ids.items()}),
+            "option_labels": MappingProxyType(option_labels),
+            "option_positions": MappingProxyType(option_positions),
+        }
+        for name, value in frozen.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CatalogIndex is immutable")
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __contains__(self, qid):
+        return qid in self.questions
+
+    def option_label(self, qid: str, score: int):
+        """Answer text for a stored score, or None if the score is not an option"""
+        return self.option_labels[qid].get(score)
+
+    def option_index(self, qid: str, score: int) -> int:
+        """Zero-based position of the option worth score (0 when unknown)"""
+        return self.option_positions[qid].get(score, 0)
+
+
+_MAX_INDEXES = 8  # The module catalogs plus a few ad hoc ones; older entries are evicted
+_indexes = OrderedDict()  # {id(domains): (domains, CatalogIndex)}, least recently used first
+
+
+def index_for(domains: dict) -> CatalogIndex:
+    """Shared index for a catalog object, cached by identity for the last _MAX_INDEXES catalogs"""
+    key = id(domains)
+    entry = _indexes.get(key)
+    if entry is None or entry[0] is not domains:
+        entry = _indexes[key] = (domains, CatalogIndex(domains))
+        while len(_indexes) > _MAX_INDEXES:
+            _indexes.popitem(last=False)
+    else:
+        _indexes.move_to_end(key)
+    return entry[1]
@@ -0,0 +1,167 @@
+"""
+Content-Addressed Cache
+Bounded in-memory LRU tier plus an optional on-disk tier, keyed by a SHA-256
+of the canonicalised inputs. Used to skip re-rendering report chart PNGs and
+report sections and rebuilding the dashboard's plotly figures.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+
+from instrumentation import timer
+
+
+def content_key(*parts) -> str:
+    """Stable hash of JSON-serialisable parts (dict order is significant)"""
+    payload = json.dumps(parts, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TieredCache:
+    """Thread-safe bytes cache: LRU in memory, optionally backed by a directory"""
+
+    def __init__(self, max_entries: int = 128, disk_dir: str = None):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / key
+
+    def get(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self.disk_dir:
+            try:
+                data = self._disk_path(key).read_bytes()
+            except OSError:
+                data = None
+            if data is not None:
+                self._remember(key, data)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, data: bytes):
+        self._remember(key, data)
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.parent / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+                tmp.write_bytes(data)
+                os.replace(tmp, path)  # Atomic so concurrent readers never see partial files
+            except OSError:
+                pass  # Disk tier is best-effort
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+
+# Shared by every session in the process; CHART_CACHE_DIR enables the disk tier
+chart_cache = TieredCache(
+    max_entries=int(os.environ.get("CHART_CACHE_SIZE", "128")),
+    disk_dir=os.environ.get("CHART_CACHE_DIR") or None,
+)
+
+
+def cached_chart(chart_type: str, style: dict):
+    """Memoize a chart function returning a PNG BytesIO, keyed on type, style and inputs"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = wrapper.cache_key(*args, **kwargs)
+            data = chart_cache.get(key)
+            if data is None:
+                data = func(*args, **kwargs).getvalue()
+                chart_cache.put(key, data)
+            return io.BytesIO(data)
+        wrapper.uncached = func
+        wrapper.chart_type = chart_type
+        wrapper.cache_key = lambda *args, **kwargs: content_key(chart_type, style, args, kwargs)
+        return wrapper
+    return decorator
+
+
+# Laid-out PDF pages of one report section, keyed on the section's inputs; REPORT_SECTION_CACHE_DIR
+# enables the disk tier
+section_cache = TieredCache(
+    max_entries=int(os.environ.get("REPORT_SECTION_CACHE_SIZE", "64")),
+    disk_dir=os.environ.get("REPORT_SECTION_CACHE_DIR") or None,
+)
+
+
+# Plotly figure JSON for the interactive dashboard, shared by every session in the process
+figure_cache = TieredCache(max_entries=int(os.environ.get("FIGURE_CACHE_SIZE", "256")))
+
+
+def cached_figure(figure_type: str, key_inputs=None):
+    """Memoize a plotly figure builder as figure JSON, returning a fresh Figure per call
+
+    key_inputs(*args, **kwargs), if given, reduces the arguments to the compact values the
+    figure depends on, so e.g. gap lists are not hashed with their question text.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            import plotly.io as pio
+            key = wrapper.cache_key(*args, **kwargs)
+            data = figure_cache.get(key)
+            if data is None:
+                with timer("figure_build", figure=figure_type):
+                    data = func(*args, **kwargs).to_json().encode("utf-8")
+                figure_cache.put(key, data)
+            # A new Figure per caller, so one session cannot mutate another's chart
+            return pio.from_json(data.decode("utf-8"))
+
+        def cache_key(*args, **kwargs):
+            inputs = key_inputs(*args, **kwargs) if key_inputs else (args, kwargs)
+            return content_key("figure", figure_type, inputs)
+
+        wrapper.uncached = func
+        wrapper.figure_type = figure_type
+        wrapper.cache_key = cache_key
+        return wrapper
+    return decorator
@@ -0,0 +1,257 @@
+"""
+AWS Enterprise Assessment Platform - Document Analysis
+Map-reduce analysis of extracted document text that does not fit one prompt.
+The corpus is split into token-budgeted chunks at paragraph boundaries (map),
+each chunk is analysed concurrently against the assessment domain list and
+answers with structured per-domain findings, the findings are merged per
+domain locally, and one final request writes the gap report from the merged
+findings (reduce). Every stage reports requests, token usage and latency.
+Kept free of Streamlit imports; the UI renders progress and the final report.
+"""
+
+import json
+import os
+import time
+
+from ai_client import generate_many
+
+CHARS_PER_TOKEN = 4  # Rough English average; budgets leave headroom for the estimate
+MAP_MAX_TOKENS = 1500
+MAX_GAPS_PER_DOMAIN = 8
+
+
+def chunk_budget() -> int:
+    """Estimated document tokens per map request"""
+    return int(os.environ.get("DOC_CHUNK_TOKENS", "8000"))
+
+
+def max_chunks() -> int:
+    """Map requests per analysis; text beyond this many chunks is not analysed"""
+    return int(os.environ.get("DOC_MAX_CHUNKS", "40"))
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def stage_stats(stage: str, started: float, requests: int = 0, input_tokens: int = 0,
+                output_tokens: int = 0, **extra) -> dict:
+    """One row of the per-stage usage table"""
+    return {"stage": stage, "requests": requests, "input_tokens": input_tokens,
+            "output_tokens": output_tokens, "latency_s": time.perf_counter() - started, **extra}
+
+
+# =============================================================================
+# CHUNKING
+# =============================================================================
+
+def split_units(text: str, limit: int):
+    """Paragraphs of text, hard-splitting any paragraph longer than limit characters"""
+    for paragraph in text.split("\n\n"):
+        paragraph = paragraph.strip()
+        for start in range(0, len(paragraph), limit):
+            yield paragraph[start:start + limit]
+
+
+def chunk_documents(documents: list, budget_tokens: int) -> list:
+    """Split [(name, text)] into chunks of at most budget_tokens estimated tokens
+
+    Each chunk is {"index", "sources", "text", "tokens"}; a "--- Document: name ---"
+    header precedes every document's text within a chunk.
+    """
+    limit = budget_tokens * CHARS_PER_TOKEN
+    chunks, parts, sources, size = [], [], [], 0
+
+    def close():
+        text = "\n\n".join(parts)
+        chunks.append({"index": len(chunks), "sources": list(sources), "text": text, "tokens": estimate_tokens(text)})
+
+    for name, text in documents:
+        header = f"--- Document: {name} ---"
+        for unit in split_units(text, max(1, limit - len(header) - 2)):
+            opens_document = not sources or sources[-1] != name
+            cost = len(unit) + 2 + (len(header) + 2 if opens_document else 0)
+            if parts and size + cost > limit:
+                close()
+                parts, sources, size = [], [], 0
+                opens_document = True
+                cost = len(unit) + len(header) + 4
+            if opens_document:
+                parts.append(header)
+                sources.append(name)
+            parts.append(unit)
+            size += cost
+    if parts:
+        close()
+    return chunks
+
+
+# =============================================================================
+# MAP
+# =============================================================================
+
+def map_prompt(chunk: dict, total: int, domains: dict) -> str:
+    """Findings request for one chunk; domains is {section: [domain name]}"""
+    domain_list = "\n".join(f"- {section}: {', '.join(names)}" for section, names in domains.items())
+    return f"""
+You are reviewing excerpt {chunk['index'] + 1} of {total} from an organisation's AWS documentation.
+
+Assessment domains:
+{domain_list}
+
+For every domain this excerpt provides evidence about, report the current maturity
+(1 = ad-hoc, 5 = optimized), the gaps it reveals and a short quote or paraphrase as
+evidence. Skip domains the excerpt does not mention.
+
+Respond with only a JSON array, no prose:
+[{{"domain": "<exact domain name from the list>", "score": 1-5, "gaps": ["..."], "evidence": "..."}}]
+
+Excerpt:
+{chunk['text']}
+"""
+
+
+def parse_findings(text: str, domains: dict) -> list:
+    """[{"section", "domain", "score", "gaps", "evidence"}] from a map response; None if unparseable"""
+    start, end = text.find("["), text.rfind("]")
+    if start < 0 or end < start:
+        return None
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    lookup = {name.lower(): (section, name) for section, names in domains.items() for name in names}
+    findings = []
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        match = lookup.get(str(item.get("domain", "")).strip().lower())
+        if match is None:
+            continue
+        try:
+            score = min(5, max(1, int(item.get("score"))))
+        except (TypeError, ValueError):
+            score = None
+        gaps = item.get("gaps") or []
+        findings.append({
+            "section": match[0],
+            "domain": match[1],
+            "score": score,
+            "gaps": [str(gap) for gap in (gaps if isinstance(gaps, list) else [gaps])],
+            "evidence": str(item.get("evidence") or ""),
+        })
+    return findings
+
+
+def map_chunks(chunks: list, domains: dict, system: str, model: str, cache=None, on_result=None) -> tuple:
+    """Analyse chunks concurrently; returns ({chunk index: result}, stage stats)
+
+    result is generate_many's dict plus "findings" (None when the response could not be
+    parsed) and "cached". on_result(index, result) is called as each chunk finishes.
+    """
+    started = time.perf_counter()
+    prompts = {chunk["index"]: map_prompt(chunk, len(chunks), domains) for chunk in chunks}
+    results, pending = {}, {}
+    for index, prompt in prompts.items():
+        cached = cache.get(prompt, system, model, MAP_MAX_TOKENS) if cache else None
+        if cached is not None:
+            results[index] = {"text": cached, "latency_s": 0.0, "cached": True}
+            results[index]["findings"] = parse_findings(cached, domains)
+            if on_result:
+                on_result(index, results[index])
+        else:
+            pending[index] = prompt
+
+    for index, result in generate_many(pending, system, model, MAP_MAX_TOKENS):
+        result["cached"] = False
+        if "error" not in result:
+            result["findings"] = parse_findings(result["text"], domains)
+            if cache and result["findings"] is not None:
+                cache.put(pending[index], system, model, MAP_MAX_TOKENS, result["text"], result["stop_reason"])
+        results[index] = result
+        if on_result:
+            on_result(index, result)
+
+    fresh = [result for result in results.values() if not result["cached"]]
+    return results, stage_stats(
+        "map", started,
+        requests=len(fresh),
+        input_tokens=sum(result.get("input_tokens") or 0 for result in fresh),
+        output_tokens=sum(result.get("output_tokens") or 0 for result in fresh),
+        cached=len(results) - len(fresh),
+        errors=sum("error" in result for result in results.values()),
+        slowest_s=max((result["latency_s"] for result in fresh), default=0.0),
+    )
+
+
+# =============================================================================
+# REDUCE
+# =============================================================================
+
+def merge_findings(results: dict, domains: dict) -> dict:
+    """{section: {domain: {"scores", "score", "gaps", "evidence", "chunks"}}} over all chunk results,
+    with gaps de-duplicated case-insensitively in first-seen (document) order"""
+    merged = {section: {name: {"scores": [], "score": None, "gaps": [], "evidence": [], "chunks": []}
+                        for name in names} for section, names in domains.items()}
+    seen = set()
+    for index in sorted(results):
+        for finding in results[index].get("findings") or []:
+            entry = merged[finding["section"]][finding["domain"]]
+            entry["chunks"].append(index)
+            if finding["score"] is not None:
+                entry["scores"].append(finding["score"])
+            if finding["evidence"]:
+                entry["evidence"].append(finding["evidence"])
+            for gap in finding["gaps"]:
+                key = (finding["domain"], " ".join(gap.lower().split()))
+                if key not in seen:
+                    seen.add(key)
+                    entry["gaps"].append(gap)
+    for section in merged.values():
+        for entry in section.values():
+            if entry["scores"]:
+                entry["score"] = sum(entry["scores"]) / len(entry["scores"])
+    return merged
+
+
+def reduce_prompt(merged: dict, chunk_count: int, unparsed: int) -> str:
+    """Final gap-report request built from merged findings rather than the raw documents"""
+    lines = []
+    for section, section_domains in merged.items():
+        lines.append(f"\n### {section}")
+        for name, entry in section_domains.items():
+            if not entry["chunks"]:
+                lines.append(f"- **{name}**: no evidence in the documents")
+                continue
+            score = f"{entry['score']:.1f}/5" if entry["score"] is not None else "not rated"
+            lines.append(f"- **{name}**: {score} from {len(entry['chunks'])} excerpt(s)")
+            for gap in entry["gaps"][:MAX_GAPS_PER_DOMAIN]:
+                lines.append(f"  - Gap: {gap}")
+            for evidence in entry["evidence"][:2]:
+                lines.append(f"  - Evidence: {evidence[:300]}")
+    coverage = f"{chunk_count} excerpts were analysed"
+    if unparsed:
+        coverage += f"; {unparsed} could not be analysed and are not reflected below"
+    findings = "\n".join(lines)
+    return f"""
+Write a comprehensive assessment of an organisation's AWS documentation from the
+per-domain findings below ({coverage}).
+
+Cover:
+
+1. **Control Tower Migration Readiness**
+2. **Golden Architecture (Serverless) Readiness**
+
+For each domain, provide:
+- Current state assessment (1-5 scale)
+- Key gaps identified
+- Specific recommendations
+- Priority ranking (High/Medium/Low)
+
+Call out domains without documentary evidence as gaps to investigate.
+
+Merged findings:
+{findings}
+
+Provide structured, actionable insights for enterprise implementation.
+"""
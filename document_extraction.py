@@ -0,0 +1,227 @@
+"""
+AWS Enterprise Assessment Platform - Document Extraction
+Text extraction for uploaded PDF / DOCX / PPTX / TXT / JSON documents. Pages,
+paragraphs and slides are streamed from generators and joined once, each file
+is capped by DOC_MAX_FILE_MB and DOC_MAX_PAGES (DOC_MAX_PARAGRAPHS for DOCX
+paragraphs and text lines), and files are extracted in parallel worker
+processes. submit_extraction returns futures that the apps poll from a
+fragment, so a large binder never blocks the script thread.
+Successful results are cached by file content hash and EXTRACTOR_VERSION, so
+reruns and re-uploads of the same file skip parsing entirely.
+Kept free of Streamlit imports so worker processes can import it.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from content_cache import TieredCache, content_key
+from instrumentation import observe
+from spawn_pool import SpawnPool
+
+# Bump when extraction output changes so cached text from older readers is not reused
+EXTRACTOR_VERSION = "1"
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+PPTX_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+TEXT_TYPES = ("text/plain", "application/json")
+
+
+def max_file_bytes() -> int:
+    return int(float(os.environ.get("DOC_MAX_FILE_MB", "50")) * 1024 * 1024)
+
+
+def max_pages() -> int:
+    """Pages (PDF) or slides (PPTX) extracted per file; later ones are skipped"""
+    return int(os.environ.get("DOC_MAX_PAGES", "500"))
+
+
+def max_paragraphs() -> int:
+    """Paragraphs (DOCX) or lines (TXT / JSON) extracted per file; later ones are skipped"""
+    return int(os.environ.get("DOC_MAX_PARAGRAPHS", "20000"))
+
+
+# =============================================================================
+# STREAMING READERS - one text unit (page / paragraph / slide) at a time
+# =============================================================================
+
+def iter_pdf_pages(data: bytes):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            raise ImportError("PDF extraction requires pypdf or PyPDF2 library.")
+    for page in PdfReader(io.BytesIO(data)).pages:
+        yield page.extract_text() or ""
+
+
+def iter_docx_paragraphs(data: bytes):
+    try:
+        import docx
+    except ImportError:
+        raise ImportError("DOCX extraction requires python-docx library.")
+    for para in docx.Document(io.BytesIO(data)).paragraphs:
+        yield para.text
+
+
+def iter_pptx_slides(data: bytes):
+    try:
+        from pptx import Presentation
+    except ImportError:
+        raise ImportError("PPTX extraction requires python-pptx library.")
+    for slide in Presentation(io.BytesIO(data)).slides:
+        yield "\n".join(shape.text for shape in slide.shapes if hasattr(shape, "text"))
+
+
+def iter_text(data: bytes):
+    yield from data.decode("utf-8").split("\n")
+
+
+READERS = {
+    PDF_TYPE: (iter_pdf_pages, True),
+    DOCX_TYPE: (iter_docx_paragraphs, False),
+    PPTX_TYPE: (iter_pptx_slides, True),
+    **{file_type: (iter_text, False) for file_type in TEXT_TYPES},
+}
+
+
+def extract_text(name: str, file_type: str, data: bytes, page_limit: int = None, byte_limit: int = None,
+                 paragraph_limit: int = None) -> dict:
+    """Extract one document to {"name", "text", "pages", "truncated", "error", "bytes", "seconds"}
+
+    "pages" counts the units read: pages / slides, or paragraphs / lines for unpaged formats.
+    """
+    start = time.perf_counter()
+    page_limit = max_pages() if page_limit is None else page_limit
+    byte_limit = max_file_bytes() if byte_limit is None else byte_limit
+    paragraph_limit = max_paragraphs() if paragraph_limit is None else paragraph_limit
+    result = {"name": name, "text": "", "pages": 0, "truncated": False, "error": None, "bytes": len(data)}
+
+    reader, paged = READERS.get(file_type, (None, False))
+    if reader is None:
+        result["error"] = f"Unsupported file type: {file_type or 'unknown'}"
+    elif len(data) > byte_limit:
+        result["error"] = f"File is {len(data) / 1048576:.1f} MB; the limit is {byte_limit / 1048576:.0f} MB"
+    else:
+        try:
+            limit = page_limit if paged else paragraph_limit
+            units = list(islice(reader(data), limit + 1))
+            result["truncated"] = len(units) > limit
+            units = units[:limit]
+            result["pages"] = len(units)
+            result["text"] = "\n".join(units)
+        except ImportError as e:
+            result["error"] = str(e)
+        except Exception as e:
+            result["error"] = f"Error extracting content: {str(e)}"
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+# Shared by every session in the process. The disk tier is opt-in: it holds the full text of
+# customer documents and, unlike the memory tier, is never evicted
+extraction_cache = TieredCache(
+    max_entries=int(os.environ.get("DOC_CACHE_SIZE", "32")),
+    disk_dir=os.environ.get("DOC_CACHE_DIR") or None,
+)
+
+
+def extraction_key(file_type: str, data: bytes, page_limit: int, paragraph_limit: int) -> str:
+    """Cache key: file content hash, type, unit limits and EXTRACTOR_VERSION (not the file name)"""
+    return content_key("extraction", EXTRACTOR_VERSION, file_type, page_limit, paragraph_limit,
+                       hashlib.sha256(data).hexdigest())
+
+
+def cached_result(key: str, name: str):
+    """Cached extract_text result for key under this upload's name, or None"""
+    start = time.perf_counter()
+    data = extraction_cache.get(key)
+    if data is None:
+        return None
+    result = json.loads(data)
+    result.update(name=name, cached=True, seconds=time.perf_counter() - start)
+    return result
+
+
+def store_result(key: str, result: dict):
+    """Cache successful extractions only; errors (e.g. a missing library) may not recur"""
+    observe("document_extraction", result["seconds"], result["error"],
+            bytes=result["bytes"], pages=result["pages"], truncated=result["truncated"])
+    if result["error"] is None:
+        extraction_cache.put(key, json.dumps(result).encode("utf-8"))
+
+
+def extract_cached(name: str, file_type: str, data: bytes) -> dict:
+    """extract_text in the calling thread, through the result cache"""
+    key = extraction_key(file_type, data, max_pages(), max_paragraphs())
+    result = cached_result(key, name)
+    if result is None:
+        result = extract_text(name, file_type, data)
+        store_result(key, result)
+    return result
+
+
+# =============================================================================
+# PARALLEL EXTRACTION
+# =============================================================================
+
+# DOC_EXTRACTION_WORKERS overrides the default of one worker per core (max 4)
+_extraction_pool = SpawnPool("DOC_EXTRACTION_WORKERS")
+_fallback_pool = None
+_fallback_lock = threading.Lock()
+
+
+def _get_fallback_pool():
+    """Thread used when worker processes are unavailable, so callers still never block"""
+    global _fallback_pool
+    with _fallback_lock:
+        if _fallback_pool is None:
+            _fallback_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="doc-extract")
+        return _fallback_pool
+
+
+def submit_extraction(name: str, file_type: str, data: bytes):
+    """Start extracting one document in a worker process; returns a Future of the extract_text
+    result, already completed when the same content was extracted before"""
+    args = (name, file_type, data, max_pages(), max_file_bytes(), max_paragraphs())
+    key = extraction_key(file_type, data, args[3], args[5])
+    cached = cached_result(key, name)
+    if cached is not None:
+        future = Future()
+        future.set_result(cached)
+        return future
+    try:
+        future = _extraction_pool.get().submit(extract_text, *args)
+    except BrokenProcessPool:
+        _extraction_pool.reset()
+        future = None
+    except (OSError, RuntimeError):
+        future = None
+    if future is None:
+        future = _get_fallback_pool().submit(extract_text, *args)
+    future.add_done_callback(lambda done: done.cancelled() or done.exception() or store_result(key, done.result()))
+    return future
+
+
+def finished_result(future, name: str, size: int) -> dict:
+    """Result of a completed submit_extraction future, or an error result if the worker failed"""
+    try:
+        return future.result()
+    except Exception as e:
+        return {"name": name, "text": "", "pages": 0, "truncated": False,
+                "error": f"Error extracting content: {str(e)}", "bytes": size, "seconds": 0.0}
+
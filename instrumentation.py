@@ -0,0 +1,302 @@
+"""
+Hot-Path Instrumentation
+Latency histograms, error and token counters for the app's hot paths, served
+in Prometheus text format from a side port and logged as one JSON object per
+operation using the level and format in config.yaml's logging section.
+
+Everything is off unless METRICS_PORT is set: timed() then returns the
+function itself and timer() a shared no-op context, so a disabled build pays
+one attribute lookup at most.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ENABLED = bool(os.environ.get("METRICS_PORT"))
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+CONFIG_PATH = Path(os.environ.get("APP_CONFIG") or Path(__file__).resolve().parent / "config.yaml")
+
+logger = logging.getLogger("assessment.metrics")
+_NO_TIMER = nullcontext()
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class Histogram:
+    """Cumulative-bucket latency histogram for one label set"""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # Last slot holds values above every bound
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class Registry:
+    """Thread-safe metric store; collectors add values read at scrape time"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}  # {(name, labels): Histogram}
+        self.counters = {}  # {(name, labels): float}
+        self.help = {}  # {name: (type, help)}
+        self.collectors = {}  # {key: callable returning [(name, type, help, {labels: value})]}
+
+    def describe(self, name: str, kind: str, text: str):
+        self.help.setdefault(name, (kind, text))
+
+    def observe(self, name: str, labels: tuple, seconds: float):
+        with self._lock:
+            histogram = self.histograms.get((name, labels))
+            if histogram is None:
+                histogram = self.histograms[(name, labels)] = Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, labels: tuple, amount: float = 1):
+        with self._lock:
+            self.counters[(name, labels)] = self.counters.get((name, labels), 0) + amount
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4"""
+        families = {}
+        with self._lock:
+            for (name, labels), histogram in self.histograms.items():
+                families.setdefault(name, []).extend(_histogram_lines(name, labels, histogram))
+            for (name, labels), value in self.counters.items():
+                families.setdefault(name, []).append(f"{name}{_labels(labels)} {_number(value)}")
+            collectors = list(self.collectors.values())
+        for collect in collectors:
+            try:
+                for name, kind, text, values in collect():
+                    self.describe(name, kind, text)
+                    families.setdefault(name, []).extend(
+                        f"{name}{_labels(labels)} {_number(value)}" for labels, value in values.items())
+            except Exception as e:
+                logger.warning(json.dumps({"event": "collector_failed", "error": str(e)}))
+        lines = []
+        for name in sorted(families):
+            kind, text = self.help.get(name, ("untyped", name))
+            lines += [f"# HELP {name} {text}", f"# TYPE {name} {kind}", *families[name]]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: tuple) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}" if labels else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _histogram_lines(name: str, labels: tuple, histogram: Histogram) -> list:
+    lines, cumulative = [], 0
+    for bound, count in zip(BUCKETS + ("+Inf",), histogram.counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {cumulative}")
+    lines.append(f"{name}_sum{_labels(labels)} {repr(histogram.sum)}")
+    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+    return lines
+
+
+registry = Registry()
+registry.describe("app_operation_seconds", "histogram", "Latency of instrumented operations")
+registry.describe("app_operation_errors_total", "counter", "Instrumented operations that raised")
+registry.describe("app_ai_tokens_total", "counter", "Claude tokens by model and direction")
+registry.describe("app_ai_first_token_seconds", "histogram", "Time to the first streamed Claude token")
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+def observe(operation: str, seconds: float, error: str = None, log_level: int = logging.DEBUG, **fields):
+    """Record one completed operation and log it as a JSON object"""
+    if not ENABLED:
+        return
+    labels = (("operation", operation),)
+    registry.observe("app_operation_seconds", labels, seconds)
+    if error is not None:
+        registry.inc("app_operation_errors_total", labels)
+        log_level = max(log_level, logging.WARNING)
+    if logger.isEnabledFor(log_level):
+        event = {"event": "operation", "operation": operation, "seconds": round(seconds, 6), **fields}
+        if error is not None:
+            event["error"] = error
+        logger.log(log_level, json.dumps(event, default=str))
+
+
+def record_tokens(model: str, input_tokens: int = None, output_tokens: int = None, first_token_s: float = None):
+    """Count Claude token usage (and time to first token for streams)"""
+    if not ENABLED:
+        return
+    for direction, tokens in (("input", input_tokens), ("output", output_tokens)):
+        if tokens:
+            registry.inc("app_ai_tokens_total", (("model", model), ("direction", direction)), tokens)
+    if first_token_s is not None:
+        registry.observe("app_ai_first_token_seconds", (("model", model),), first_token_s)
+
+
+class _Timer:
+    __slots__ = ("operation", "log_level", "fields", "start")
+
+    def __init__(self, operation: str, log_level: int, fields: dict):
+        self.operation = operation
+        self.log_level = log_level
+        self.fields = fields
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Streamlit's rerun / stop signals are BaseExceptions, not failures
+        error = f"{exc_type.__name__}: {exc}" if exc_type is not None and issubclass(exc_type, Exception) else None
+        observe(self.operation, time.perf_counter() - self.start, error, self.log_level, **self.fields)
+        return False
+
+
+def timer(operation: str, log_level: int = logging.DEBUG, **fields):
+    """Context manager timing a block as operation; a shared no-op when disabled"""
+    return _Timer(operation, log_level, fields) if ENABLED else _NO_TIMER
+
+
+def timed(operation: str, log_level: int = logging.DEBUG):
+    """Decorator timing every call as operation; returns func unchanged when disabled"""
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Timer(operation, log_level, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def register_collector(key: str, collect):
+    """Add (or replace) a scrape-time source of [(name, type, help, {labels: value})]"""
+    if ENABLED:
+        with registry._lock:
+            registry.collectors[key] = collect
+
+
+def register_caches(caches: dict):
+    """Expose {name: TieredCache} hit / miss counts and sizes; safe to call on every rerun"""
+    for name, cache in caches.items():
+        register_collector(f"cache:{name}", lambda name=name, cache=cache: _cache_metrics(name, cache.stats()))
+
+
+def _cache_metrics(name: str, stats: dict) -> list:
+    labels = (("cache", name),)
+    return [
+        ("app_cache_hits_total", "counter", "Cache lookups served from memory or disk", {labels: stats["hits"]}),
+        ("app_cache_disk_hits_total", "counter", "Cache lookups served from the disk tier", {labels: stats["disk_hits"]}),
+        ("app_cache_misses_total", "counter", "Cache lookups that missed both tiers", {labels: stats["misses"]}),
+        ("app_cache_entries", "gauge", "Entries held in the memory tier", {labels: stats["entries"]}),
+    ]
+
+
+# =============================================================================
+# LOGGING CONFIG AND METRICS SERVER
+# =============================================================================
+
+def logging_config(path: Path = CONFIG_PATH) -> dict:
+    """config.yaml's logging section ({"level", "format"}), without requiring PyYAML"""
+    config = {"level": "INFO", "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"}
+    try:
+        text = path.read_text()
+    except OSError:
+        return config
+    try:
+        import yaml
+        config.update((yaml.safe_load(text) or {}).get("logging") or {})
+        return config
+    except ImportError:
+        pass
+    # Flat "key: value" lines directly under the top-level logging: key
+    in_section = False
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line[0].isspace():
+            in_section = line.strip() == "logging:"
+            continue
+        if in_section and ":" in line:
+            key, _, value = line.strip().partition(":")
+            config[key.strip()] = value.strip().strip("\"'")
+    return config
+
+
+def _configure_logging():
+    if logger.handlers:
+        return
+    config = logging_config()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(config["format"]))
+    logger.addHandler(handler)
+    logger.setLevel(str(config["level"]).upper())
+    logger.propagate = False
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes are not worth a log line each
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server():
+    """Serve /metrics on METRICS_PORT once per process; a no-op when disabled or already running"""
+    global _server
+    if not ENABLED or _server is not None:
+        return _server
+    with _server_lock:
+        if _server is None:
+            _configure_logging()
+            address = os.environ.get("METRICS_ADDRESS", "0.0.0.0")
+            port = int(os.environ["METRICS_PORT"])
+            try:
+                server = ThreadingHTTPServer((address, port), _MetricsHandler)
+            except OSError as e:
+                logger.warning(json.dumps({"event": "metrics_server_failed", "port": port, "error": str(e)}))
+                _server = False  # Do not retry on every rerun
+                return _server
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+            logger.info(json.dumps({"event": "metrics_server_started", "address": address, "port": port}))
+            _server = server
+    return _server
@@ -0,0 +1,107 @@
+"""
+Portfolio Analytics
+Aggregates many stored assessments at once: per-domain score distributions and
+percentiles, maturity histograms and the most frequent critical / high gaps.
+Scores come from the compiled ScoringEngines (catalog weights, calc_scores
+semantics) and gaps follow find_gaps: an answered question scoring 2 or less.
+"""
+
+import warnings
+
+import numpy as np
+
+from assessment_core import CT_ENGINE, GA_ENGINE, CT_INDEX, GA_INDEX
+from score_state import GAP_THRESHOLD, RISK_ORDER
+from scoring_engine import combined_scores
+
+SECTIONS = {
+    "ct": (CT_ENGINE, CT_INDEX, "ct_responses"),
+    "ga": (GA_ENGINE, GA_INDEX, "ga_responses"),
+}
+PERCENTILES = (10, 25, 50, 75, 90)
+MATURITY_LEVELS = ["Not Assessed", "Initial", "Developing", "Managed", "Optimized"]
+MATURITY_THRESHOLDS = [20, 40, 60, 80]  # get_maturity boundaries
+TOP_GAP_RISKS = ("critical", "high")
+
+
+def distribution(values: np.ndarray, assessed: np.ndarray) -> dict:
+    """Mean and PERCENTILES of the assessed entries of values (None when nothing is assessed)"""
+    return distributions(values[:, None], assessed[:, None])[0]
+
+
+def distributions(values: np.ndarray, assessed: np.ndarray) -> list:
+    """distribution() for every column of an (assessments x columns) matrix in one pass"""
+    masked = np.where(assessed, values, np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # All-NaN columns: nothing assessed yet
+        means = np.nanmean(masked, axis=0)
+        quantiles = np.nanpercentile(masked, PERCENTILES, axis=0)
+    counts = assessed.sum(axis=0)
+    stats = []
+    for col, count in enumerate(counts):
+        if count == 0:
+            stats.append({"assessed": 0, "mean": None, **{f"p{p}": None for p in PERCENTILES}})
+            continue
+        stats.append({
+            "assessed": int(count),
+            "mean": float(means[col]),
+            **{f"p{p}": float(quantiles[i, col]) for i, p in enumerate(PERCENTILES)},
+        })
+    return stats
+
+
+def maturity_histogram(scores: np.ndarray) -> dict:
+    """Assessments per get_maturity level"""
+    counts = np.bincount(np.digitize(scores, MATURITY_THRESHOLDS), minlength=len(MATURITY_LEVELS))
+    return {level: int(count) for level, count in zip(MATURITY_LEVELS, counts)}
+
+
+def gap_frequencies(section: str, matrix: np.ndarray) -> list:
+    """Critical / high questions that are a gap in at least one assessment, with their counts"""
+    engine, index, _ = SECTIONS[section]
+    gaps = ((matrix > 0) & (matrix <= GAP_THRESHOLD)).sum(axis=0)
+    answered = (matrix > 0).sum(axis=0)
+    found = []
+    for col in np.flatnonzero(gaps):
+        qid = engine.question_ids[col]
+        q = index.questions[qid]
+        if q["risk"] in TOP_GAP_RISKS:
+            found.append({
+                "id": qid,
+                "section": section,
+                "domain": index.domain_of[qid],
+                "question": q["question"],
+                "risk": q["risk"],
+                "count": int(gaps[col]),
+                "answered": int(answered[col]),
+                "share": float(gaps[col] / len(matrix)),
+            })
+    return found
+
+
+def aggregate_portfolio(records: list, top_gaps: int = 10) -> dict:
+    """Portfolio analytics over assessment records (the assessment store's record shape)"""
+    result = {"assessments": len(records), "industries": {}, "overall": {}, "maturity": {}, "domains": {}}
+    for record in records:
+        industry = record.get("metadata", {}).get("industry") or "unspecified"
+        result["industries"][industry] = result["industries"].get(industry, 0) + 1
+
+    overall, gaps = {}, []
+    for section, (engine, _, field) in SECTIONS.items():
+        matrix = engine.to_matrix([record.get(field) or {} for record in records])
+        scored = engine.score_matrix(matrix)
+        overall[section] = scored["overall"]
+        result["overall"][section] = distribution(scored["overall"], scored["total_answered"] > 0)
+        result["maturity"][section] = maturity_histogram(scored["overall"])
+        result["domains"][section] = dict(zip(engine.domain_names,
+                                              distributions(scored["domain_scores"], scored["answered"] > 0)))
+        gaps.extend(gap_frequencies(section, matrix))
+
+    combined, assessed = combined_scores(overall["ct"], overall["ga"])
+    result["overall"]["combined"] = distribution(combined, assessed)
+    result["maturity"]["combined"] = maturity_histogram(combined)
+
+    # Ties keep catalog order, CT before GA
+    gaps.sort(key=lambda g: (-g["count"], RISK_ORDER[g["risk"]], g["section"], SECTIONS[g["section"]][1].position[g["id"]]))
+    result["top_gaps"] = gaps[:top_gaps]
+    return result
@@ -0,0 +1,550 @@
+"""
+AWS Enterprise Assessment Platform - Report Charts
+Matplotlib PNG charts embedded in the PDF report, plus a pre-render stage
+that renders every chart a report needs in parallel worker processes.
+Kept free of Streamlit imports so worker processes can import it.
+"""
+
+import io
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from content_cache import cached_chart, chart_cache
+from instrumentation import timed
+from spawn_pool import SpawnPool
+
+# =============================================================================
+# CHART GENERATION FUNCTIONS
+# =============================================================================
+
+# Part of every chart cache key - bump "revision" when chart drawing code changes
+CHART_STYLE = {"dpi": 150, "format": "png", "facecolor": "white", "revision": 1}
+
+def _pyplot():
+    """Import matplotlib on first chart render, using the non-interactive backend"""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    return plt
+
+@cached_chart("gauge", CHART_STYLE)
+def create_gauge_chart(score, title, size=(4, 3)):
+    """Create a beautiful gauge/speedometer chart for scores"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=size, subplot_kw={'projection': 'polar'})
+    
+    # Colors for different score ranges
+    colors_gradient = ['#DC2626', '#EA580C', '#D97706', '#CA8A04', '#65A30D', '#059669']
+    
+    # Set up the gauge
+    ax.set_theta_zero_location('N')
+    ax.set_theta_direction(-1)
+    ax.set_thetamin(0)
+    ax.set_thetamax(180)
+    
+    # Create the background arc segments
+    theta_ranges = np.linspace(0, np.pi, 7)
+    for i in range(6):
+        theta = np.linspace(theta_ranges[i], theta_ranges[i+1], 50)
+        r = np.ones_like(theta) * 0.9
+        ax.fill_between(theta, 0.6, r, color=colors_gradient[i], alpha=0.3)
+    
+    # Add the score indicator
+    score_angle = np.pi * (1 - score / 100)
+    ax.annotate('', xy=(score_angle, 0.85), xytext=(np.pi/2, 0),
+                arrowprops=dict(arrowstyle='->', color='#1e293b', lw=3))
+    
+    # Add score text in center
+    ax.text(np.pi/2, 0.25, f'{score:.0f}%', ha='center', va='center', 
+            fontsize=24, fontweight='bold', color='#1e293b')
+    ax.text(np.pi/2, 0.05, title, ha='center', va='center', 
+            fontsize=10, color='#64748b')
+    
+    # Clean up the chart
+    ax.set_ylim(0, 1)
+    ax.set_yticks([])
+    ax.set_xticks([])
+    ax.spines['polar'].set_visible(False)
+    
+    # Save to buffer
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+@cached_chart("score_gauges", CHART_STYLE)
+def create_score_gauges(ct_score, ga_score, combined_score, benchmark):
+    """Create a combined gauge chart showing all three scores"""
+    plt = _pyplot()
+    fig, axes = plt.subplots(1, 4, figsize=(14, 3.5))
+    
+    scores = [ct_score, ga_score, combined_score, benchmark]
+    titles = ['Control Tower', 'Golden Architecture', 'Combined Score', 'Industry Benchmark']
+    main_colors = ['#0284c7', '#7c3aed', '#059669', '#f59e0b']
+    
+    for ax, score, title, color in zip(axes, scores, titles, main_colors):
+        # Create a semi-circular gauge
+        ax.set_xlim(-1.5, 1.5)
+        ax.set_ylim(-0.2, 1.3)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        
+        # Background arc
+        theta = np.linspace(np.pi, 0, 100)
+        x_bg = np.cos(theta)
+        y_bg = np.sin(theta)
+        ax.fill(np.append(x_bg, [0]), np.append(y_bg, [0]), color='#e2e8f0', alpha=0.5)
+        
+        # Score arc
+        score_theta = np.linspace(np.pi, np.pi - (np.pi * score / 100), 100)
+        x_score = np.cos(score_theta)
+        y_score = np.sin(score_theta)
+        ax.fill(np.append(x_score, [0]), np.append(y_score, [0]), color=color, alpha=0.8)
+        
+        # Add gradient effect segments
+        for i, (start, end, c) in enumerate([
+            (0, 20, '#DC2626'), (20, 40, '#EA580C'), (40, 60, '#D97706'),
+            (60, 80, '#65A30D'), (80, 100, '#059669')
+        ]):
+            seg_start = np.pi - (np.pi * start / 100)
+            seg_end = np.pi - (np.pi * end / 100)
+            seg_theta = np.linspace(seg_start, seg_end, 20)
+            ax.plot(1.1 * np.cos(seg_theta), 1.1 * np.sin(seg_theta), color=c, linewidth=8, alpha=0.6)
+        
+        # Score text
+        ax.text(0, 0.4, f'{score:.0f}%', ha='center', va='center', 
+                fontsize=28, fontweight='bold', color='#1e293b')
+        ax.text(0, -0.1, title, ha='center', va='center', 
+                fontsize=11, fontweight='bold', color='#64748b')
+        
+        # Maturity label
+        if score >= 80:
+            maturity = "Optimized"
+            mat_color = '#059669'
+        elif score >= 60:
+            maturity = "Managed"
+            mat_color = '#65A30D'
+        elif score >= 40:
+            maturity = "Developing"
+            mat_color = '#D97706'
+        elif score >= 20:
+            maturity = "Initial"
+            mat_color = '#EA580C'
+        else:
+            maturity = "Not Assessed"
+            mat_color = '#64748b'
+        
+        ax.text(0, 0.15, maturity, ha='center', va='center', 
+                fontsize=9, color=mat_color, fontweight='bold')
+    
+    plt.tight_layout()
+    
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+@cached_chart("radar", CHART_STYLE)
+def create_radar_chart(domain_scores, title, color='#0284c7'):
+    """Create a radar/spider chart for domain analysis"""
+    plt = _pyplot()
+    # Prepare data
+    categories = list(domain_scores.keys())
+    values = [domain_scores[cat]['score'] for cat in categories]
+    
+    # Truncate long category names
+    categories = [cat[:20] + '...' if len(cat) > 20 else cat for cat in categories]
+    
+    # Number of variables
+    num_vars = len(categories)
+    
+    # Compute angle for each category
+    angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
+    values += values[:1]  # Complete the loop
+    angles += angles[:1]
+    
+    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
+    
+    # Draw the chart
+    ax.fill(angles, values, color=color, alpha=0.25)
+    ax.plot(angles, values, color=color, linewidth=2, marker='o', markersize=6)
+    
+    # Add reference circles
+    for level in [20, 40, 60, 80, 100]:
+        circle_color = '#059669' if level >= 80 else '#65A30D' if level >= 60 else '#D97706' if level >= 40 else '#EA580C' if level >= 20 else '#DC2626'
+        ax.plot(angles, [level] * len(angles), color=circle_color, linewidth=0.5, linestyle='--', alpha=0.5)
+    
+    # Set category labels
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(categories, fontsize=8)
+    
+    # Set radial limits
+    ax.set_ylim(0, 100)
+    ax.set_yticks([20, 40, 60, 80, 100])
+    ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'], fontsize=7, color='#64748b')
+    
+    # Title
+    ax.set_title(title, fontsize=14, fontweight='bold', color='#1e293b', pad=20)
+    
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+@cached_chart("horizontal_bar", CHART_STYLE)
+def create_horizontal_bar_chart(domain_scores, title, color='#0284c7'):
+    """Create a horizontal bar chart for domain scores"""
+    plt = _pyplot()
+    categories = list(domain_scores.keys())
+    values = [domain_scores[cat]['score'] for cat in categories]
+    
+    # Truncate long names
+    categories = [cat[:30] + '...' if len(cat) > 30 else cat for cat in categories]
+    
+    fig, ax = plt.subplots(figsize=(10, max(6, len(categories) * 0.5)))
+    
+    # Create color gradient based on score
+    colors_list = []
+    for v in values:
+        if v >= 80:
+            colors_list.append('#059669')
+        elif v >= 60:
+            colors_list.append('#65A30D')
+        elif v >= 40:
+            colors_list.append('#D97706')
+        elif v >= 20:
+            colors_list.append('#EA580C')
+        else:
+            colors_list.append('#DC2626')
+    
+    y_pos = np.arange(len(categories))
+    
+    # Background bars (100%)
+    ax.barh(y_pos, [100] * len(categories), color='#e2e8f0', height=0.6)
+    
+    # Score bars
+    bars = ax.barh(y_pos, values, color=colors_list, height=0.6, alpha=0.85)
+    
+    # Add value labels
+    for i, (bar, val) in enumerate(zip(bars, values)):
+        ax.text(val + 2, bar.get_y() + bar.get_height()/2, f'{val:.0f}%', 
+                va='center', ha='left', fontsize=10, fontweight='bold', color='#1e293b')
+    
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(categories, fontsize=9)
+    ax.set_xlim(0, 110)
+    ax.set_xlabel('Score (%)', fontsize=10, color='#64748b')
+    ax.set_title(title, fontsize=14, fontweight='bold', color='#1e293b', pad=15)
+    
+    # Add vertical lines for reference
+    for x in [20, 40, 60, 80]:
+        ax.axvline(x=x, color='#cbd5e1', linestyle='--', linewidth=0.5, alpha=0.7)
+    
+    # Clean up
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_color('#e2e8f0')
+    ax.spines['left'].set_color('#e2e8f0')
+    
+    plt.tight_layout()
+    
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+@cached_chart("gap_pie", CHART_STYLE)
+def create_gap_pie_chart(ct_gaps, ga_gaps):
+    """Create a pie chart showing gap distribution by risk level"""
+    plt = _pyplot()
+    # Count gaps by risk level
+    critical = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'critical'])
+    high = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'high'])
+    medium = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'medium'])
+    
+    if critical + high + medium == 0:
+        # No gaps - create a "No Gaps" chart
+        fig, ax = plt.subplots(figsize=(6, 6))
+        ax.text(0.5, 0.5, 'No Gaps\nIdentified', ha='center', va='center', 
+                fontsize=20, fontweight='bold', color='#059669', transform=ax.transAxes)
+        ax.axis('off')
+    else:
+        fig, ax = plt.subplots(figsize=(8, 6))
+        
+        sizes = [critical, high, medium]
+        labels = [f'Critical\n({critical})', f'High\n({high})', f'Medium\n({medium})']
+        colors_pie = ['#DC2626', '#EA580C', '#D97706']
+        explode = (0.05, 0.02, 0)
+        
+        # Filter out zero values
+        non_zero = [(s, l, c, e) for s, l, c, e in zip(sizes, labels, colors_pie, explode) if s > 0]
+        if non_zero:
+            sizes, labels, colors_pie, explode = zip(*non_zero)
+            
+            wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors_pie, 
+                                               explode=explode, autopct='%1.0f%%',
+                                               shadow=True, startangle=90,
+                                               textprops={'fontsize': 11, 'fontweight': 'bold'})
+            
+            for autotext in autotexts:
+                autotext.set_color('white')
+                autotext.set_fontweight('bold')
+        
+        ax.set_title('Gap Distribution by Risk Level', fontsize=14, fontweight='bold', 
+                    color='#1e293b', pad=20)
+    
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+@cached_chart("industry_comparison", CHART_STYLE)
+def create_industry_comparison_chart(combined_score, benchmarks, current_industry):
+    """Create a bar chart comparing score against industry benchmarks"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    industries = [b['name'] for b in benchmarks.values()]
+    averages = [b['avg'] for b in benchmarks.values()]
+    top_performers = [b['top'] for b in benchmarks.values()]
+    
+    x = np.arange(len(industries))
+    width = 0.35
+    
+    # Create bars
+    bars1 = ax.bar(x - width/2, averages, width, label='Industry Average', 
+                   color='#94a3b8', alpha=0.7)
+    bars2 = ax.bar(x + width/2, top_performers, width, label='Top Performers', 
+                   color='#64748b', alpha=0.7)
+    
+    # Add your score line
+    ax.axhline(y=combined_score, color='#0284c7', linestyle='-', linewidth=3, 
+               label=f'Your Score ({combined_score:.0f}%)')
+    
+    # Highlight current industry
+    current_idx = list(benchmarks.keys()).index(current_industry)
+    bars1[current_idx].set_color('#0284c7')
+    bars1[current_idx].set_alpha(1.0)
+    bars2[current_idx].set_color('#0369a1')
+    bars2[current_idx].set_alpha(1.0)
+    
+    ax.set_ylabel('Score (%)', fontsize=11, color='#64748b')
+    ax.set_title('Industry Benchmark Comparison', fontsize=14, fontweight='bold', 
+                color='#1e293b', pad=15)
+    ax.set_xticks(x)
+    ax.set_xticklabels(industries, rotation=25, ha='right', fontsize=9)
+    ax.legend(loc='upper right', fontsize=9)
+    ax.set_ylim(0, 100)
+    
+    # Add value labels on bars
+    for bar in bars1:
+        height = bar.get_height()
+        ax.annotate(f'{height:.0f}%', xy=(bar.get_x() + bar.get_width() / 2, height),
+                   xytext=(0, 3), textcoords="offset points", ha='center', va='bottom', 
+                   fontsize=8, color='#64748b')
+    
+    # Clean up
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_color('#e2e8f0')
+    ax.spines['left'].set_color('#e2e8f0')
+    ax.yaxis.grid(True, linestyle='--', alpha=0.3)
+    
+    plt.tight_layout()
+    
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+@cached_chart("maturity_roadmap", CHART_STYLE)
+def create_maturity_roadmap_chart():
+    """Create a visual roadmap showing maturity phases"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(12, 5))
+    
+    phases = ['Phase 1\nFoundation', 'Phase 2\nStandardization', 
+              'Phase 3\nOptimization', 'Phase 4\nExcellence']
+    timelines = ['0-3 months', '3-6 months', '6-12 months', '12+ months']
+    colors_phases = ['#DC2626', '#D97706', '#65A30D', '#059669']
+    
+    # Draw timeline
+    ax.axhline(y=0.5, color='#e2e8f0', linewidth=8, zorder=1)
+    
+    for i, (phase, timeline, color) in enumerate(zip(phases, timelines, colors_phases)):
+        # Phase circles
+        circle = plt.Circle((i * 2 + 1, 0.5), 0.4, color=color, zorder=2)
+        ax.add_patch(circle)
+        
+        # Phase number
+        ax.text(i * 2 + 1, 0.5, str(i + 1), ha='center', va='center', 
+                fontsize=16, fontweight='bold', color='white', zorder=3)
+        
+        # Phase name
+        ax.text(i * 2 + 1, 1.1, phase, ha='center', va='center', 
+                fontsize=11, fontweight='bold', color='#1e293b')
+        
+        # Timeline
+        ax.text(i * 2 + 1, -0.1, timeline, ha='center', va='center', 
+                fontsize=9, color='#64748b')
+        
+        # Connect circles
+        if i < len(phases) - 1:
+            ax.annotate('', xy=(i * 2 + 2.6, 0.5), xytext=(i * 2 + 1.4, 0.5),
+                       arrowprops=dict(arrowstyle='->', color=color, lw=2))
+    
+    ax.set_xlim(-0.5, 8)
+    ax.set_ylim(-0.5, 1.5)
+    ax.axis('off')
+    ax.set_title('Maturity Improvement Roadmap', fontsize=14, fontweight='bold', 
+                color='#1e293b', pad=20)
+    
+    plt.tight_layout()
+    
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+@cached_chart("score_comparison", CHART_STYLE)
+def create_score_comparison_bars(ct_score, ga_score, combined, benchmark):
+    """Create a clean horizontal comparison bar chart"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 4))
+    
+    categories = ['Control Tower', 'Golden Architecture', 'Combined Score', f'Industry Benchmark']
+    values = [ct_score, ga_score, combined, benchmark]
+    colors_bars = ['#0284c7', '#7c3aed', '#059669', '#f59e0b']
+    
+    y_pos = np.arange(len(categories))
+    
+    # Background bars
+    ax.barh(y_pos, [100] * len(categories), color='#f1f5f9', height=0.6)
+    
+    # Score bars
+    bars = ax.barh(y_pos, values, color=colors_bars, height=0.6, alpha=0.9)
+    
+    # Add value labels
+    for bar, val in zip(bars, values):
+        ax.text(val + 2, bar.get_y() + bar.get_height()/2, f'{val:.0f}%', 
+                va='center', ha='left', fontsize=12, fontweight='bold', color='#1e293b')
+    
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(categories, fontsize=11, fontweight='bold')
+    ax.set_xlim(0, 115)
+    ax.set_xlabel('Score (%)', fontsize=10, color='#64748b')
+    ax.set_title('Assessment Score Overview', fontsize=14, fontweight='bold', 
+                color='#1e293b', pad=15)
+    
+    # Reference lines
+    for x, label in [(40, 'Developing'), (60, 'Managed'), (80, 'Optimized')]:
+        ax.axvline(x=x, color='#cbd5e1', linestyle='--', linewidth=1, alpha=0.7)
+        ax.text(x, len(categories) - 0.3, label, fontsize=8, color='#94a3b8', 
+                ha='center', va='bottom')
+    
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_color('#e2e8f0')
+    ax.spines['left'].set_color('#e2e8f0')
+    
+    plt.tight_layout()
+    
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_STYLE['dpi'], bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    plt.close(fig)
+    buf.seek(0)
+    return buf
+
+# =============================================================================
+# PARALLEL PRE-RENDER STAGE
+# =============================================================================
+
+def _warm_worker():
+    """Pay the matplotlib import once per worker instead of on its first chart"""
+    _pyplot()
+
+
+def _render_chart(func_name: str, args: tuple) -> bytes:
+    """Worker entry point - render one chart by name, bypassing the (per-process) cache"""
+    return globals()[func_name].uncached(*args).getvalue()
+
+
+# REPORT_CHART_WORKERS overrides the default of one worker per core (max 4)
+_chart_pool = SpawnPool("REPORT_CHART_WORKERS", initializer=_warm_worker)
+
+
+def _render_inline(func, args):
+    try:
+        return func.uncached(*args).getvalue()
+    except Exception:
+        return None
+
+
+def plan_report_charts(ct_scores, ga_scores, combined, bench, ct_gaps, ga_gaps, benchmarks, industry) -> dict:
+    """Every chart generate_pdf_report embeds, as {name: (chart function, args)}"""
+    plan = {
+        "score_gauges": (create_score_gauges, (ct_scores["overall"], ga_scores["overall"], combined, bench["avg"])),
+        "score_comparison": (create_score_comparison_bars, (ct_scores["overall"], ga_scores["overall"], combined, bench["avg"])),
+        "gap_pie": (create_gap_pie_chart, (ct_gaps, ga_gaps)),
+        "industry_comparison": (create_industry_comparison_chart, (combined, benchmarks, industry)),
+        "maturity_roadmap": (create_maturity_roadmap_chart, ()),
+    }
+    if ct_scores["total_answered"] > 0:
+        plan["ct_radar"] = (create_radar_chart, (ct_scores["domains"], "Control Tower Domain Maturity", '#0284c7'))
+        plan["ct_bar"] = (create_horizontal_bar_chart, (ct_scores["domains"], "Control Tower Domain Scores", '#0284c7'))
+    if ga_scores["total_answered"] > 0:
+        plan["ga_radar"] = (create_radar_chart, (ga_scores["domains"], "Golden Architecture Domain Maturity", '#7c3aed'))
+        plan["ga_bar"] = (create_horizontal_bar_chart, (ga_scores["domains"], "Golden Architecture Domain Scores", '#7c3aed'))
+    return plan
+
+
+@timed("report_charts")
+def render_report_charts(plan: dict) -> dict:
+    """Render a chart plan to {name: PNG bytes or None}; cache misses render concurrently"""
+    results, misses = {}, {}
+    for name, (func, args) in plan.items():
+        key = func.cache_key(*args)
+        data = chart_cache.get(key)
+        if data is not None:
+            results[name] = data
+        else:
+            misses[name] = (func, args, key)
+
+    pending = {}
+    if len(misses) > 1 and _chart_pool.workers() > 1:
+        try:
+            pool = _chart_pool.get()
+            pending = {name: pool.submit(_render_chart, func.__name__, args)
+                       for name, (func, args, _) in misses.items()}
+        except (BrokenProcessPool, OSError, RuntimeError):
+            pending = {}
+
+    for name, (func, args, key) in misses.items():
+        try:
+            data = pending[name].result() if name in pending else func.uncached(*args).getvalue()
+        except BrokenProcessPool:
+            _chart_pool.reset()
+            data = _render_inline(func, args)
+        except Exception:
+            data = None  # Report skips charts that fail to render
+        if data is not None:
+            chart_cache.put(key, data)
+        results[name] = data
+    return results
+
@@ -0,0 +1,141 @@
+"""
+AWS Enterprise Assessment Platform - Background Report Jobs
+Runs PDF builds on a bounded worker pool so the Streamlit script thread never
+blocks on doc.build(). Jobs report progress per report section and are
+polled by id until the finished bytes are ready.
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Progress checkpoints emitted by generate_pdf_report, in build order
+REPORT_SECTIONS = [
+    ("charts", "Rendering charts"),
+    ("cover", "Cover page"),
+    ("executive_summary", "Executive summary"),
+    ("methodology", "Methodology"),
+    ("score_analysis", "Overall score analysis"),
+    ("ct_details", "Control Tower details"),
+    ("ga_details", "Golden Architecture details"),
+    ("gap_analysis", "Gap analysis"),
+    ("benchmark", "Industry benchmark"),
+    ("roadmap", "Maturity roadmap"),
+    ("recommendations", "Recommendations"),
+    ("risk", "Risk assessment"),
+    ("ai_analysis", "AI analysis"),
+    ("appendices", "Appendices"),
+    ("build", "Laying out PDF"),
+]
+SECTION_LABELS = dict(REPORT_SECTIONS)
+SECTION_ORDER = [key for key, _ in REPORT_SECTIONS]
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when the per-container backlog of report builds is exhausted"""
+
+
+class ReportJob:
+    """State of one background build; mutated only by the worker thread
+
+    status changes last, so a finished job always has finished_at (and result or error) set.
+    """
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = "queued"  # queued -> running -> done | failed
+        self.section = None
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == "done":
+            return 1.0
+        if self.section not in SECTION_ORDER:
+            return 0.0
+        return SECTION_ORDER.index(self.section) / len(SECTION_ORDER)
+
+    @property
+    def section_label(self) -> str:
+        return SECTION_LABELS.get(self.section, "Waiting for a free worker")
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+
+class ReportJobManager:
+    """Bounded pool of report builders shared by every session in the process"""
+
+    def __init__(self, max_concurrent: int = 2, max_pending: int = 16, retention_seconds: int = 1800):
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="pdf-report")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, build_fn, *args, **kwargs) -> str:
+        """Queue build_fn(*args, progress=..., **kwargs) and return the job id"""
+        with self._lock:
+            self._prune()
+            active = sum(1 for job in self._jobs.values() if not job.finished)
+            if active >= self.max_concurrent + self.max_pending:
+                raise JobQueueFull(f"{active} report builds already queued on this server")
+            job = ReportJob(uuid.uuid4().hex)
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, build_fn, args, kwargs)
+        return job.id
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def discard(self, job_id: str):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _run(self, job: ReportJob, build_fn, args, kwargs):
+        with self._lock:
+            job.started_at = time.time()
+            job.status = "running"
+
+        def progress(section: str):
+            job.section = section
+
+        try:
+            result, error, status = build_fn(*args, progress=progress, **kwargs), None, "done"
+        except Exception as e:
+            result, error, status = None, str(e), "failed"
+        with self._lock:
+            job.result = result
+            job.error = error
+            job.finished_at = time.time()
+            job.status = status
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        for job_id in [jid for jid, job in self._jobs.items() if job.finished and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_report_jobs() -> ReportJobManager:
+    """Process-wide manager; MAX_CONCURRENT_PDF_BUILDS caps builds per container"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ReportJobManager(
+                max_concurrent=int(os.environ.get("MAX_CONCURRENT_PDF_BUILDS", "2")),
+                max_pending=int(os.environ.get("MAX_QUEUED_PDF_BUILDS", "16")),
+            )
+        return _manager
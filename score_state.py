@@ -0,0 +1,130 @@
+"""
+Incremental Score State
+Keeps running per-domain totals, answered counts and the gap set for one
+question catalog so a single response change is an O(1) update instead of a
+rescan of every question. Results match calc_scores / find_gaps exactly.
+"""
+
+from catalog_index import index_for
+from instrumentation import timed
+
+GAP_THRESHOLD = 2
+RISK_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+class ScoreState:
+    """Live scores for one assessment; owns (and mutates) its responses dict
+
+    on_change(qid, value), if set, is told about every answer set / cleared (value None)
+    through set, clear and reset, e.g. to feed a write-behind buffer. load does not notify.
+    """
+
+    def __init__(self, domains: dict, responses: dict = None):
+        self.domains = domains
+        self.index = index_for(domains)
+        self.total_questions = len(self.index)
+        self.on_change = None
+        self.load({} if responses is None else responses)
+
+    def load(self, responses: dict):
+        """Adopt responses (kept by reference) and rebuild the running totals once"""
+        self.responses = responses
+        self.totals = {dname: 0 for dname in self.domains}
+        self.answered = {dname: 0 for dname in self.domains}
+        self._gaps = {}
+        self._scores = None
+        self._gap_list = None
+        for qid, value in responses.items():
+            self._apply(qid, value, 1)
+
+    def _apply(self, qid: str, value: int, sign: int):
+        if qid not in self.index:
+            return
+        dname = self.index.domain_of[qid]
+        q = self.index.questions[qid]
+        self.totals[dname] += sign * value
+        self.answered[dname] += sign
+        if sign < 0:
+            self._gaps.pop(qid, None)
+        elif value <= GAP_THRESHOLD:
+            self._gaps[qid] = (self.index.position[qid], {
+                "id": qid,
+                "domain": dname,
+                "question": q["question"],
+                "context": q.get("context", ""),
+                "score": value,
+                "risk": q["risk"]
+            })
+
+    def set(self, qid: str, value: int):
+        """Record (or change) one answer"""
+        old = self.responses.get(qid)
+        if old == value:
+            return
+        if old is not None:
+            self._apply(qid, old, -1)
+        self.responses[qid] = value
+        self._apply(qid, value, 1)
+        self._scores = self._gap_list = None
+        if self.on_change is not None:
+            self.on_change(qid, value)
+
+    def clear(self, qid: str):
+        """Mark one question as not yet assessed"""
+        old = self.responses.pop(qid, None)
+        if old is not None:
+            self._apply(qid, old, -1)
+            self._scores = self._gap_list = None
+            if self.on_change is not None:
+                self.on_change(qid, None)
+
+    def reset(self):
+        cleared = list(self.responses) if self.on_change is not None else ()
+        self.responses.clear()
+        self.load(self.responses)
+        for qid in cleared:
+            self.on_change(qid, None)
+
+    @property
+    def total_answered(self) -> int:
+        return len(self.responses)
+
+    def domain_answered(self, dname: str) -> int:
+        return self.answered[dname]
+
+    @timed("score_state_scores")
+    def scores(self) -> dict:
+        """calc_scores-shaped result, derived from the running totals (O(domains))"""
+        if self._scores is not None:
+            return self._scores
+        if not self.responses:
+            self._scores = {"overall": 0, "domains": {}, "total_answered": 0, "total_questions": self.total_questions}
+            return self._scores
+
+        domain_scores = {}
+        for dname, ddata in self.domains.items():
+            answered = self.answered[dname]
+            domain_scores[dname] = {
+                "score": (self.totals[dname] / (answered * 5) * 100) if answered > 0 else 0,
+                "answered": answered,
+                "total": len(ddata["questions"]),
+                "weight": ddata["weight"]
+            }
+
+        weighted_sum = sum(d["score"] * d["weight"] for d in domain_scores.values() if d["answered"] > 0)
+        weight_sum = sum(d["weight"] for d in domain_scores.values() if d["answered"] > 0)
+        self._scores = {
+            "overall": weighted_sum / weight_sum if weight_sum > 0 else 0,
+            "domains": domain_scores,
+            "total_answered": sum(d["answered"] for d in domain_scores.values()),
+            "total_questions": self.total_questions
+        }
+        return self._scores
+
+    def gaps(self) -> list:
+        """find_gaps-ordered gap list; only the (small) gap set is sorted, and only after a change"""
+        if self._gap_list is None:
+            ordered = sorted(self._gaps.values(), key=lambda item: (
+                RISK_ORDER.get(item[1]["risk"], 3), -item[1]["score"], item[0]))
+            self._gap_list = [gap for _, gap in ordered]
+        return self._gap_list
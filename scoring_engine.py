@@ -0,0 +1,101 @@
+"""
+Vectorized Scoring Engine
+Compiles a question catalog (CT_QUESTIONS / GA_QUESTIONS shape) into NumPy
+index arrays once, then scores whole matrices of assessments in one call.
+"""
+
+import numpy as np
+
+
+def combined_scores(ct_overall: np.ndarray, ga_overall: np.ndarray) -> tuple:
+    """Vectorized calc_combined: (mean of CT and GA, mask of rows where either has a score);
+    combined is 0 where neither does"""
+    assessed = (ct_overall > 0) | (ga_overall > 0)
+    return np.where(assessed, (ct_overall + ga_overall) / 2, 0.0), assessed
+
+
+class ScoringEngine:
+    """Batched equivalent of calc_scores for a single question catalog"""
+
+    def __init__(self, domains: dict):
+        self.domain_names = list(domains.keys())
+        self.question_ids = []
+        question_domain = []
+        for d_idx, ddata in enumerate(domains.values()):
+            for q in ddata["questions"]:
+                self.question_ids.append(q["id"])
+                question_domain.append(d_idx)
+
+        self.question_index = {qid: i for i, qid in enumerate(self.question_ids)}
+        self.question_domain = np.asarray(question_domain, dtype=np.intp)
+        self.domain_weights = np.asarray([d["weight"] for d in domains.values()], dtype=np.float64)
+        self.domain_totals = np.bincount(self.question_domain, minlength=len(self.domain_names))
+
+        # One-hot (question x domain) membership so per-domain sums are a single matmul
+        self.membership = np.zeros((len(self.question_ids), len(self.domain_names)), dtype=np.int64)
+        self.membership[np.arange(len(self.question_ids)), self.question_domain] = 1
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.question_ids)
+
+    def to_matrix(self, responses_list: list) -> np.ndarray:
+        """Pack response dicts into an (assessments x questions) matrix, 0 = not answered"""
+        matrix = np.zeros((len(responses_list), len(self.question_ids)), dtype=np.int64)
+        for row, responses in enumerate(responses_list):
+            for qid, value in responses.items():
+                col = self.question_index.get(qid)
+                if col is not None:
+                    matrix[row, col] = value
+        return matrix
+
+    def score_matrix(self, matrix: np.ndarray) -> dict:
+        """Score a response matrix; every result is an array with one row per assessment"""
+        matrix = np.asarray(matrix, dtype=np.int64)
+        totals = matrix @ self.membership
+        answered = (matrix > 0).astype(np.int64) @ self.membership
+
+        domain_scores = np.zeros(totals.shape, dtype=np.float64)
+        np.divide(totals, answered * 5, out=domain_scores, where=answered > 0)
+        domain_scores *= 100
+
+        # Weighted overall only counts domains with at least one answer (calc_scores semantics)
+        active_weights = np.where(answered > 0, self.domain_weights, 0.0)
+        weight_sum = active_weights.sum(axis=1)
+        weighted_sum = (domain_scores * active_weights).sum(axis=1)
+        overall = np.zeros(len(matrix), dtype=np.float64)
+        np.divide(weighted_sum, weight_sum, out=overall, where=weight_sum > 0)
+
+        return {
+            "overall": overall,
+            "domain_scores": domain_scores,
+            "answered": answered,
+            "total_answered": answered.sum(axis=1),
+            # Plain weighted sum over all domains (calculate_overall_score semantics in app.py)
+            "weighted_total": domain_scores @ self.domain_weights,
+        }
+
+    def score_batch(self, responses_list: list) -> list:
+        """Score many response dicts, returning calc_scores-shaped results"""
+        result = self.score_matrix(self.to_matrix(responses_list))
+        scored = []
+        for row, responses in enumerate(responses_list):
+            if not responses:
+                scored.append({"overall": 0, "domains": {}, "total_answered": 0,
+                               "total_questions": self.total_questions})
+                continue
+            domains = {}
+            for d_idx, dname in enumerate(self.domain_names):
+                domains[dname] = {
+                    "score": float(result["domain_scores"][row, d_idx]),
+                    "answered": int(result["answered"][row, d_idx]),
+                    "total": int(self.domain_totals[d_idx]),
+                    "weight": float(self.domain_weights[d_idx]),
+                }
+            scored.append({
+                "overall": float(result["overall"][row]),
+                "domains": domains,
+                "total_answered": int(result["total_answered"][row]),
+                "total_questions": self.total_questions,
+            })
+        return scored
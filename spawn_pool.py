@@ -0,0 +1,45 @@
+"""
+Spawn Process Pools
+Lazily created, long-lived ProcessPoolExecutors for CPU-bound work (report
+charts, document extraction). Workers are started with the spawn context so
+the threaded Streamlit server is never forked, and a pool broken by a dead
+worker can be reset and recreated on next use.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+
+class SpawnPool:
+    """One process pool per use, sized by the workers_env variable (default one per core, max 4)"""
+
+    def __init__(self, workers_env: str, initializer=None):
+        self.workers_env = workers_env
+        self.initializer = initializer
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def workers(self) -> int:
+        configured = os.environ.get(self.workers_env)
+        if configured:
+            return max(1, int(configured))
+        return min(4, os.cpu_count() or 1)
+
+    def get(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self.initializer,
+                )
+            return self._pool
+
+    def reset(self):
+        """Drop a broken pool without waiting on it; the next get() starts a fresh one"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
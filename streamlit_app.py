@@ -8,30 +8,31 @@ import streamlit as st
 import json
 import os
 import io
-import numpy as np
+import re
+import secrets
+import functools
+import hashlib
+import logging
+import statistics
+import time
 from datetime import datetime
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    PageBreak, Image, ListFlowable, ListItem, KeepTogether
+from content_cache import cached_figure, chart_cache, content_key, figure_cache, section_cache
+from assessment_core import (
+    WA_PILLARS, BENCHMARKS, NOT_ANSWERED, CT_QUESTIONS, GA_QUESTIONS,
+    count_questions, calc_scores, calc_combined,
+    get_maturity, find_gaps
 )
-from reportlab.graphics.shapes import Drawing, Rect, String, Line
-from reportlab.graphics.charts.piecharts import Pie
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.pdfgen import canvas
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, Circle, Wedge
-from matplotlib.collections import PatchCollection
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+from report_charts import plan_report_charts, render_report_charts
+from report_jobs import JobQueueFull, get_report_jobs
+from ai_cache import get_ai_cache
+from score_state import ScoreState
+from assessment_store import autosave_metrics, autosave_session, load_all_assessments, load_assessment, record_change
+from portfolio import aggregate_portfolio
+from benchmark_engine import get_benchmark_engine
+from ai_client import create_message, generate_many, max_concurrency, stream_text
+from answer_prefill import suggest_answers
+from document_extraction import extraction_cache, finished_result, submit_extraction
+from instrumentation import register_caches, start_metrics_server, timed, timer
 
 st.set_page_config(
     page_title="AWS Enterprise Assessment Platform",
@@ -573,569 +574,6 @@ div[data-testid="stExpander"] details summary:hover {
 </style>
 """, unsafe_allow_html=True)
 
-# =============================================================================
-# CONSTANTS
-# =============================================================================
-WA_PILLARS = {
-    "SEC": "Security",
-    "REL": "Reliability",
-    "PERF": "Performance Efficiency",
-    "COST": "Cost Optimization",
-    "OPS": "Operational Excellence",
-    "SUS": "Sustainability"
-}
-
-BENCHMARKS = {
-    "financial": {"name": "Financial Services", "avg": 72, "top": 88},
-    "healthcare": {"name": "Healthcare & Life Sciences", "avg": 65, "top": 82},
-    "technology": {"name": "Technology & Software", "avg": 78, "top": 92},
-    "retail": {"name": "Retail & E-Commerce", "avg": 62, "top": 78},
-    "government": {"name": "Government & Public Sector", "avg": 58, "top": 75},
-    "manufacturing": {"name": "Manufacturing & Industrial", "avg": 55, "top": 72}
-}
-
-NOT_ANSWERED = "⊘ Not yet assessed"
-
-# =============================================================================
-# CONTROL TOWER ASSESSMENT - 12 DOMAINS, 75+ QUESTIONS
-# =============================================================================
-CT_QUESTIONS = {
-    "Organizational Strategy & Governance": {
-        "weight": 0.10, "pillars": ["OPS", "SEC"],
-        "description": "Multi-account strategy, governance frameworks, and organizational readiness for Control Tower.",
-        "questions": [
-            {"id": "CT-ORG-001", "question": "What is your current AWS multi-account strategy maturity level?",
-             "context": "A well-defined multi-account strategy is fundamental for Control Tower success. AWS recommends separating workloads by function, compliance requirements, and SDLC stages.",
-             "risk": "critical", "options": ["No strategy - single account or ad-hoc creation", "Basic dev/prod separation without formal design", "Documented OU hierarchy aligned with AWS best practices", "Comprehensive workload isolation with dedicated shared services accounts", "Mature automated lifecycle with self-service and CMDB integration"]},
-            {"id": "CT-ORG-002", "question": "How well-documented and enforced is your Organizational Unit (OU) structure?",
-             "context": "Control Tower relies on OU structure for policy inheritance and guardrail application. Poor OU design leads to security gaps and operational complexity.",
-             "risk": "high", "options": ["No OU structure - all accounts at root", "Basic OUs without inheritance strategy", "SDLC-aligned OUs with policy differentiation", "Nested hierarchy with Security, Infrastructure, Workloads OUs", "Enterprise architecture with business unit separation and automation"]},
-            {"id": "CT-ORG-003", "question": "What cloud governance bodies and decision-making frameworks exist?",
-             "context": "Effective Control Tower adoption requires clear governance for policy decisions, exception handling, and cross-functional coordination.",
-             "risk": "high", "options": ["No formal governance - ad-hoc decisions", "IT-led decisions without stakeholder input", "Emerging CCoE with key team representatives", "Mature CCoE with RACI, escalation paths, multi-team representation", "Federated governance with self-service and executive sponsorship"]},
-            {"id": "CT-ORG-004", "question": "How are cloud security and compliance policies documented and maintained?",
-             "context": "Control Tower guardrails enforce policies, but organizations need clear documentation mapping business requirements to technical controls.",
-             "risk": "high", "options": ["No documented policies - tribal knowledge only", "Informal wiki/SharePoint rarely updated", "Formal policies with annual review cycle", "Policies in GRC platform linked to guardrails", "Policy-as-Code in version control with drift detection"]},
-            {"id": "CT-ORG-005", "question": "What is your process for managing policy exceptions and guardrail deviations?",
-             "context": "Even with strong guardrails, legitimate business needs may require exceptions. Without formal process, exceptions become permanent security debt.",
-             "risk": "medium", "options": ["No process - guardrails bypassed without approval", "Ad-hoc email/Slack approvals without tracking", "Documented process with tracking spreadsheet", "Workflow automation with approval chains and reminders", "Risk-based automation with self-service and auto-expiration"]},
-            {"id": "CT-ORG-006", "question": "How is account ownership and accountability managed across the organization?",
-             "context": "Clear ownership ensures security accountability, cost management, and operational support at scale when managing hundreds of accounts.",
-             "risk": "medium", "options": ["No ownership model - accounts orphaned", "Informal assignments tracked manually", "Documented ownership in spreadsheet/wiki", "CMDB-tracked with regular validation", "Automated HR integration with lifecycle management"]},
-        ]
-    },
-    "Account Factory & Provisioning": {
-        "weight": 0.09, "pillars": ["OPS", "SEC", "REL"],
-        "description": "Account provisioning automation, baseline configurations, and Infrastructure as Code maturity.",
-        "questions": [
-            {"id": "CT-ACC-001", "question": "How are new AWS accounts currently provisioned?",
-             "context": "Control Tower Account Factory provides automated, governed provisioning. Organizations with manual processes benefit most but need change management.",
-             "risk": "high", "options": ["Manual console creation without templates", "CLI scripts with manual baseline configuration", "Semi-automated IaC with manual steps required", "Service Catalog products with approval workflows", "Account Factory for Terraform with GitOps workflow"]},
-            {"id": "CT-ACC-002", "question": "What is your average time from account request to production-ready?",
-             "context": "Provisioning speed directly impacts developer productivity. Control Tower with AFT can achieve under 4 hours.",
-             "risk": "medium", "options": ["2+ weeks with multiple approval chains", "1-2 weeks with significant manual work", "3-5 business days with manual validation", "1-2 business days with minimal gates", "Under 4 hours with full automation"]},
-            {"id": "CT-ACC-003", "question": "What baseline security configurations are automatically applied?",
-             "context": "Account baselines are critical for security posture. Control Tower applies foundational baselines but organizations need additional customizations.",
-             "risk": "critical", "options": ["No baselines - teams configure independently", "Basic security (password policy, IAM roles)", "Security baseline (CloudTrail, Config, GuardDuty, Security Hub)", "Comprehensive (security + networking + logging + cost controls)", "Full enterprise baseline with compliance controls and integrations"]},
-            {"id": "CT-ACC-004", "question": "How is configuration drift from baselines detected and remediated?",
-             "context": "Without automated detection, baseline configurations degrade over time. Auto-remediation reduces operational burden.",
-             "risk": "high", "options": ["No detection - discovered during audits only", "Manual periodic reviews", "Config rules with alerting for manual remediation", "Automated detection with prioritized queue and SLAs", "Auto-remediation with preventive SCPs"]},
-            {"id": "CT-ACC-005", "question": "What Infrastructure as Code approach manages account baselines?",
-             "context": "IaC enables version-controlled, repeatable infrastructure. AFT uses Terraform while alternatives include CloudFormation StackSets.",
-             "risk": "medium", "options": ["No IaC - manual console configuration", "Partial IaC with significant manual work", "CloudFormation StackSets with manual updates", "Terraform with remote state and basic CI/CD", "GitOps with AFT, automated testing, PR-based deployments"]},
-            {"id": "CT-ACC-006", "question": "How is the account request and approval workflow managed?",
-             "context": "Well-defined request workflows ensure governance while enabling agility. Integration with ITSM provides audit trails.",
-             "risk": "medium", "options": ["No process - requests via email/ad-hoc", "Basic ticketing with manual routing", "ITSM workflow with defined approvers and SLAs", "Automated routing based on request type", "Self-service portal with pre-approved patterns"]},
-        ]
-    },
-    "Guardrails & Service Control Policies": {
-        "weight": 0.12, "pillars": ["SEC", "OPS"],
-        "description": "SCP implementation, Control Tower guardrail strategy, and preventive control maturity.",
-        "questions": [
-            {"id": "CT-GRD-001", "question": "What is your current Service Control Policy (SCP) implementation maturity?",
-             "context": "SCPs are the primary mechanism for preventive guardrails. Control Tower deploys mandatory SCPs but organizations need custom policies.",
-             "risk": "critical", "options": ["No SCPs beyond default FullAWSAccess", "Basic deny policies (root usage, leave organization)", "Security guardrails (region restriction, service protection)", "Comprehensive OU-specific with documented exceptions", "Enterprise SCP framework with version control and CI/CD testing"]},
-            {"id": "CT-GRD-002", "question": "How are SCPs tested before production deployment?",
-             "context": "SCP mistakes can cause organization-wide outages. Testing in sandbox OUs and using Policy Simulator are essential.",
-             "risk": "high", "options": ["Direct deployment without testing", "Manual peer review only", "Sandbox OU testing before deployment", "Policy Simulator plus sandbox with test cases", "CI/CD pipeline with syntax checking and gradual rollout"]},
-            {"id": "CT-GRD-003", "question": "What categories of controls are enforced through SCPs?",
-             "context": "SCPs can enforce security, compliance, cost control, and operational standards across the organization.",
-             "risk": "high", "options": ["None or allow-all only", "Region and basic service restrictions", "Comprehensive security controls and encryption requirements", "Security + compliance + cost controls", "Full coverage including network, tagging, and resource configuration"]},
-            {"id": "CT-GRD-004", "question": "What is your strategy for enabling Control Tower guardrails?",
-             "context": "Control Tower provides mandatory, strongly recommended, and elective guardrails. The appropriate mix depends on risk tolerance.",
-             "risk": "high", "options": ["Mandatory guardrails only", "Mandatory plus select strongly recommended", "All strongly recommended across all OUs", "Selective elective based on risk assessment", "Comprehensive plus custom controls for organization needs"]},
-            {"id": "CT-GRD-005", "question": "How are guardrail violations detected and remediated?",
-             "context": "Detective guardrails identify non-compliant resources. Organizations need processes to handle violations with proper SLAs.",
-             "risk": "high", "options": ["No monitoring - discovered during audits", "Periodic manual dashboard review", "Automated alerting with severity prioritization", "Ticketing integration with SLAs and escalation", "Auto-remediation with exception workflow"]},
-            {"id": "CT-GRD-006", "question": "How is SCP versioning and change history managed?",
-             "context": "SCPs require change management and rollback capabilities. Version control enables audit trails and recovery.",
-             "risk": "medium", "options": ["No versioning - direct edits", "Manual documentation of changes", "Git-based version control", "Full change history with rollback capability", "GitOps with automated deployment and testing"]},
-            {"id": "CT-GRD-007", "question": "What approach exists for custom Control Tower controls?",
-             "context": "AWS-provided guardrails cover common requirements but organizations often have custom needs for industry regulations.",
-             "risk": "medium", "options": ["No custom controls planned", "Future consideration without plan", "Requirements documented without implementation", "Key custom controls via Config rules", "Comprehensive custom framework with CI/CD"]},
-        ]
-    },
-    "Detective Controls & Compliance": {
-        "weight": 0.10, "pillars": ["SEC", "OPS"],
-        "description": "AWS Config, Security Hub, compliance framework alignment, and evidence collection.",
-        "questions": [
-            {"id": "CT-DET-001", "question": "What is your AWS Config deployment and rule coverage?",
-             "context": "AWS Config is foundational for Control Tower detective controls, recording configurations and enabling compliance assessment.",
-             "risk": "critical", "options": ["Not enabled or few accounts only", "Partial deployment without aggregation", "Organization-wide via Control Tower with basic aggregator", "Aggregator plus custom rules for organization needs", "Conformance packs with auto-remediation"]},
-            {"id": "CT-DET-002", "question": "How is AWS Config data aggregated and analyzed?",
-             "context": "Centralized Config aggregation is essential for organization-wide visibility. Delegated administrator reduces management account usage.",
-             "risk": "high", "options": ["No aggregation - data in individual accounts", "Manual periodic collection", "Organization aggregator in management account", "Delegated administrator with advanced queries", "Analytics platform with ML anomaly detection"]},
-            {"id": "CT-DET-003", "question": "What is your AWS Security Hub deployment status?",
-             "context": "Security Hub aggregates findings from AWS services and third-party tools. It's the primary dashboard for security posture.",
-             "risk": "critical", "options": ["Not enabled or few accounts", "Partial deployment without aggregation", "Organization-wide with AWS Foundational Security", "Multiple standards (FSBP, CIS, PCI-DSS)", "Custom insights plus third-party integrations"]},
-            {"id": "CT-DET-004", "question": "How are Security Hub findings triaged and remediated?",
-             "context": "Without proper triage, teams become overwhelmed and critical findings get missed. Integration with ticketing enables tracking.",
-             "risk": "high", "options": ["No triage - console checked during audits", "Periodic manual review", "Automated alerting for critical findings", "Ticketing integration with SLAs by severity", "Auto-remediation with exception workflow"]},
-            {"id": "CT-DET-005", "question": "What compliance frameworks apply to your AWS environment?",
-             "context": "Compliance requirements drive guardrail selection, evidence collection, and audit processes.",
-             "risk": "critical", "options": ["None - internal policies only", "Internal security policies without certification", "Single framework (e.g., SOC 2)", "Multiple frameworks with mapped controls", "Complex multi-framework with automated mapping"]},
-            {"id": "CT-DET-006", "question": "How is compliance evidence collected for audits?",
-             "context": "Auditors require evidence of control effectiveness. Manual collection is time-consuming. AWS Audit Manager automates collection.",
-             "risk": "high", "options": ["Ad-hoc during audits", "Manual screenshots in shared drives", "Periodic exports with organized repository", "AWS Audit Manager with assessment reports", "GRC platform with continuous monitoring"]},
-        ]
-    },
-    "Identity & Access Management": {
-        "weight": 0.10, "pillars": ["SEC"],
-        "description": "Identity federation, IAM Identity Center readiness, permission management, and privileged access.",
-        "questions": [
-            {"id": "CT-IAM-001", "question": "What is your current identity management approach for AWS access?",
-             "context": "Control Tower strongly recommends IAM Identity Center for centralized identity. Legacy IAM users or SAML need migration.",
-             "risk": "critical", "options": ["Local IAM users per account", "Partial federation - inconsistent approach", "IAM Identity Center with single identity source", "Full IdP integration (Okta, Azure AD) with automated provisioning", "SCIM plus JIT provisioning with ABAC"]},
-            {"id": "CT-IAM-002", "question": "Which identity provider will integrate with IAM Identity Center?",
-             "context": "Identity Center supports external IdPs with SCIM for automated user provisioning. Choice impacts implementation complexity.",
-             "risk": "high", "options": ["Native Identity Center directory", "Active Directory Connector", "Azure AD with SCIM", "Okta with SCIM", "Multiple IdPs for different populations"]},
-            {"id": "CT-IAM-003", "question": "How is multi-factor authentication (MFA) enforced?",
-             "context": "MFA prevents unauthorized access from compromised credentials. Enterprise best practice extends to all human access.",
-             "risk": "critical", "options": ["No MFA requirement", "Encouraged but not enforced", "Required for console access only", "Required for all human access (console + CLI)", "Hardware MFA for privileged accounts and root users"]},
-            {"id": "CT-IAM-004", "question": "How are IAM Identity Center permission sets designed?",
-             "context": "Well-designed permission sets follow least privilege and are modular for reuse. Complex custom policies increase burden.",
-             "risk": "high", "options": ["Not using Identity Center", "AWS managed policies only", "Custom inline policies per set", "Modular managed policies version controlled", "ABAC-enabled with dynamic permissions"]},
-            {"id": "CT-IAM-005", "question": "How is least privilege enforced and maintained?",
-             "context": "Permissions accumulate over time. Without active enforcement, users have far more access than needed.",
-             "risk": "high", "options": ["No enforcement - broad permissions", "Annual manual reviews", "Access Analyzer with manual review", "Quarterly right-sizing with documented process", "Continuous automated analysis and JIT access"]},
-            {"id": "CT-IAM-006", "question": "How is privileged access managed and controlled?",
-             "context": "Privileged access requires additional controls. Zero standing privilege reduces blast radius of compromised credentials.",
-             "risk": "critical", "options": ["No distinction - similar access levels", "Separate privileged accounts always available", "JIT for some operations with manual approval", "PAM solution with session recording", "Zero standing privilege with full audit trail"]},
-            {"id": "CT-IAM-007", "question": "How are machine/service identities managed?",
-             "context": "Workload identity should use IAM roles, not long-lived access keys. Roles Anywhere extends to on-premises and hybrid.",
-             "risk": "high", "options": ["Long-lived access keys", "Some IAM roles for AWS workloads", "Role chaining for cross-account", "Roles Anywhere for hybrid workloads", "Short-lived credentials only with automated rotation"]},
-            {"id": "CT-IAM-008", "question": "How are cross-account access roles managed?",
-             "context": "Multi-account architectures require cross-account roles for shared services, deployment, and security.",
-             "risk": "medium", "options": ["Manual role creation per account", "StackSets for role deployment", "Centralized IaC for cross-account roles", "Role vending machine with self-service", "Automated trust relationship management"]},
-        ]
-    },
-    "Network Architecture": {
-        "weight": 0.09, "pillars": ["SEC", "REL", "PERF"],
-        "description": "Multi-account network topology, connectivity, security controls, and hybrid architecture.",
-        "questions": [
-            {"id": "CT-NET-001", "question": "What is your multi-account network architecture?",
-             "context": "Hub-spoke with Transit Gateway is recommended for most enterprises, providing centralized connectivity and inspection.",
-             "risk": "high", "options": ["Independent VPCs per account", "VPC peering for selected accounts", "Transit Gateway with basic routing", "Hub-spoke with shared services and centralized egress", "Advanced multi-TGW with Network Firewall inspection"]},
-            {"id": "CT-NET-002", "question": "How is IP address management handled across accounts?",
-             "context": "IP conflicts prevent VPC connectivity. AWS VPC IPAM provides centralized management with automated allocation.",
-             "risk": "high", "options": ["No IPAM - ad-hoc with conflicts", "Spreadsheet tracking with manual coordination", "AWS VPC IPAM with defined pools", "Automated IPAM with account provisioning integration", "Enterprise IPAM integration (Infoblox, BlueCat)"]},
-            {"id": "CT-NET-003", "question": "What is your VPC design pattern standard?",
-             "context": "Consistent VPC design enables automation and reduces troubleshooting. Blueprints with IaC ensure reproducibility.",
-             "risk": "medium", "options": ["No standard - inconsistent designs", "Basic guidelines loosely followed", "Standard multi-AZ design documented", "Standardized with blueprints and validation", "Full IaC blueprints with automated provisioning"]},
-            {"id": "CT-NET-004", "question": "What is your on-premises connectivity architecture?",
-             "context": "Hybrid connectivity is essential during migration. Direct Connect provides consistent performance; VPN provides backup.",
-             "risk": "high", "options": ["No on-premises connectivity needed", "Per-account VPN connections", "Centralized VPN via Transit Gateway", "Direct Connect with VPN backup", "Redundant Direct Connect with automated failover"]},
-            {"id": "CT-NET-005", "question": "How is hybrid DNS resolution handled?",
-             "context": "Route 53 Resolver endpoints enable bi-directional DNS. Centralized architecture reduces complexity.",
-             "risk": "medium", "options": ["No hybrid DNS resolution", "Manual forwarding rules per account", "Route 53 Resolver outbound endpoints", "Centralized Resolver with RAM sharing", "Full bi-directional with Private Hosted Zones"]},
-            {"id": "CT-NET-006", "question": "How is network traffic inspection implemented?",
-             "context": "Defense in depth requires inspection beyond security groups. AWS Network Firewall enables stateful inspection.",
-             "risk": "high", "options": ["Security groups and NACLs only", "Third-party perimeter firewall only", "Network Firewall for critical workloads", "Centralized inspection VPC for all traffic", "Full IDS/IPS with threat intelligence integration"]},
-            {"id": "CT-NET-007", "question": "How is egress traffic controlled and monitored?",
-             "context": "Uncontrolled egress risks data exfiltration. Centralized proxy enables URL filtering and DLP integration.",
-             "risk": "critical", "options": ["No controls - NAT Gateways per VPC", "Centralized NAT with VPC Flow Logs", "Basic proxy with URL categorization", "Full proxy plus Network Firewall for all protocols", "Zero-trust egress with DLP and certificate inspection"]},
-        ]
-    },
-    "Logging & Security Operations": {
-        "weight": 0.09, "pillars": ["OPS", "SEC", "REL"],
-        "description": "Centralized logging, monitoring, alerting, and security operations integration.",
-        "questions": [
-            {"id": "CT-LOG-001", "question": "What is your CloudTrail configuration?",
-             "context": "CloudTrail is foundational for security and compliance. Control Tower creates an organization trail automatically.",
-             "risk": "critical", "options": ["Incomplete coverage with gaps", "Account-level trails stored locally", "Organization trail with management events", "Organization trail with data events for critical resources", "CloudTrail Lake with Insights for anomaly detection"]},
-            {"id": "CT-LOG-002", "question": "How are VPC Flow Logs managed across accounts?",
-             "context": "Flow Logs provide network visibility for security and troubleshooting. Centralized collection enables correlation.",
-             "risk": "high", "options": ["Not enabled consistently", "Partial coverage stored locally", "All VPCs with centralized storage", "Centralized with CloudWatch Insights analysis", "Real-time analysis with Traffic Mirroring for sensitive workloads"]},
-            {"id": "CT-LOG-003", "question": "What is your log retention and lifecycle strategy?",
-             "context": "Retention must balance compliance requirements with cost. S3 lifecycle policies automate tiering.",
-             "risk": "medium", "options": ["No defined policy - default retention", "Basic retention without lifecycle", "S3 lifecycle policies for hot/warm tiers", "Tiered with Glacier for long-term", "Compliance-driven with legal hold capability"]},
-            {"id": "CT-LOG-004", "question": "How are logs correlated and analyzed?",
-             "context": "Security investigations require correlation across CloudTrail, Flow Logs, and application logs. SIEM enables automation.",
-             "risk": "high", "options": ["Manual isolated review", "Manual correlation during investigations", "CloudWatch Logs Insights queries", "SIEM integration with correlation rules", "Advanced analytics with ML threat detection"]},
-            {"id": "CT-LOG-005", "question": "What is your CloudWatch monitoring configuration?",
-             "context": "Cross-account observability provides centralized visibility. X-Ray and ServiceLens add application performance insight.",
-             "risk": "medium", "options": ["Default metrics only per account", "Some custom metrics inconsistently", "Cross-account access with central dashboards", "Centralized observability account", "Full APM with X-Ray and ServiceLens"]},
-            {"id": "CT-LOG-006", "question": "What is your alerting and incident response strategy?",
-             "context": "Effective alerting requires threshold tuning to reduce noise. Integration with incident management enables automation.",
-             "risk": "medium", "options": ["No automated alerting", "Email alerts with high noise", "SNS to Slack/PagerDuty with basic routing", "Tiered severity with SLAs and runbooks", "AIOps with automated remediation"]},
-        ]
-    },
-    "Cost Management & FinOps": {
-        "weight": 0.07, "pillars": ["COST", "OPS"],
-        "description": "Cost visibility, allocation, optimization, and FinOps maturity.",
-        "questions": [
-            {"id": "CT-FIN-001", "question": "What is your cost visibility across AWS accounts?",
-             "context": "Multi-account environments require consolidated visibility. FinOps platforms provide advanced capabilities.",
-             "risk": "medium", "options": ["Per-account billing without consolidation", "Consolidated billing with basic Cost Explorer", "Cost Explorer advanced with anomaly detection", "CUR with Athena for detailed analysis", "FinOps platform with automated recommendations"]},
-            {"id": "CT-FIN-002", "question": "How are costs allocated to business units?",
-             "context": "Cost allocation enables accountability. Tagging is primary mechanism but requires enforcement.",
-             "risk": "medium", "options": ["No allocation - central IT budget", "Account-based allocation only", "Partial tagging with manual gap-filling", "Comprehensive enforced tagging with shared cost rules", "Full FinOps with showback/chargeback automation"]},
-            {"id": "CT-FIN-003", "question": "How are budgets and forecasting managed?",
-             "context": "AWS Budgets enable proactive cost management. Integration with provisioning ensures controls from day one.",
-             "risk": "medium", "options": ["No budgets configured", "Organization-level budget only", "Account-level budgets with alerts", "Granular budgets with automated deployment", "ML-based anomaly detection and forecasting"]},
-            {"id": "CT-FIN-004", "question": "How are Reserved Instances and Savings Plans managed?",
-             "context": "Commitment-based discounts reduce costs 30-72%. Centralized management enables organizational benefit sharing.",
-             "risk": "medium", "options": ["No commitments - all on-demand", "Reactive occasional purchases", "Periodic coverage review with manual decisions", "Optimized coverage with benefit sharing", "Automated recommendations with continuous optimization"]},
-            {"id": "CT-FIN-005", "question": "What optimization recommendations processes exist?",
-             "context": "AWS provides recommendations through Trusted Advisor and Compute Optimizer. Actioning requires process.",
-             "risk": "low", "options": ["None - no optimization review", "Ad-hoc review when issues arise", "Periodic Trusted Advisor review", "Compute Optimizer integration with rightsizing", "Automated implementation for approved changes"]},
-        ]
-    },
-    "Backup & Disaster Recovery": {
-        "weight": 0.07, "pillars": ["REL", "SEC"],
-        "description": "Backup strategy, policy enforcement, testing, and disaster recovery readiness.",
-        "questions": [
-            {"id": "CT-BDR-001", "question": "How is backup managed across accounts?",
-             "context": "AWS Backup enables centralized management. Cross-account vaults protect against ransomware.",
-             "risk": "critical", "options": ["No consistent strategy - team dependent", "Per-account management inconsistent", "AWS Backup per account with policies", "Centralized policies via Organizations", "Organization-wide with cross-account vault"]},
-            {"id": "CT-BDR-002", "question": "How is backup policy compliance enforced?",
-             "context": "Backup policies are ineffective if workloads can opt out. SCPs can require backup configurations.",
-             "risk": "high", "options": ["No enforcement - backups optional", "Documentation only without verification", "Config rules for detection", "Mandatory with compliance dashboards", "Preventive SCPs with automated assignment"]},
-            {"id": "CT-BDR-003", "question": "How frequently are backup restores tested?",
-             "context": "Backups are useless if they can't be restored. Regular testing validates integrity and procedures.",
-             "risk": "high", "options": ["Never tested", "Ad-hoc during incidents only", "Annual for critical systems", "Quarterly automated with documentation", "Continuous validation with DR drills"]},
-            {"id": "CT-BDR-004", "question": "What is your multi-region DR strategy?",
-             "context": "DR strategy depends on RTO/RPO requirements. Active-active provides near-zero RTO but highest complexity.",
-             "risk": "high", "options": ["Single region only", "Backup to secondary region", "Pilot light with manual scaling", "Warm standby with automated failover", "Active-active with automatic routing"]},
-            {"id": "CT-BDR-005", "question": "How is Control Tower resilience addressed?",
-             "context": "Control Tower runs in home region. Organizations should document procedures and maintain IaC for configurations.",
-             "risk": "high", "options": ["Not considered", "Documented manual procedures", "IaC backup of customizations", "Automated recovery with monitoring", "Full DR tested with regular drills"]},
-        ]
-    },
-    "Migration Readiness": {
-        "weight": 0.07, "pillars": ["OPS", "REL"],
-        "description": "Existing account inventory, enrollment prerequisites, and migration planning.",
-        "questions": [
-            {"id": "CT-MIG-001", "question": "How complete is your existing AWS account inventory?",
-             "context": "Control Tower enrollment requires understanding existing accounts. Shadow IT may have created unknown accounts.",
-             "risk": "high", "options": ["Unknown account count - possible shadow IT", "Partial list with gaps", "Complete list with limited metadata", "Detailed inventory with ownership and dependencies", "Dynamic automated inventory with CMDB integration"]},
-            {"id": "CT-MIG-002", "question": "What is your total AWS account count?",
-             "context": "Account count impacts enrollment timeline. Large organizations (500+) may need custom tooling.",
-             "risk": "high", "options": ["Unknown", "1-25 accounts (straightforward)", "26-100 accounts (phased approach)", "101-500 accounts (significant planning)", "500+ accounts (major program)"]},
-            {"id": "CT-MIG-003", "question": "How prevalent are non-standard configurations?",
-             "context": "Non-standard configurations (existing Config, CloudTrail) can conflict with Control Tower enrollment.",
-             "risk": "high", "options": ["Unknown - not assessed", "Many non-standard likely to conflict", "Some identified with unclear scope", "Few exceptions documented with plan", "All standards-compliant and ready"]},
-            {"id": "CT-MIG-004", "question": "Have accounts been assessed for enrollment prerequisites?",
-             "context": "Control Tower has specific prerequisites. Pre-flight assessment identifies blockers before enrollment.",
-             "risk": "critical", "options": ["No assessment performed", "Partial assessment only", "Full assessment with blockers identified", "Most ready with remediation in progress", "All verified ready with pre-flight passed"]},
-            {"id": "CT-MIG-005", "question": "Are there Config Recorder or CloudTrail conflicts?",
-             "context": "Control Tower creates its own Config Recorder and trail. Existing configurations must be resolved.",
-             "risk": "critical", "options": ["Unknown status", "Many conflicts exist", "Conflicts identified with plan developing", "Most resolved with few remaining", "All clear and ready"]},
-            {"id": "CT-MIG-006", "question": "What approach exists for accounts that cannot be enrolled?",
-             "context": "Some accounts may not be enrollable. Legacy account strategy ensures consistent governance.",
-             "risk": "medium", "options": ["No approach defined", "To be determined during implementation", "Identified with documented rationale", "Legacy governance plan developed", "Comprehensive strategy with monitoring"]},
-        ]
-    },
-    "Operational Readiness": {
-        "weight": 0.05, "pillars": ["OPS"],
-        "description": "Team skills, operational processes, runbooks, and change management.",
-        "questions": [
-            {"id": "CT-OPS-001", "question": "What is your team's Control Tower experience level?",
-             "context": "Control Tower operations require specific knowledge. Deep expertise enables troubleshooting and customization.",
-             "risk": "high", "options": ["No experience", "Documentation/presentation awareness only", "Sandbox hands-on experience", "Production experience elsewhere", "Deep expertise with advanced capabilities"]},
-            {"id": "CT-OPS-002", "question": "What training plan exists for Control Tower operations?",
-             "context": "Sustainable operations require documented knowledge and trained team members.",
-             "risk": "medium", "options": ["No training planned", "Self-paced documentation only", "AWS instructor-led training", "Comprehensive program with workshops", "Certification plus documented knowledge transfer"]},
-            {"id": "CT-OPS-003", "question": "How mature are operational runbooks?",
-             "context": "Runbooks document standard procedures. SSM Automation enables automated runbooks.",
-             "risk": "medium", "options": ["No runbooks - tribal knowledge", "Basic documentation with gaps", "Comprehensive runbooks regularly reviewed", "Integrated with alerts and version controlled", "SSM Automation with self-healing"]},
-            {"id": "CT-OPS-004", "question": "What is your incident response process for AWS?",
-             "context": "AWS-specific incident response includes escalation to AWS Support and integration with monitoring.",
-             "risk": "medium", "options": ["No defined process", "Ad-hoc response", "Documented escalation paths", "Playbooks with automated detection", "Full automation with AWS Support integration"]},
-            {"id": "CT-OPS-005", "question": "How will Control Tower changes be managed?",
-             "context": "Control Tower changes have organization-wide impact. GitOps provides audit trail and rollback.",
-             "risk": "medium", "options": ["No process - direct changes", "Informal team discussion", "Ticket-based with basic approval", "CAB review with rollback plans", "GitOps with automated validation"]},
-            {"id": "CT-OPS-006", "question": "What is your Control Tower upgrade approach?",
-             "context": "Control Tower releases updates regularly. Systematic approach ensures stability with access to new features.",
-             "risk": "medium", "options": ["No strategy defined", "Upgrade only when issues arise", "Monitor releases with periodic updates", "Scheduled testing before production", "Automated validation with staged rollout"]},
-        ]
-    },
-    "Data Protection": {
-        "weight": 0.05, "pillars": ["SEC"],
-        "description": "Encryption strategy, key management, and data classification.",
-        "questions": [
-            {"id": "CT-DAT-001", "question": "What is your encryption-at-rest strategy?",
-             "context": "Encryption protects data if storage is compromised. Customer managed keys provide more control.",
-             "risk": "critical", "options": ["Not required - service defaults only", "AWS managed keys (SSE-S3)", "Customer managed KMS keys per account", "Centralized key management cross-account", "Enterprise hierarchy with multi-region and HSM"]},
-            {"id": "CT-DAT-002", "question": "How is KMS managed across accounts?",
-             "context": "Multi-account environments need KMS strategy for key sharing and lifecycle management.",
-             "risk": "high", "options": ["No strategy - ad-hoc keys", "Per-account keys without sharing", "Some cross-account via key policies", "Centralized key management account with RAM", "Automated management with rotation"]},
-            {"id": "CT-DAT-003", "question": "Does your organization have a data classification framework?",
-             "context": "Classification enables appropriate protection levels. Technical controls should map to classifications.",
-             "risk": "high", "options": ["No classification defined", "Basic framework with limited enforcement", "Classification with handling procedures", "Technical controls mapped to classifications", "Automated DLP with continuous discovery"]},
-            {"id": "CT-DAT-004", "question": "How is sensitive data discovered and protected?",
-             "context": "Macie provides automated sensitive data discovery for S3. Custom identifiers enable organization-specific detection.",
-             "risk": "high", "options": ["No discovery process", "Manual identification only", "Macie for S3 discovery", "Macie with custom identifiers", "Comprehensive DLP integration"]},
-        ]
-    },
-}
-
-# =============================================================================
-# GOLDEN ARCHITECTURE (SERVERLESS) - 10 DOMAINS, 55+ QUESTIONS
-# =============================================================================
-GA_QUESTIONS = {
-    "Serverless Compute Strategy": {
-        "weight": 0.12, "pillars": ["PERF", "COST", "OPS"],
-        "description": "Lambda adoption, runtime management, Fargate usage, and compute decision frameworks.",
-        "questions": [
-            {"id": "GA-CMP-001", "question": "What is your Lambda adoption and standardization maturity?",
-             "context": "Lambda-first strategies prioritize serverless for new workloads. Standardization covers runtime selection, layers, and patterns.",
-             "risk": "medium", "options": ["No Lambda usage", "Experimental POCs only", "Production for specific use cases", "Significant usage with Lambda-default policy", "Lambda-first with comprehensive patterns library"]},
-            {"id": "GA-CMP-002", "question": "How are Lambda functions organized and discovered?",
-             "context": "At scale, function organization becomes critical. Domain-driven design aligns functions with business capabilities.",
-             "risk": "medium", "options": ["Ad-hoc naming without organization", "Naming conventions inconsistently applied", "Consistent naming with application grouping", "Domain-driven organization with service discovery", "Full service mesh with dependency mapping"]},
-            {"id": "GA-CMP-003", "question": "How is Lambda runtime management handled?",
-             "context": "Runtime deprecation requires migration planning. Containers provide more control but add complexity.",
-             "risk": "medium", "options": ["Default runtimes without management", "Standard runtimes defined", "Versioning with deprecation tracking", "Automated runtime updates in CI/CD", "Custom containers with full control"]},
-            {"id": "GA-CMP-004", "question": "How are Lambda cold starts managed?",
-             "context": "Cold starts impact user experience. Provisioned Concurrency eliminates cold starts; SnapStart helps Java.",
-             "risk": "low", "options": ["Not considered - discovered in production", "Awareness without mitigation", "Basic optimizations (package size, runtime)", "Provisioned Concurrency for critical functions", "Comprehensive strategy with SnapStart and warming"]},
-            {"id": "GA-CMP-005", "question": "What is your Lambda layers strategy?",
-             "context": "Layers enable shared code and dependencies. Versioning prevents breaking changes.",
-             "risk": "low", "options": ["No layers used", "Some layers without management", "Standard layers for common dependencies", "Versioned layers with CI/CD", "Automated layer updates with testing"]},
-            {"id": "GA-CMP-006", "question": "What is your Fargate adoption level?",
-             "context": "Fargate provides serverless containers for workloads exceeding Lambda limits. Spot provides cost savings.",
-             "risk": "medium", "options": ["No Fargate - EC2 or no containers", "Experimental usage", "Specific workloads in production", "Default for containers with Spot integration", "Full serverless container strategy"]},
-            {"id": "GA-CMP-007", "question": "Do you have a Lambda vs Fargate vs EC2 decision framework?",
-             "context": "Each compute option has trade-offs. Clear frameworks ensure optimal choices and consistent architecture.",
-             "risk": "medium", "options": ["No framework - ad-hoc decisions", "Informal guidelines", "Documented decision tree for reviews", "Comprehensive with cost modeling", "Automated recommendations with optimization"]},
-        ]
-    },
-    "API & Integration Layer": {
-        "weight": 0.10, "pillars": ["PERF", "SEC", "REL"],
-        "description": "API Gateway patterns, EventBridge adoption, and messaging architecture.",
-        "questions": [
-            {"id": "GA-API-001", "question": "What is your API Gateway architecture?",
-             "context": "REST APIs are feature-rich; HTTP APIs cost 70% less. Type selection significantly impacts cost.",
-             "risk": "medium", "options": ["No API Gateway usage", "REST API for everything", "HTTP APIs where features sufficient", "Right-sized selection with multi-stage", "Comprehensive with WAF and developer portal"]},
-            {"id": "GA-API-002", "question": "How is API versioning managed?",
-             "context": "API versioning enables evolution without breaking clients. Strategies include path, header, and stage-based.",
-             "risk": "medium", "options": ["No versioning", "URL path versioning only", "Stage-based versioning", "Header-based with documentation", "Comprehensive with sunset policies"]},
-            {"id": "GA-API-003", "question": "How are APIs documented?",
-             "context": "API documentation enables adoption. OpenAPI specifications enable code generation and testing.",
-             "risk": "low", "options": ["No documentation", "Manual often outdated", "OpenAPI specifications maintained", "Auto-generated with internal portal", "Full developer portal with SDKs"]},
-            {"id": "GA-API-004", "question": "How is API rate limiting configured?",
-             "context": "Rate limiting protects backends and enables fair usage. Usage plans enable API monetization.",
-             "risk": "high", "options": ["No rate limiting", "Basic API-level throttling", "Custom per-stage throttling", "Usage plans with API keys", "Dynamic adaptive rate limiting"]},
-            {"id": "GA-API-005", "question": "What is your EventBridge adoption level?",
-             "context": "EventBridge enables loosely-coupled event-driven architectures. Schema registry provides discovery.",
-             "risk": "medium", "options": ["No EventBridge - point-to-point", "Basic default bus usage", "Custom buses with event rules", "Event-driven patterns with schema registry", "Full event mesh with governance"]},
-            {"id": "GA-API-006", "question": "How is event schema management handled?",
-             "context": "Schema registry enables event discovery and validation. Versioning supports evolution.",
-             "risk": "medium", "options": ["No schema management", "Informal documentation", "Schema registry enabled", "Versioning with compatibility checks", "Full governance with evolution policies"]},
-            {"id": "GA-API-007", "question": "How are SQS/SNS messaging patterns implemented?",
-             "context": "SQS provides reliable queuing; SNS enables pub/sub. FIFO guarantees ordering and exactly-once.",
-             "risk": "medium", "options": ["No async messaging", "Basic SQS queues", "Fan-out patterns (SNS to SQS)", "DLQ with retry and visibility tuning", "FIFO with exactly-once processing"]},
-        ]
-    },
-    "Workflow Orchestration": {
-        "weight": 0.08, "pillars": ["REL", "OPS"],
-        "description": "Step Functions adoption, workflow patterns, and error handling.",
-        "questions": [
-            {"id": "GA-WRK-001", "question": "What is your Step Functions adoption level?",
-             "context": "Step Functions provides visual workflow orchestration. Express workflows suit high-volume, short-duration needs.",
-             "risk": "medium", "options": ["No Step Functions", "Experimental usage", "Standard workflows for orchestration", "Standard and Express appropriately", "Express with callbacks and human approval"]},
-            {"id": "GA-WRK-002", "question": "How is workflow error handling implemented?",
-             "context": "Proper error handling prevents data loss. Saga patterns enable distributed transaction compensation.",
-             "risk": "high", "options": ["No error handling", "Basic try-catch", "Retry with exponential backoff", "Fallbacks and error states", "Saga patterns for transactions"]},
-            {"id": "GA-WRK-003", "question": "What workflow patterns are implemented?",
-             "context": "Step Functions supports sequential, parallel, choice, and map patterns. Human approval enables oversight.",
-             "risk": "medium", "options": ["None - Lambda chaining only", "Sequential workflows", "Parallel and choice patterns", "Dynamic map for variable input", "Human approval integration"]},
-            {"id": "GA-WRK-004", "question": "How are long-running workflows managed?",
-             "context": "Standard workflows can run up to 1 year. Callback patterns enable external system integration.",
-             "risk": "medium", "options": ["No long-running workflows", "Standard workflows only", "Callback patterns for external waits", "Wait states with proper timeout handling", "Full async patterns with notifications"]},
-        ]
-    },
-    "Serverless Data Layer": {
-        "weight": 0.10, "pillars": ["PERF", "REL", "COST"],
-        "description": "DynamoDB patterns, Aurora Serverless usage, and connection management.",
-        "questions": [
-            {"id": "GA-DAT-001", "question": "What is your DynamoDB adoption level?",
-             "context": "DynamoDB excels for key-value and document workloads. Single-table design maximizes efficiency.",
-             "risk": "medium", "options": ["No DynamoDB usage", "Specific simple use cases", "Default for appropriate workloads", "Advanced with GSI overloading", "Single-table design patterns"]},
-            {"id": "GA-DAT-002", "question": "How is DynamoDB capacity managed?",
-             "context": "On-demand suits variable traffic; provisioned with auto-scaling suits predictable workloads. Reserved capacity reduces cost.",
-             "risk": "medium", "options": ["Not using DynamoDB", "Provisioned without auto-scaling", "On-demand for all tables", "Right-sized with auto-scaling", "Optimized with reserved capacity"]},
-            {"id": "GA-DAT-003", "question": "What DynamoDB design patterns are used?",
-             "context": "Access pattern-driven design is key. Single-table with GSI overloading reduces cost and latency.",
-             "risk": "medium", "options": ["N/A - not using DynamoDB", "Simple key-value only", "Multiple tables per entity", "Single-table for related data", "Advanced GSI overloading patterns"]},
-            {"id": "GA-DAT-004", "question": "How is DynamoDB caching implemented?",
-             "context": "DAX provides microsecond latency. ElastiCache Serverless offers flexible caching options.",
-             "risk": "low", "options": ["No caching", "Application-level caching", "ElastiCache for specific patterns", "DAX for read-heavy workloads", "Multi-layer caching strategy"]},
-            {"id": "GA-DAT-005", "question": "What is your Aurora Serverless usage?",
-             "context": "Aurora Serverless v2 scales automatically. Data API eliminates connection management for Lambda.",
-             "risk": "medium", "options": ["No Aurora Serverless", "Evaluating for use cases", "Dev/test environments", "Production with scaling config", "Data API for serverless apps"]},
-            {"id": "GA-DAT-006", "question": "How are database connections managed from serverless?",
-             "context": "Lambda cold starts can exhaust connections. RDS Proxy manages connection pooling. Data API eliminates connections.",
-             "risk": "high", "options": ["Direct connections from Lambda", "Lambda pooling patterns", "RDS Proxy for connection management", "RDS Proxy with IAM auth", "Data API - no connections needed"]},
-            {"id": "GA-DAT-007", "question": "What serverless analytics approach is used?",
-             "context": "Athena provides serverless SQL on S3. Data lake architectures enable comprehensive analytics.",
-             "risk": "low", "options": ["No serverless analytics", "Traditional provisioned services", "Athena for ad-hoc queries", "Data lake with Lake Formation", "Comprehensive serverless analytics stack"]},
-        ]
-    },
-    "Serverless Security": {
-        "weight": 0.12, "pillars": ["SEC"],
-        "description": "Lambda security, secrets management, API protection, and vulnerability management.",
-        "questions": [
-            {"id": "GA-SEC-001", "question": "How are Lambda execution roles designed?",
-             "context": "Each function should have unique minimal permissions. Shared roles create excessive access.",
-             "risk": "critical", "options": ["Single shared role for all functions", "Broad roles per application", "Function-specific manually managed", "Least-privilege with Access Analyzer", "Automated with permission boundaries"]},
-            {"id": "GA-SEC-002", "question": "How is Lambda code signing implemented?",
-             "context": "Code signing ensures only trusted code deploys. Validation can warn or enforce.",
-             "risk": "high", "options": ["No code signing", "Evaluating implementation", "Some functions signed", "Validation on deployment", "Mandatory with CI/CD enforcement"]},
-            {"id": "GA-SEC-003", "question": "How are Lambda vulnerabilities managed?",
-             "context": "Dependencies can introduce vulnerabilities. Inspector provides runtime scanning; CI/CD catches issues early.",
-             "risk": "high", "options": ["No vulnerability scanning", "Manual periodic review", "CI/CD scanning for critical issues", "Inspector continuous scanning", "Automated remediation pipeline"]},
-            {"id": "GA-SEC-004", "question": "How is secrets management implemented?",
-             "context": "Secrets must never be in code or plaintext environment variables. Lambda extensions enable cached retrieval.",
-             "risk": "critical", "options": ["Plaintext environment variables", "Encrypted environment variables", "Parameter Store for configuration", "Secrets Manager with rotation", "Lambda extension with caching"]},
-            {"id": "GA-SEC-005", "question": "How is secret rotation implemented?",
-             "context": "Credential rotation limits exposure window. Secrets Manager provides automated rotation.",
-             "risk": "high", "options": ["No rotation", "Manual periodic rotation", "Scheduled rotation reminders", "Automated for some secrets", "Automated for all credentials"]},
-            {"id": "GA-SEC-006", "question": "How is API authentication implemented?",
-             "context": "APIs require authentication for access control. Cognito handles users; Lambda authorizers enable custom logic.",
-             "risk": "critical", "options": ["No authentication - public APIs", "API keys only (not authentication)", "Cognito User Pools", "Lambda authorizers with JWT", "Multi-method with fine-grained authorization"]},
-            {"id": "GA-SEC-007", "question": "How is API traffic protected?",
-             "context": "APIs are attack targets. WAF protects against OWASP attacks; Shield provides DDoS protection.",
-             "risk": "high", "options": ["No protection beyond throttling", "Basic throttling only", "WAF with managed rules", "WAF with custom rules and Shield", "Comprehensive with Bot Control"]},
-            {"id": "GA-SEC-008", "question": "How is input validation implemented?",
-             "context": "Input validation prevents injection attacks. API Gateway validates structure; application validates logic.",
-             "risk": "high", "options": ["No systematic validation", "Basic application validation", "API Gateway request validation", "Schema validation with sanitization", "Defense in depth - WAF, gateway, application"]},
-        ]
-    },
-    "Observability & Monitoring": {
-        "weight": 0.08, "pillars": ["OPS", "REL"],
-        "description": "Logging, tracing, metrics, and SLO management for serverless.",
-        "questions": [
-            {"id": "GA-OBS-001", "question": "How is logging structured across serverless apps?",
-             "context": "Structured JSON logging enables querying. Lambda Powertools provides standardized patterns.",
-             "risk": "medium", "options": ["Console.log - unstructured", "Basic structured with inconsistent format", "JSON with standard fields", "Correlation IDs with Powertools", "Comprehensive with sampling and aggregation"]},
-            {"id": "GA-OBS-002", "question": "How are logs aggregated and analyzed?",
-             "context": "Centralized aggregation enables cross-function analysis. SIEM integration supports security investigation.",
-             "risk": "medium", "options": ["CloudWatch console only", "Logs Insights queries", "Centralized in observability account", "Real-time streaming analysis", "SIEM with ML anomaly detection"]},
-            {"id": "GA-OBS-003", "question": "How is distributed tracing implemented?",
-             "context": "X-Ray shows request flow across services. Custom segments add business context.",
-             "risk": "medium", "options": ["No tracing", "X-Ray for some functions", "X-Ray for all serverless", "Custom segments and annotations", "Full tracing with OpenTelemetry"]},
-            {"id": "GA-OBS-004", "question": "How are custom metrics captured?",
-             "context": "AWS provides default Lambda metrics. EMF enables efficient custom metric publishing.",
-             "risk": "medium", "options": ["Default metrics only", "Some custom with PutMetric", "Business metrics via EMF", "Comprehensive with dashboards", "Real-time with anomaly detection"]},
-            {"id": "GA-OBS-005", "question": "What serverless dashboards exist?",
-             "context": "Dashboards provide operational visibility. Service-level views enable quick issue identification.",
-             "risk": "low", "options": ["No dashboards", "Basic Lambda console", "Application-specific dashboards", "Service dashboards with SLIs", "Comprehensive with drill-down"]},
-            {"id": "GA-OBS-006", "question": "Are SLOs defined and tracked?",
-             "context": "SLOs define reliability targets. Error budgets enable data-driven decisions.",
-             "risk": "medium", "options": ["No SLOs defined", "Informal targets", "Key SLIs tracked", "SLOs with error budgets", "Comprehensive with automated actions"]},
-        ]
-    },
-    "CI/CD & DevOps": {
-        "weight": 0.08, "pillars": ["OPS"],
-        "description": "Deployment automation, testing strategies, and DevOps practices.",
-        "questions": [
-            {"id": "GA-DEV-001", "question": "What is your serverless deployment approach?",
-             "context": "SAM and CDK simplify Lambda deployment. GitOps provides automated, auditable deployments.",
-             "risk": "medium", "options": ["Manual console deployments", "CLI-based with scripts", "SAM or Serverless Framework", "CDK with multi-environment", "Full GitOps with automation"]},
-            {"id": "GA-DEV-002", "question": "How is Infrastructure as Code implemented?",
-             "context": "IaC enables repeatable infrastructure. Testing and security scanning improve quality.",
-             "risk": "medium", "options": ["No IaC - manual configuration", "Partial IaC coverage", "Full IaC with basic CI/CD", "IaC with linting and testing", "Security scanning integrated"]},
-            {"id": "GA-DEV-003", "question": "What deployment strategies are used?",
-             "context": "All-at-once risks widespread outages. Canary deployments reduce blast radius.",
-             "risk": "high", "options": ["All-at-once deployments", "Manual staged rollout", "Blue-green with manual shift", "Canary with CloudWatch alarms", "Progressive with automated rollback"]},
-            {"id": "GA-DEV-004", "question": "How is rollback handled?",
-             "context": "Quick rollback minimizes impact. Lambda aliases enable instant traffic shifting.",
-             "risk": "high", "options": ["No rollback capability", "Manual redeployment", "Automated version rollback", "Aliases for instant rollback", "Blast radius limitation with feature flags"]},
-            {"id": "GA-DEV-005", "question": "How comprehensive is serverless testing?",
-             "context": "Serverless testing includes unit, integration, and local testing. SAM Local and LocalStack simulate AWS.",
-             "risk": "high", "options": ["No automated testing", "Unit tests only", "Unit plus integration", "Comprehensive with local environment", "Full pyramid with chaos engineering"]},
-            {"id": "GA-DEV-006", "question": "How is local development handled?",
-             "context": "Deploying to AWS for every change slows development. Local tooling accelerates iteration.",
-             "risk": "low", "options": ["Deploy to AWS for all testing", "Limited mocking", "SAM Local for Lambda", "LocalStack for AWS simulation", "Comprehensive local development environment"]},
-        ]
-    },
-    "Cost Optimization": {
-        "weight": 0.06, "pillars": ["COST"],
-        "description": "Serverless cost visibility, optimization, and efficiency.",
-        "questions": [
-            {"id": "GA-CST-001", "question": "What is your serverless cost visibility?",
-             "context": "Serverless costs can be difficult to attribute. Per-invocation understanding enables optimization.",
-             "risk": "medium", "options": ["No tracking - aggregate bill only", "Service-level visibility", "Function-level with tagging", "Per-application dashboards with alerts", "Per-invocation cost analysis"]},
-            {"id": "GA-CST-002", "question": "How is cost anomaly detection implemented?",
-             "context": "Unexpected cost spikes can indicate misconfiguration or attack. Early detection prevents budget impact.",
-             "risk": "medium", "options": ["No anomaly detection", "Manual bill review", "AWS Cost Anomaly Detection", "Custom thresholds with alerts", "Auto-remediation for anomalies"]},
-            {"id": "GA-CST-003", "question": "How is Lambda memory optimization performed?",
-             "context": "Lambda pricing depends on memory and duration. Power Tuning finds optimal configuration.",
-             "risk": "low", "options": ["Default memory settings", "Manual one-time testing", "Power Tuning for critical functions", "Regular optimization cycles", "Automated continuous optimization"]},
-            {"id": "GA-CST-004", "question": "How is unused resource cleanup managed?",
-             "context": "Orphaned resources accumulate cost. Automated cleanup prevents waste.",
-             "risk": "low", "options": ["No cleanup process", "Manual periodic review", "Reporting of unused resources", "Scheduled cleanup jobs", "Automated with approval for production"]},
-            {"id": "GA-CST-005", "question": "What is your Graviton (ARM) utilization?",
-             "context": "Graviton2 provides 20% better price-performance for most workloads. Lambda supports ARM.",
-             "risk": "low", "options": ["Not aware of Graviton", "Evaluating for use cases", "Some workloads on Graviton", "Default for new workloads", "Comprehensive adoption with optimization"]},
-        ]
-    },
-    "Resilience & Reliability": {
-        "weight": 0.10, "pillars": ["REL"],
-        "description": "Fault tolerance patterns, retry logic, idempotency, and multi-region.",
-        "questions": [
-            {"id": "GA-REL-001", "question": "How is error handling and retry logic implemented?",
-             "context": "Serverless apps must handle transient failures. Circuit breakers prevent cascade failures.",
-             "risk": "high", "options": ["No systematic error handling", "Default Lambda retries only", "Custom retry with backoff", "Circuit breakers and DLQs", "Full patterns with bulkheads and fallbacks"]},
-            {"id": "GA-REL-002", "question": "How is dead-letter queue handling implemented?",
-             "context": "DLQs capture failed events for analysis. Reprocessing enables recovery without data loss.",
-             "risk": "medium", "options": ["No DLQ configuration", "DLQ for some functions", "DLQ for all async operations", "Monitoring and alerting on DLQ", "Automated reprocessing pipeline"]},
-            {"id": "GA-REL-003", "question": "How is idempotency implemented?",
-             "context": "Serverless platforms may invoke functions multiple times. Idempotency ensures repeated invocations are safe.",
-             "risk": "high", "options": ["Not considered - duplicates possible", "Awareness without implementation", "Critical operations only", "Idempotency tokens implemented", "Powertools with comprehensive coverage"]},
-            {"id": "GA-REL-004", "question": "What is your multi-region strategy for serverless?",
-             "context": "Multi-region provides regional failure resilience. DynamoDB Global Tables enable multi-region data.",
-             "risk": "high", "options": ["Single region only", "Data replicated to secondary", "Passive with manual failover", "Automated failover with Global Tables", "Active-active with traffic routing"]},
-            {"id": "GA-REL-005", "question": "How is global data consistency handled?",
-             "context": "Multi-region requires consistency decisions. Eventually consistent is simpler; strong consistency adds complexity.",
-             "risk": "high", "options": ["N/A - single region", "Eventually consistent accepted", "Global Tables for replication", "Defined consistency per data type", "Comprehensive with conflict resolution"]},
-            {"id": "GA-REL-006", "question": "How is chaos engineering applied to serverless?",
-             "context": "Chaos engineering validates resilience assumptions. AWS Fault Injection Simulator enables controlled experiments.",
-             "risk": "medium", "options": ["No chaos engineering", "Manual failure testing", "Periodic game days", "FIS for serverless experiments", "Continuous chaos in non-production"]},
-        ]
-    },
-    "Event-Driven Architecture": {
-        "weight": 0.06, "pillars": ["REL", "PERF"],
-        "description": "Event-driven patterns, async processing, and event sourcing.",
-        "questions": [
-            {"id": "GA-EVT-001", "question": "What is your event-driven architecture maturity?",
-             "context": "Event-driven architecture enables loose coupling and scalability. Mature implementations use event sourcing.",
-             "risk": "medium", "options": ["Request-response only", "Some async processing", "Event-driven for appropriate workloads", "Event-first design approach", "Full event sourcing where appropriate"]},
-            {"id": "GA-EVT-002", "question": "How is event ordering handled?",
-             "context": "Some use cases require ordered processing. SQS FIFO and Kinesis provide ordering guarantees.",
-             "risk": "medium", "options": ["Ordering not considered", "Best-effort ordering", "FIFO queues for critical paths", "Kinesis for streaming with order", "Comprehensive ordering strategy"]},
-            {"id": "GA-EVT-003", "question": "How is event replay capability implemented?",
-             "context": "Event replay enables debugging and recovery. EventBridge Archive provides replay capability.",
-             "risk": "medium", "options": ["No replay capability", "Manual log replay", "EventBridge Archive enabled", "Replay with filtering", "Full event sourcing with rebuild"]},
-            {"id": "GA-EVT-004", "question": "How is backpressure handled in event processing?",
-             "context": "High-volume events can overwhelm consumers. Batching and reserved concurrency provide control.",
-             "risk": "medium", "options": ["No backpressure handling", "Default Lambda concurrency", "Reserved concurrency limits", "Batching with batch size tuning", "Comprehensive flow control"]},
-        ]
-    },
-}
-
 # =============================================================================
 # APPLICATION LOGIC WITH BUG FIX
 # Key fix: Questions only count as answered when user explicitly selects an option
@@ -1147,98 +585,141 @@ def init_state():
         st.session_state.initialized = True
         st.session_state.ct_responses = {}  # {question_id: score}
         st.session_state.ga_responses = {}
+        st.session_state.ct_state = ScoreState(CT_QUESTIONS, st.session_state.ct_responses)
+        st.session_state.ga_state = ScoreState(GA_QUESTIONS, st.session_state.ga_responses)
         st.session_state.ai_analysis = None
         st.session_state.org_name = ''
         st.session_state.assessor_name = ''
         st.session_state.industry = 'technology'
         st.session_state.report = None
         st.session_state.pdf_report = None
+        st.session_state.pdf_job_id = None
+        st.session_state.ai_analyses = {}  # {analysis_type: text} from the last generation
+        st.session_state.ai_timings = {}  # {analysis_type: [{ttft_s, total_s, at}]}
+        st.session_state.assessment_id = None  # Bound to ?assessment=<id> by restore_assessment
+        st.session_state.saved_fingerprint = None
+        st.session_state.autosave_error = None
+        st.session_state.autosave_status = None  # Process-wide write-behind metrics as of the last run
+        st.session_state.tab_timings = {}  # {tab: [render seconds]} for full runs and fragment reruns
+        st.session_state.ai_selected_types = list(LEADERSHIP_ANALYSES)
+        st.session_state.prefill_suggestions = {}  # {kind: {qid: suggestion}} awaiting review
+        st.session_state.prefill_stats = None
+        st.session_state.prefill_extractions = {}  # {uploaded file_id: Future of extract_text result}
+    
+    # Widgets that are not rendered lose their state; re-assigning keeps it while another tab is open
+    for key in PERSISTENT_WIDGET_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
 
-def count_questions(domains: dict) -> int:
-    """Count total questions across all domains"""
-    return sum(len(d["questions"]) for d in domains.values())
+APP_TABS = [
+    "📊 Executive Dashboard",
+    "🎛️ Control Tower",
+    "⚡ Golden Architecture",
+    "🔍 Gap Analysis",
+    "🤖 AI Insights",
+    "📄 Reports & Export",
+    "📁 Portfolio"
+]
+PERSISTENT_WIDGET_KEYS = [
+    "ct_question_view", "ct_domain", "ga_question_view", "ga_domain",
+    "ai_generate_all", "ai_selected_types", "ai_analysis_type", "ai_context", "ai_skip_cache",
+    "portfolio_industries"
+]
 
-def count_answered(responses: dict) -> int:
-    """Count answered questions - only those with actual responses"""
-    return len(responses)
+def get_score_state(kind: str) -> ScoreState:
+    """Live ScoreState for "ct" or "ga"; re-adopts the responses dict if it was replaced"""
+    state = st.session_state[f"{kind}_state"]
+    responses = st.session_state[f"{kind}_responses"]
+    if state.responses is not responses:
+        state.load(responses)
+    return state
 
-def calc_scores(responses: dict, domains: dict) -> dict:
-    """Calculate weighted scores across domains"""
-    if not responses:
-        return {"overall": 0, "domains": {}, "total_answered": 0, "total_questions": count_questions(domains)}
-    
-    domain_scores = {}
-    for dname, ddata in domains.items():
-        total, answered = 0, 0
-        for q in ddata["questions"]:
-            if q["id"] in responses:
-                total += responses[q["id"]]
-                answered += 1
-        
-        score = (total / (answered * 5) * 100) if answered > 0 else 0
-        domain_scores[dname] = {
-            "score": score,
-            "answered": answered,
-            "total": len(ddata["questions"]),
-            "weight": ddata["weight"]
-        }
-    
-    # Weighted overall
-    weighted_sum = sum(d["score"] * d["weight"] for d in domain_scores.values() if d["answered"] > 0)
-    weight_sum = sum(d["weight"] for d in domain_scores.values() if d["answered"] > 0)
-    overall = weighted_sum / weight_sum if weight_sum > 0 else 0
-    
+ASSESSMENT_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+
+def assessment_metadata() -> dict:
     return {
-        "overall": overall,
-        "domains": domain_scores,
-        "total_answered": sum(d["answered"] for d in domain_scores.values()),
-        "total_questions": count_questions(domains)
+        "organization": st.session_state.org_name,
+        "assessor": st.session_state.assessor_name,
+        "industry": st.session_state.industry
     }
 
-def get_maturity(score: float) -> tuple:
-    """Get maturity level, CSS class, and description"""
-    if score >= 80:
-        return "Optimized", "success", "Industry-leading with continuous improvement"
-    elif score >= 60:
-        return "Managed", "warning", "Proactive management with defined processes"
-    elif score >= 40:
-        return "Developing", "warning", "Emerging practices with inconsistent adoption"
-    elif score >= 20:
-        return "Initial", "danger", "Ad-hoc processes with limited governance"
-    return "Not Assessed", "neutral", "Assessment not yet complete"
+def assessment_fingerprint(metadata: dict) -> str:
+    """Hash of the non-response fields autosave persists (responses are queued per change)"""
+    return content_key(metadata, st.session_state.ai_analysis)
 
-def find_gaps(responses: dict, domains: dict) -> list:
-    """Find gaps (low scores) prioritized by risk"""
-    gaps = []
-    for dname, ddata in domains.items():
-        for q in ddata["questions"]:
-            qid = q["id"]
-            if qid in responses and responses[qid] <= 2:
-                gaps.append({
-                    "id": qid,
-                    "domain": dname,
-                    "question": q["question"],
-                    "context": q.get("context", ""),
-                    "score": responses[qid],
-                    "risk": q["risk"]
-                })
-    
-    risk_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    return sorted(gaps, key=lambda x: (risk_order.get(x["risk"], 3), -x["score"]))
+def queue_response_change(assessment_id: str, kind: str, qid: str, value):
+    """ScoreState on_change listener: one buffered key per answer, coalesced until the next flush"""
+    try:
+        error = record_change(assessment_id, f"{kind}:{qid}", value)
+        if error:
+            st.session_state.autosave_error = error
+    except Exception as e:
+        st.session_state.autosave_error = str(e)
+
+def restore_assessment():
+    """Bind the session to ?assessment=<id>, resuming saved work from any server task"""
+    if st.session_state.assessment_id:
+        return
+    assessment_id = st.query_params.get("assessment", "")
+    record = None
+    if ASSESSMENT_ID_PATTERN.match(assessment_id):
+        try:
+            record = load_assessment(assessment_id)
+        except Exception as e:
+            st.session_state.autosave_error = f"Could not load saved assessment: {e}"
+    else:
+        assessment_id = secrets.token_urlsafe(12)
+    
+    if record:
+        metadata = record["metadata"]
+        st.session_state.ct_responses = record["ct_responses"]
+        st.session_state.ga_responses = record["ga_responses"]
+        st.session_state.org_name = metadata.get("organization", "")
+        st.session_state.assessor_name = metadata.get("assessor", "")
+        if metadata.get("industry") in BENCHMARKS:
+            st.session_state.industry = metadata["industry"]
+        st.session_state.ai_analysis = record["ai_analysis"]
+    # Nothing to save until the user changes something (fresh visits do not create records)
+    st.session_state.saved_fingerprint = assessment_fingerprint(assessment_metadata())
+    
+    st.session_state.assessment_id = assessment_id
+    st.query_params["assessment"] = assessment_id
+    for kind in ("ct", "ga"):
+        st.session_state[f"{kind}_state"].on_change = functools.partial(queue_response_change, assessment_id, kind)
+    try:
+        # Flushes this assessment's buffered changes when the browser session ends
+        st.session_state.autosave_session = autosave_session(assessment_id)
+    except Exception as e:
+        st.session_state.autosave_error = str(e)
+
+def persist_assessment():
+    """Queue metadata / AI analysis when they changed; responses were queued as they happened"""
+    try:
+        metadata = assessment_metadata()
+        fingerprint = assessment_fingerprint(metadata)
+        if fingerprint != st.session_state.saved_fingerprint:
+            record_change(st.session_state.assessment_id, "metadata", metadata)
+            record_change(st.session_state.assessment_id, "ai_analysis", st.session_state.ai_analysis)
+            st.session_state.saved_fingerprint = fingerprint
+        st.session_state.autosave_status = autosave_metrics()
+        if st.session_state.autosave_status:
+            st.session_state.autosave_error = st.session_state.autosave_status["last_error"]
+    except Exception as e:
+        st.session_state.autosave_error = str(e)
 
-def handle_response_change(qid: str, responses: dict, options: list):
+def handle_response_change(qid: str, state: ScoreState, options: list):
     """Callback handler for question response changes - KEY BUG FIX"""
     key = f"sel_{qid}"
     if key in st.session_state:
         selected = st.session_state[key]
         if selected == NOT_ANSWERED:
             # Remove from responses if user selects "Not yet assessed"
-            responses.pop(qid, None)
+            state.clear(qid)
         else:
             # Find index (1-5) for the selected option
             try:
                 idx = options.index(selected)
-                responses[qid] = idx  # 1-5 for actual answers
+                state.set(qid, idx)  # 1-5 for actual answers; updates running totals in O(1)
             except ValueError:
                 pass
 
@@ -1262,80 +743,176 @@ def render_metric_card(value: float, label: str, suffix: str = "%"):
     </div>
     ''', unsafe_allow_html=True)
 
-def render_questions(domains: dict, responses: dict, prefix: str):
-    """Render assessment questions with proper state management"""
-    for dname, ddata in domains.items():
-        answered = sum(1 for q in ddata["questions"] if q["id"] in responses)
-        total = len(ddata["questions"])
-        pct = (answered / total * 100) if total > 0 else 0
+QUESTION_VIEWS = {
+    "domain": "One domain at a time",
+    "all": "All domains"
+}
+
+def render_domain_questions(ddata: dict, state: ScoreState):
+    """Question cards and response selectboxes for one domain"""
+    responses = state.responses
+    pillars_html = " ".join([f'<span class="pillar-tag pillar-{p}">{WA_PILLARS.get(p, p)}</span>' for p in ddata["pillars"]])
+    st.markdown(f"**{ddata.get('description', '')}**")
+    st.markdown(f'<div class="pillar-container">{pillars_html}</div>', unsafe_allow_html=True)
+    st.markdown("---")
+    
+    for q in ddata["questions"]:
+        qid = q["id"]
+        is_answered = qid in responses
+        card_class = "answered" if is_answered else ""
         
-        pillars_html = " ".join([f'<span class="pillar-tag pillar-{p}">{WA_PILLARS.get(p, p)}</span>' for p in ddata["pillars"]])
+        st.markdown(f'''
+        <div class="question-card {card_class}">
+            <div class="question-header">
+                <span class="question-id">{qid}</span>
+                <span class="risk-badge risk-{q['risk']}">{q['risk']}</span>
+            </div>
+            <div class="question-text">{q['question']}</div>
+        </div>
+        ''', unsafe_allow_html=True)
         
-        with st.expander(f"📁 {dname} — {answered}/{total} answered ({pct:.0f}%) • Weight: {ddata['weight']*100:.0f}%"):
-            st.markdown(f"**{ddata.get('description', '')}**")
-            st.markdown(f'<div class="pillar-container">{pillars_html}</div>', unsafe_allow_html=True)
-            st.markdown("---")
-            
-            for q in ddata["questions"]:
-                qid = q["id"]
-                is_answered = qid in responses
-                card_class = "answered" if is_answered else ""
-                
-                st.markdown(f'''
-                <div class="question-card {card_class}">
-                    <div class="question-header">
-                        <span class="question-id">{qid}</span>
-                        <span class="risk-badge risk-{q['risk']}">{q['risk']}</span>
-                    </div>
-                    <div class="question-text">{q['question']}</div>
-                </div>
-                ''', unsafe_allow_html=True)
-                
-                # Show context in expander
-                if q.get("context"):
-                    with st.expander("💡 Why this matters", expanded=False):
-                        st.markdown(f'<div class="question-context">{q["context"]}</div>', unsafe_allow_html=True)
-                
-                # Build options list with placeholder first
-                options = [NOT_ANSWERED] + q["options"]
-                
-                # Get current selection index
-                current_idx = 0
-                if qid in responses:
-                    current_idx = responses[qid]  # 1-5 maps to index 1-5
-                
-                # Selectbox with on_change callback
-                st.selectbox(
-                    f"Select response for {qid}",
-                    options=options,
-                    index=current_idx,
-                    key=f"sel_{qid}",
-                    label_visibility="collapsed",
-                    on_change=handle_response_change,
-                    args=(qid, responses, options)
-                )
-                
-                st.markdown("")  # Spacing
+        # Show context in expander
+        if q.get("context"):
+            with st.expander("💡 Why this matters", expanded=False):
+                st.markdown(f'<div class="question-context">{q["context"]}</div>', unsafe_allow_html=True)
+        
+        # Build options list with placeholder first
+        options = [NOT_ANSWERED] + q["options"]
+        
+        # Get current selection index
+        current_idx = 0
+        if qid in responses:
+            current_idx = responses[qid]  # 1-5 maps to index 1-5
+        
+        # Selectbox with on_change callback
+        st.selectbox(
+            f"Select response for {qid}",
+            options=options,
+            index=current_idx,
+            key=f"sel_{qid}",
+            label_visibility="collapsed",
+            on_change=handle_response_change,
+            args=(qid, state, options)
+        )
+        
+        st.markdown("")  # Spacing
 
-def call_claude(prompt: str) -> str:
-    """Call Claude API for AI analysis"""
-    try:
-        import anthropic
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            return """⚠️ **API Key Required**
+def step_question_domain(prefix: str, names: list, step: int):
+    """Previous / Next button callback; runs before the domain selectbox is rebuilt"""
+    key = f"{prefix}_domain"
+    current = names.index(st.session_state.get(key, names[0]))
+    st.session_state[key] = names[max(0, min(len(names) - 1, current + step))]
 
-To enable AI-powered analysis, add your Anthropic API key:
+def render_questions(domains: dict, state: ScoreState, prefix: str):
+    """Render assessment questions with proper state management
+    
+    Streamlit serializes every element on every rerun, collapsed expanders included, so the
+    default view only builds the open domain's widgets (~6 questions instead of 60-72).
+    """
+    view = st.radio(
+        "Question view",
+        options=list(QUESTION_VIEWS),
+        format_func=QUESTION_VIEWS.get,
+        key=f"{prefix}_question_view",
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    
+    if view == "all":
+        for dname, ddata in domains.items():
+            answered = state.domain_answered(dname)
+            total = len(ddata["questions"])
+            pct = (answered / total * 100) if total > 0 else 0
+            with st.expander(f"📁 {dname} — {answered}/{total} answered ({pct:.0f}%) • Weight: {ddata['weight']*100:.0f}%"):
+                render_domain_questions(ddata, state)
+        return
+    
+    # Labels stay constant (progress is shown below) so the selection survives answer changes
+    names = list(domains)
+    col_prev, col_select, col_next = st.columns([1, 6, 1])
+    with col_select:
+        dname = st.selectbox(
+            "Domain",
+            options=names,
+            format_func=lambda d: f"📁 {names.index(d) + 1}. {d}",
+            key=f"{prefix}_domain",
+            label_visibility="collapsed"
+        )
+    position = names.index(dname)
+    with col_prev:
+        st.button("◀ Previous", key=f"{prefix}_domain_prev", use_container_width=True, disabled=position == 0,
+                  on_click=step_question_domain, args=(prefix, names, -1))
+    with col_next:
+        st.button("Next ▶", key=f"{prefix}_domain_next", use_container_width=True, disabled=position == len(names) - 1,
+                  on_click=step_question_domain, args=(prefix, names, 1))
+    
+    ddata = domains[dname]
+    answered = state.domain_answered(dname)
+    total = len(ddata["questions"])
+    pct = (answered / total * 100) if total > 0 else 0
+    st.progress(pct / 100, text=f"Domain {position + 1} of {len(names)} • {answered}/{total} answered ({pct:.0f}%) • Weight: {ddata['weight']*100:.0f}%")
+    render_domain_questions(ddata, state)
 
-**Streamlit Cloud:** Go to Settings → Secrets → Add `ANTHROPIC_API_KEY = "sk-ant-..."`
+QUESTION_PANELS = {
+    "ct": (CT_QUESTIONS, "🎛️", "Control Tower Migration Readiness", "Comprehensive assessment across 12 domains"),
+    "ga": (GA_QUESTIONS, "⚡", "Golden Architecture (Serverless) Assessment", "Serverless maturity evaluation across 10 domains")
+}
 
-**Local:** Set environment variable `ANTHROPIC_API_KEY`"""
-        
-        client = anthropic.Anthropic(api_key=api_key)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=8192,
-            system="""You are an expert AWS Solutions Architect with deep expertise in:
+def record_tab_timing(tab: str, started: float):
+    """Keep the recent render times of one tab for this session and caption them"""
+    elapsed = time.perf_counter() - started
+    history = st.session_state.tab_timings.setdefault(tab, [])
+    history.append(elapsed)
+    del history[:-50]
+    st.caption(f"⏱️ {tab} rendered in {elapsed * 1000:.0f} ms • median {statistics.median(history) * 1000:.0f} ms over the last {len(history)} runs")
+
+@st.fragment
+def render_question_panel(kind: str):
+    """Questionnaire tab; answering a question reruns only this fragment, not the dashboard or sidebar"""
+    started = time.perf_counter()
+    domains, icon, title, subtitle = QUESTION_PANELS[kind]
+    state = get_score_state(kind)
+    total = state.total_questions
+    answered = state.total_answered
+    
+    st.markdown(f'''
+    <div class="section-header">
+        <div class="section-icon">{icon}</div>
+        <div>
+            <div class="section-title">{title}</div>
+            <div class="section-subtitle">{subtitle}</div>
+        </div>
+    </div>
+    ''', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Questions", total)
+    with col2:
+        st.metric("Answered", answered)
+    with col3:
+        st.metric("Completion", f"{(answered / total * 100) if total > 0 else 0:.0f}%")
+    with col4:
+        st.metric("Domains", len(domains))
+    
+    st.info("💡 **Instructions:** Pick a domain (or switch to *All domains*) and answer its questions. Select '⊘ Not yet assessed' to skip. Progress is saved automatically.")
+    st.markdown("---")
+    
+    render_questions(domains, state, kind)
+    record_tab_timing(APP_TABS[1] if kind == "ct" else APP_TABS[2], started)
+
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+CLAUDE_MAX_TOKENS = 8192
+ANALYSIS_TYPES = [
+    "🎯 Comprehensive Gap Analysis & Prioritization",
+    "🗺️ 12-Month Implementation Roadmap",
+    "⚠️ Risk Assessment Matrix",
+    "💰 Cost-Benefit Analysis",
+    "🏗️ Architecture Recommendations",
+    "📋 Executive Summary for Leadership"
+]
+LEADERSHIP_ANALYSES = [t for t in ANALYSIS_TYPES if not t.startswith("🏗️")]
+CLAUDE_SYSTEM_PROMPT = """You are an expert AWS Solutions Architect with deep expertise in:
 - AWS Control Tower implementation and migration
 - Serverless architecture patterns and best practices
 - AWS Well-Architected Framework
@@ -1346,443 +923,313 @@ Provide detailed, actionable recommendations with:
 - Effort estimates (person-weeks)
 - Risk considerations and dependencies
 - Prioritized sequencing with quick wins identified
-- Success metrics and KPIs""",
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
+- Success metrics and KPIs"""
+
+API_KEY_MISSING = """⚠️ **API Key Required**
+
+To enable AI-powered analysis, add your Anthropic API key:
+
+**Streamlit Cloud:** Go to Settings → Secrets → Add `ANTHROPIC_API_KEY = "sk-ant-..."`
+
+**Local:** Set environment variable `ANTHROPIC_API_KEY`"""
+
+
+def call_claude(prompt: str) -> str:
+    """Call Claude API for AI analysis"""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        return API_KEY_MISSING
+    try:
+        return create_message(prompt, CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS)["text"]
     except Exception as e:
         return f"⚠️ **Error**: {str(e)}"
 
-# =============================================================================
-# CHART GENERATION FUNCTIONS
-# =============================================================================
+def stream_claude(prompt: str, timings: dict):
+    """Yield Claude's answer as text chunks; fills timings with ttft_s and total_s"""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        timings.update(ttft_s=None, total_s=0.0)
+        yield API_KEY_MISSING
+        return
+    try:
+        yield from stream_text(prompt, CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS, timings)
+    except Exception as e:
+        separator = "\n\n" if timings.get("ttft_s") is not None else ""
+        yield f"{separator}⚠️ **Error**: {str(e)}"
 
-def create_gauge_chart(score, title, size=(4, 3)):
-    """Create a beautiful gauge/speedometer chart for scores"""
-    fig, ax = plt.subplots(figsize=size, subplot_kw={'projection': 'polar'})
-    
-    # Colors for different score ranges
-    colors_gradient = ['#DC2626', '#EA580C', '#D97706', '#CA8A04', '#65A30D', '#059669']
-    
-    # Set up the gauge
-    ax.set_theta_zero_location('N')
-    ax.set_theta_direction(-1)
-    ax.set_thetamin(0)
-    ax.set_thetamax(180)
-    
-    # Create the background arc segments
-    theta_ranges = np.linspace(0, np.pi, 7)
-    for i in range(6):
-        theta = np.linspace(theta_ranges[i], theta_ranges[i+1], 50)
-        r = np.ones_like(theta) * 0.9
-        ax.fill_between(theta, 0.6, r, color=colors_gradient[i], alpha=0.3)
-    
-    # Add the score indicator
-    score_angle = np.pi * (1 - score / 100)
-    ax.annotate('', xy=(score_angle, 0.85), xytext=(np.pi/2, 0),
-                arrowprops=dict(arrowstyle='->', color='#1e293b', lw=3))
-    
-    # Add score text in center
-    ax.text(np.pi/2, 0.25, f'{score:.0f}%', ha='center', va='center', 
-            fontsize=24, fontweight='bold', color='#1e293b')
-    ax.text(np.pi/2, 0.05, title, ha='center', va='center', 
-            fontsize=10, color='#64748b')
-    
-    # Clean up the chart
-    ax.set_ylim(0, 1)
-    ax.set_yticks([])
-    ax.set_xticks([])
-    ax.spines['polar'].set_visible(False)
-    
-    # Save to buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+def record_ai_timing(analysis_type: str, timings: dict):
+    """Keep the latest latency figures per analysis type for this session"""
+    history = st.session_state.ai_timings.setdefault(analysis_type, [])
+    history.append({**timings, "at": datetime.now().isoformat(timespec="seconds")})
+    del history[:-20]
 
-def create_score_gauges(ct_score, ga_score, combined_score, benchmark):
-    """Create a combined gauge chart showing all three scores"""
-    fig, axes = plt.subplots(1, 4, figsize=(14, 3.5))
-    
-    scores = [ct_score, ga_score, combined_score, benchmark]
-    titles = ['Control Tower', 'Golden Architecture', 'Combined Score', 'Industry Benchmark']
-    main_colors = ['#0284c7', '#7c3aed', '#059669', '#f59e0b']
-    
-    for ax, score, title, color in zip(axes, scores, titles, main_colors):
-        # Create a semi-circular gauge
-        ax.set_xlim(-1.5, 1.5)
-        ax.set_ylim(-0.2, 1.3)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
-        # Background arc
-        theta = np.linspace(np.pi, 0, 100)
-        x_bg = np.cos(theta)
-        y_bg = np.sin(theta)
-        ax.fill(np.append(x_bg, [0]), np.append(y_bg, [0]), color='#e2e8f0', alpha=0.5)
-        
-        # Score arc
-        score_theta = np.linspace(np.pi, np.pi - (np.pi * score / 100), 100)
-        x_score = np.cos(score_theta)
-        y_score = np.sin(score_theta)
-        ax.fill(np.append(x_score, [0]), np.append(y_score, [0]), color=color, alpha=0.8)
-        
-        # Add gradient effect segments
-        for i, (start, end, c) in enumerate([
-            (0, 20, '#DC2626'), (20, 40, '#EA580C'), (40, 60, '#D97706'),
-            (60, 80, '#65A30D'), (80, 100, '#059669')
-        ]):
-            seg_start = np.pi - (np.pi * start / 100)
-            seg_end = np.pi - (np.pi * end / 100)
-            seg_theta = np.linspace(seg_start, seg_end, 20)
-            ax.plot(1.1 * np.cos(seg_theta), 1.1 * np.sin(seg_theta), color=c, linewidth=8, alpha=0.6)
-        
-        # Score text
-        ax.text(0, 0.4, f'{score:.0f}%', ha='center', va='center', 
-                fontsize=28, fontweight='bold', color='#1e293b')
-        ax.text(0, -0.1, title, ha='center', va='center', 
-                fontsize=11, fontweight='bold', color='#64748b')
-        
-        # Maturity label
-        if score >= 80:
-            maturity = "Optimized"
-            mat_color = '#059669'
-        elif score >= 60:
-            maturity = "Managed"
-            mat_color = '#65A30D'
-        elif score >= 40:
-            maturity = "Developing"
-            mat_color = '#D97706'
-        elif score >= 20:
-            maturity = "Initial"
-            mat_color = '#EA580C'
+def describe_ai_timing(analysis_type: str):
+    """Caption for the most recent run of analysis_type, or None if it never ran"""
+    history = st.session_state.ai_timings.get(analysis_type)
+    if not history:
+        return None
+    last_run = history[-1]
+    if last_run.get("cached"):
+        return f"⚡ {analysis_type}: served from the AI result cache (no API call)"
+    parts = [f"⏱️ {analysis_type}:"]
+    if last_run.get("ttft_s") is not None:
+        parts.append(f"first token {last_run['ttft_s']:.1f}s •")
+    parts.append(f"complete in {last_run['total_s']:.1f}s")
+    if last_run.get("attempts", 1) > 1:
+        parts.append(f"• {last_run['attempts']} attempts")
+    if last_run.get("output_tokens"):
+        parts.append(f"• {last_run['output_tokens']:,} output tokens")
+    return " ".join(parts)
+
+def generate_analyses(prompts: dict, cache, skip_cache: bool) -> dict:
+    """Answer {analysis_type: prompt} from the cache or concurrently from Claude, in prompt order"""
+    results, pending = {}, {}
+    for analysis_type, prompt in prompts.items():
+        cached = None
+        if cache and not skip_cache:
+            cached = cache.get(prompt, CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS)
+        if cached is not None:
+            results[analysis_type] = cached
+            record_ai_timing(analysis_type, {"ttft_s": 0.0, "total_s": 0.0, "cached": True})
         else:
-            maturity = "Not Assessed"
-            mat_color = '#64748b'
-        
-        ax.text(0, 0.15, maturity, ha='center', va='center', 
-                fontsize=9, color=mat_color, fontweight='bold')
-    
-    plt.tight_layout()
+            pending[analysis_type] = prompt
+    
+    if pending and not os.environ.get("ANTHROPIC_API_KEY"):
+        results.update({analysis_type: API_KEY_MISSING for analysis_type in pending})
+    elif pending:
+        with st.status(f"Generating {len(pending)} analyses ({min(len(pending), max_concurrency())} at a time)...",
+                       expanded=True) as status:
+            for analysis_type, result in generate_many(pending, CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS):
+                if "error" in result:
+                    results[analysis_type] = f"⚠️ **Error**: {result['error']}"
+                    st.write(f"⚠️ {analysis_type} failed after {result['latency_s']:.1f}s")
+                else:
+                    results[analysis_type] = result["text"]
+                    if cache:
+                        cache.put(pending[analysis_type], CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS,
+                                  result["text"], result["stop_reason"])
+                    st.write(f"✅ {analysis_type} ({result['latency_s']:.1f}s)")
+                record_ai_timing(analysis_type, {
+                    "ttft_s": None,
+                    "total_s": result["latency_s"],
+                    "attempts": result.get("attempts", 1),
+                    "output_tokens": result.get("output_tokens"),
+                })
+            status.update(label=f"Generated {len(pending)} analyses", state="complete", expanded=False)
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+    return {analysis_type: results[analysis_type] for analysis_type in prompts}
 
-def create_radar_chart(domain_scores, title, color='#0284c7'):
-    """Create a radar/spider chart for domain analysis"""
-    # Prepare data
-    categories = list(domain_scores.keys())
-    values = [domain_scores[cat]['score'] for cat in categories]
-    
-    # Truncate long category names
-    categories = [cat[:20] + '...' if len(cat) > 20 else cat for cat in categories]
-    
-    # Number of variables
-    num_vars = len(categories)
-    
-    # Compute angle for each category
-    angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
-    values += values[:1]  # Complete the loop
-    angles += angles[:1]
-    
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
-    
-    # Draw the chart
-    ax.fill(angles, values, color=color, alpha=0.25)
-    ax.plot(angles, values, color=color, linewidth=2, marker='o', markersize=6)
-    
-    # Add reference circles
-    for level in [20, 40, 60, 80, 100]:
-        circle_color = '#059669' if level >= 80 else '#65A30D' if level >= 60 else '#D97706' if level >= 40 else '#EA580C' if level >= 20 else '#DC2626'
-        ax.plot(angles, [level] * len(angles), color=circle_color, linewidth=0.5, linestyle='--', alpha=0.5)
-    
-    # Set category labels
-    ax.set_xticks(angles[:-1])
-    ax.set_xticklabels(categories, fontsize=8)
-    
-    # Set radial limits
-    ax.set_ylim(0, 100)
-    ax.set_yticks([20, 40, 60, 80, 100])
-    ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'], fontsize=7, color='#64748b')
-    
-    # Title
-    ax.set_title(title, fontsize=14, fontweight='bold', color='#1e293b', pad=20)
-    
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+PREFILL_UPLOAD_TYPES = ["pdf", "docx", "pptx", "txt", "json"]
+PREFILL_CATALOGS = {"ct": CT_QUESTIONS, "ga": GA_QUESTIONS}
 
-def create_horizontal_bar_chart(domain_scores, title, color='#0284c7'):
-    """Create a horizontal bar chart for domain scores"""
-    categories = list(domain_scores.keys())
-    values = [domain_scores[cat]['score'] for cat in categories]
-    
-    # Truncate long names
-    categories = [cat[:30] + '...' if len(cat) > 30 else cat for cat in categories]
-    
-    fig, ax = plt.subplots(figsize=(10, max(6, len(categories) * 0.5)))
-    
-    # Create color gradient based on score
-    colors_list = []
-    for v in values:
-        if v >= 80:
-            colors_list.append('#059669')
-        elif v >= 60:
-            colors_list.append('#65A30D')
-        elif v >= 40:
-            colors_list.append('#D97706')
-        elif v >= 20:
-            colors_list.append('#EA580C')
-        else:
-            colors_list.append('#DC2626')
-    
-    y_pos = np.arange(len(categories))
-    
-    # Background bars (100%)
-    ax.barh(y_pos, [100] * len(categories), color='#e2e8f0', height=0.6)
-    
-    # Score bars
-    bars = ax.barh(y_pos, values, color=colors_list, height=0.6, alpha=0.85)
-    
-    # Add value labels
-    for i, (bar, val) in enumerate(zip(bars, values)):
-        ax.text(val + 2, bar.get_y() + bar.get_height()/2, f'{val:.0f}%', 
-                va='center', ha='left', fontsize=10, fontweight='bold', color='#1e293b')
-    
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(categories, fontsize=9)
-    ax.set_xlim(0, 110)
-    ax.set_xlabel('Score (%)', fontsize=10, color='#64748b')
-    ax.set_title(title, fontsize=14, fontweight='bold', color='#1e293b', pad=15)
-    
-    # Add vertical lines for reference
-    for x in [20, 40, 60, 80]:
-        ax.axvline(x=x, color='#cbd5e1', linestyle='--', linewidth=0.5, alpha=0.7)
-    
-    # Clean up
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['bottom'].set_color('#e2e8f0')
-    ax.spines['left'].set_color('#e2e8f0')
-    
-    plt.tight_layout()
-    
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+def prefill_rows() -> list:
+    """Pending suggestions in catalog order, pre-selected when unanswered and not low confidence"""
+    rows = []
+    for kind, domains in PREFILL_CATALOGS.items():
+        suggestions = st.session_state.prefill_suggestions.get(kind, {})
+        responses = st.session_state[f"{kind}_responses"]
+        for dname, ddata in domains.items():
+            for q in ddata["questions"]:
+                suggestion = suggestions.get(q["id"])
+                if suggestion is None:
+                    continue
+                current = responses.get(q["id"])
+                rows.append({
+                    "kind": kind, "id": q["id"], "answer": suggestion["answer"],
+                    "apply": current is None and suggestion["confidence"] != "low",
+                    "question": q["question"],
+                    "suggested": f"{suggestion['answer']}. {q['options'][suggestion['answer'] - 1]}",
+                    "current": f"{current}. {q['options'][current - 1]}" if current else NOT_ANSWERED,
+                    "confidence": suggestion["confidence"],
+                    "rationale": suggestion["rationale"],
+                    "sources": ", ".join(suggestion["sources"]),
+                })
+    return rows
 
-def create_gap_pie_chart(ct_gaps, ga_gaps):
-    """Create a pie chart showing gap distribution by risk level"""
-    # Count gaps by risk level
-    critical = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'critical'])
-    high = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'high'])
-    medium = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'medium'])
-    
-    if critical + high + medium == 0:
-        # No gaps - create a "No Gaps" chart
-        fig, ax = plt.subplots(figsize=(6, 6))
-        ax.text(0.5, 0.5, 'No Gaps\nIdentified', ha='center', va='center', 
-                fontsize=20, fontweight='bold', color='#059669', transform=ax.transAxes)
-        ax.axis('off')
-    else:
-        fig, ax = plt.subplots(figsize=(8, 6))
-        
-        sizes = [critical, high, medium]
-        labels = [f'Critical\n({critical})', f'High\n({high})', f'Medium\n({medium})']
-        colors_pie = ['#DC2626', '#EA580C', '#D97706']
-        explode = (0.05, 0.02, 0)
-        
-        # Filter out zero values
-        non_zero = [(s, l, c, e) for s, l, c, e in zip(sizes, labels, colors_pie, explode) if s > 0]
-        if non_zero:
-            sizes, labels, colors_pie, explode = zip(*non_zero)
-            
-            wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors_pie, 
-                                               explode=explode, autopct='%1.0f%%',
-                                               shadow=True, startangle=90,
-                                               textprops={'fontsize': 11, 'fontweight': 'bold'})
-            
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-        
-        ax.set_title('Gap Distribution by Risk Level', fontsize=14, fontweight='bold', 
-                    color='#1e293b', pad=20)
-    
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+def apply_prefill_suggestions(rows: list):
+    """Apply button callback: record the ticked suggestions as answers (autosaved like manual ones)"""
+    edits = st.session_state.get("prefill_editor", {}).get("edited_rows", {})
+    applied = 0
+    for i, row in enumerate(rows):
+        edit = edits.get(i, edits.get(str(i), {}))
+        if edit.get("Apply", row["apply"]):
+            get_score_state(row["kind"]).set(row["id"], row["answer"])
+            st.session_state.pop(f"sel_{row['id']}", None)  # Selectbox re-reads the new answer
+            applied += 1
+    st.session_state.prefill_suggestions = {}
+    st.toast(f"Applied {applied} suggested answers")
 
-def create_industry_comparison_chart(combined_score, benchmarks, current_industry):
-    """Create a bar chart comparing score against industry benchmarks"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    industries = [b['name'] for b in benchmarks.values()]
-    averages = [b['avg'] for b in benchmarks.values()]
-    top_performers = [b['top'] for b in benchmarks.values()]
-    
-    x = np.arange(len(industries))
-    width = 0.35
-    
-    # Create bars
-    bars1 = ax.bar(x - width/2, averages, width, label='Industry Average', 
-                   color='#94a3b8', alpha=0.7)
-    bars2 = ax.bar(x + width/2, top_performers, width, label='Top Performers', 
-                   color='#64748b', alpha=0.7)
-    
-    # Add your score line
-    ax.axhline(y=combined_score, color='#0284c7', linestyle='-', linewidth=3, 
-               label=f'Your Score ({combined_score:.0f}%)')
-    
-    # Highlight current industry
-    current_idx = list(benchmarks.keys()).index(current_industry)
-    bars1[current_idx].set_color('#0284c7')
-    bars1[current_idx].set_alpha(1.0)
-    bars2[current_idx].set_color('#0369a1')
-    bars2[current_idx].set_alpha(1.0)
-    
-    ax.set_ylabel('Score (%)', fontsize=11, color='#64748b')
-    ax.set_title('Industry Benchmark Comparison', fontsize=14, fontweight='bold', 
-                color='#1e293b', pad=15)
-    ax.set_xticks(x)
-    ax.set_xticklabels(industries, rotation=25, ha='right', fontsize=9)
-    ax.legend(loc='upper right', fontsize=9)
-    ax.set_ylim(0, 100)
-    
-    # Add value labels on bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax.annotate(f'{height:.0f}%', xy=(bar.get_x() + bar.get_width() / 2, height),
-                   xytext=(0, 3), textcoords="offset points", ha='center', va='bottom', 
-                   fontsize=8, color='#64748b')
-    
-    # Clean up
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['bottom'].set_color('#e2e8f0')
-    ax.spines['left'].set_color('#e2e8f0')
-    ax.yaxis.grid(True, linestyle='--', alpha=0.3)
-    
-    plt.tight_layout()
-    
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+@st.fragment(run_every=1.0)
+def render_prefill_extraction_progress(futures: dict):
+    """Poll background extractions without rerunning the whole app; reruns it once all are done"""
+    done = sum(future.done() for future in futures.values())
+    if done == len(futures):
+        st.rerun()
+    st.progress(done / len(futures), text=f"⏳ Extracting documents... {done}/{len(futures)} done")
 
-def create_maturity_roadmap_chart():
-    """Create a visual roadmap showing maturity phases"""
-    fig, ax = plt.subplots(figsize=(12, 5))
-    
-    phases = ['Phase 1\nFoundation', 'Phase 2\nStandardization', 
-              'Phase 3\nOptimization', 'Phase 4\nExcellence']
-    timelines = ['0-3 months', '3-6 months', '6-12 months', '12+ months']
-    colors_phases = ['#DC2626', '#D97706', '#65A30D', '#059669']
-    
-    # Draw timeline
-    ax.axhline(y=0.5, color='#e2e8f0', linewidth=8, zorder=1)
-    
-    for i, (phase, timeline, color) in enumerate(zip(phases, timelines, colors_phases)):
-        # Phase circles
-        circle = plt.Circle((i * 2 + 1, 0.5), 0.4, color=color, zorder=2)
-        ax.add_patch(circle)
-        
-        # Phase number
-        ax.text(i * 2 + 1, 0.5, str(i + 1), ha='center', va='center', 
-                fontsize=16, fontweight='bold', color='white', zorder=3)
-        
-        # Phase name
-        ax.text(i * 2 + 1, 1.1, phase, ha='center', va='center', 
-                fontsize=11, fontweight='bold', color='#1e293b')
+def prefill_extractions(files: list) -> dict:
+    """Submit each upload to the extraction workers once; returns {file_id: Future} for files"""
+    extractions = st.session_state.prefill_extractions
+    current_ids = {f.file_id for f in files}
+    for file_id in [file_id for file_id in extractions if file_id not in current_ids]:
+        extractions.pop(file_id).cancel()
+    for f in files:
+        if f.file_id not in extractions:
+            extractions[f.file_id] = submit_extraction(f.name, f.type, f.getvalue())
+    return {f.file_id: extractions[f.file_id] for f in files}
+
+def render_document_prefill():
+    """Suggest questionnaire answers from uploaded documents for the assessor to review"""
+    with st.expander("📄 Prefill answers from documents", expanded=bool(st.session_state.prefill_suggestions)):
+        st.caption("Each question retrieves its most relevant passages from your documents and Claude suggests "
+                   "an answer from those passages only. Review the suggestions before applying them.")
+        files = st.file_uploader("Architecture and governance documents", type=PREFILL_UPLOAD_TYPES,
+                                 accept_multiple_files=True, key="prefill_files")
+        futures = prefill_extractions(files or [])
+        extracting = not all(future.done() for future in futures.values())
+        if extracting:
+            render_prefill_extraction_progress(futures)
+        if st.button("🔎 Suggest Answers", disabled=not files or extracting):
+            if not os.environ.get("ANTHROPIC_API_KEY"):
+                st.markdown(API_KEY_MISSING)
+            else:
+                with st.status("Suggesting answers...", expanded=True) as status:
+                    results = [finished_result(futures[f.file_id], f.name, f.size) for f in files]
+                    for result in results:
+                        if result["error"]:
+                            st.write(f"⚠️ {result['name']}: {result['error']}")
+                    documents = [(result["name"], result["text"]) for result in results if result["text"]]
+                    progress = st.progress(0.0, text="Retrieving passages...")
+                    try:
+                        cache = get_ai_cache()
+                    except Exception:
+                        cache = None
+                    suggestions, stats = suggest_answers(
+                        documents, PREFILL_CATALOGS, CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, cache,
+                        on_result=lambda done, total: progress.progress(done / total if total else 1.0,
+                                                                        text=f"Suggested {done}/{total} answers"))
+                    st.session_state.prefill_suggestions = suggestions
+                    st.session_state.prefill_stats = stats
+                    st.session_state.pop("prefill_editor", None)  # Drop ticks made on earlier suggestions
+                    status.update(label=f"{sum(map(len, suggestions.values()))} answers suggested",
+                                  state="complete", expanded=False)
         
-        # Timeline
-        ax.text(i * 2 + 1, -0.1, timeline, ha='center', va='center', 
-                fontsize=9, color='#64748b')
+        stats = st.session_state.prefill_stats
+        if stats:
+            st.caption(f"{stats['retrieved']}/{stats['questions']} questions matched passages in "
+                       f"{stats['passages']:,} passages • {stats['requests']} requests, {stats['cached']} cached, "
+                       f"{stats['errors']} failed • {stats['input_tokens']:,} input / {stats['output_tokens']:,} "
+                       f"output tokens • {stats['total_s']:.1f}s")
         
-        # Connect circles
-        if i < len(phases) - 1:
-            ax.annotate('', xy=(i * 2 + 2.6, 0.5), xytext=(i * 2 + 1.4, 0.5),
-                       arrowprops=dict(arrowstyle='->', color=color, lw=2))
-    
-    ax.set_xlim(-0.5, 8)
-    ax.set_ylim(-0.5, 1.5)
-    ax.axis('off')
-    ax.set_title('Maturity Improvement Roadmap', fontsize=14, fontweight='bold', 
-                color='#1e293b', pad=20)
-    
-    plt.tight_layout()
-    
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+        rows = prefill_rows()
+        if rows:
+            st.data_editor(
+                {
+                    "Apply": [row["apply"] for row in rows],
+                    "ID": [row["id"] for row in rows],
+                    "Question": [row["question"] for row in rows],
+                    "Suggested": [row["suggested"] for row in rows],
+                    "Current": [row["current"] for row in rows],
+                    "Confidence": [row["confidence"] for row in rows],
+                    "Rationale": [row["rationale"] for row in rows],
+                    "Sources": [row["sources"] for row in rows],
+                },
+                key="prefill_editor",
+                hide_index=True,
+                use_container_width=True,
+                disabled=["ID", "Question", "Suggested", "Current", "Confidence", "Rationale", "Sources"],
+                column_config={"Apply": st.column_config.CheckboxColumn("Apply", help="Record this answer")},
+            )
+            st.button("✅ Apply Selected Answers", type="primary", on_click=apply_prefill_suggestions, args=(rows,))
 
-def create_score_comparison_bars(ct_score, ga_score, combined, benchmark):
-    """Create a clean horizontal comparison bar chart"""
-    fig, ax = plt.subplots(figsize=(10, 4))
-    
-    categories = ['Control Tower', 'Golden Architecture', 'Combined Score', f'Industry Benchmark']
-    values = [ct_score, ga_score, combined, benchmark]
-    colors_bars = ['#0284c7', '#7c3aed', '#059669', '#f59e0b']
-    
-    y_pos = np.arange(len(categories))
-    
-    # Background bars
-    ax.barh(y_pos, [100] * len(categories), color='#f1f5f9', height=0.6)
-    
-    # Score bars
-    bars = ax.barh(y_pos, values, color=colors_bars, height=0.6, alpha=0.9)
-    
-    # Add value labels
-    for bar, val in zip(bars, values):
-        ax.text(val + 2, bar.get_y() + bar.get_height()/2, f'{val:.0f}%', 
-                va='center', ha='left', fontsize=12, fontweight='bold', color='#1e293b')
-    
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(categories, fontsize=11, fontweight='bold')
-    ax.set_xlim(0, 115)
-    ax.set_xlabel('Score (%)', fontsize=10, color='#64748b')
-    ax.set_title('Assessment Score Overview', fontsize=14, fontweight='bold', 
-                color='#1e293b', pad=15)
-    
-    # Reference lines
-    for x, label in [(40, 'Developing'), (60, 'Managed'), (80, 'Optimized')]:
-        ax.axvline(x=x, color='#cbd5e1', linestyle='--', linewidth=1, alpha=0.7)
-        ax.text(x, len(categories) - 0.3, label, fontsize=8, color='#94a3b8', 
-                ha='center', va='bottom')
-    
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['bottom'].set_color('#e2e8f0')
-    ax.spines['left'].set_color('#e2e8f0')
-    
-    plt.tight_layout()
-    
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+def build_analysis_prompt(analysis_type: str, context: str, ct_scores: dict, ga_scores: dict,
+                          ct_gaps: list, ga_gaps: list) -> str:
+    """Render the Claude prompt for one analysis type from the current assessment"""
+    combined = (ct_scores["overall"] + ga_scores["overall"]) / 2
+    bench = current_benchmarks()[st.session_state.industry]
+    return f"""
+# AWS Enterprise Assessment Analysis Request
+
+## Analysis Type
+{analysis_type}
+
+## Organization Context
+- **Organization:** {st.session_state.org_name or 'Not specified'}
+- **Assessor:** {st.session_state.assessor_name or 'Not specified'}
+- **Industry:** {bench['name']}
+- **Industry Average:** {bench['avg']}%
+- **Industry Top Quartile:** {bench['top']}%
+
+## Assessment Results
+
+### Control Tower Assessment
+- **Overall Score:** {ct_scores['overall']:.1f}%
+- **Maturity Level:** {get_maturity(ct_scores['overall'])[0]}
+- **Questions Answered:** {ct_scores['total_answered']}/{ct_scores['total_questions']}
+- **Critical Gaps:** {len([g for g in ct_gaps if g['risk']=='critical'])}
+- **High Priority Gaps:** {len([g for g in ct_gaps if g['risk']=='high'])}
+
+**Domain Breakdown:**
+{json.dumps({k: f"{v['score']:.0f}%" for k,v in ct_scores.get('domains',{}).items() if v['answered']>0}, indent=2)}
+
+**Top Gaps (Critical & High):**
+{json.dumps([{"id": g["id"], "question": g["question"][:80], "risk": g["risk"], "score": g["score"]} for g in ct_gaps[:8] if g["risk"] in ["critical", "high"]], indent=2)}
+
+### Golden Architecture Assessment
+- **Overall Score:** {ga_scores['overall']:.1f}%
+- **Maturity Level:** {get_maturity(ga_scores['overall'])[0]}
+- **Questions Answered:** {ga_scores['total_answered']}/{ga_scores['total_questions']}
+- **Critical Gaps:** {len([g for g in ga_gaps if g['risk']=='critical'])}
+- **High Priority Gaps:** {len([g for g in ga_gaps if g['risk']=='high'])}
+
+**Domain Breakdown:**
+{json.dumps({k: f"{v['score']:.0f}%" for k,v in ga_scores.get('domains',{}).items() if v['answered']>0}, indent=2)}
+
+**Top Gaps (Critical & High):**
+{json.dumps([{"id": g["id"], "question": g["question"][:80], "risk": g["risk"], "score": g["score"]} for g in ga_gaps[:8] if g["risk"] in ["critical", "high"]], indent=2)}
+
+### Combined Assessment
+- **Combined Score:** {combined:.1f}%
+- **vs Industry Average:** {combined - bench['avg']:+.1f}%
+
+## Additional Context from User
+{context or 'None provided'}
+
+## Instructions
+Please provide a comprehensive analysis that includes:
+
+1. **Executive Summary** (2-3 paragraphs)
+   - Key findings and overall assessment
+   - Comparison to industry benchmarks
+   - Critical areas requiring immediate attention
+
+2. **Detailed Analysis** based on the selected type above
+   - Specific to the analysis type requested
+   - Data-driven insights from assessment scores
+
+3. **Prioritized Recommendations**
+   - For each recommendation include:
+     - Specific AWS services and configurations
+     - Effort estimate (person-weeks)
+     - Dependencies and prerequisites
+     - Expected outcome/benefit
+
+4. **Implementation Roadmap**
+   - Quick wins (0-30 days)
+   - Short-term (1-3 months)
+   - Medium-term (3-6 months)
+   - Long-term (6-12 months)
+
+5. **Risk Considerations**
+   - Technical risks
+   - Organizational risks
+   - Mitigation strategies
+
+6. **Success Metrics**
+   - KPIs to track progress
+   - Target improvements
+   - Measurement approach
+
+Format with clear markdown headers and bullet points for readability.
+"""
 
 # =============================================================================
 # PLOTLY INTERACTIVE UI CHARTS
@@ -1790,6 +1237,7 @@ def create_score_comparison_bars(ct_score, ga_score, combined, benchmark):
 
 def create_ui_gauge_chart(score, title, color="#0284c7"):
     """Create a beautiful gauge chart for the UI"""
+    import plotly.graph_objects as go
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=score,
@@ -1828,6 +1276,8 @@ def create_ui_gauge_chart(score, title, color="#0284c7"):
 
 def create_ui_score_gauges(ct_score, ga_score, combined, benchmark, bench_name):
     """Create a row of 4 gauge charts"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
     fig = make_subplots(
         rows=1, cols=4,
         specs=[[{'type': 'indicator'}, {'type': 'indicator'}, 
@@ -1871,8 +1321,15 @@ def create_ui_score_gauges(ct_score, ga_score, combined, benchmark, bench_name):
     )
     return fig
 
+def gap_risks(gaps: list) -> list:
+    """Sorted (domain, risk) pairs: everything the gap figures depend on"""
+    return sorted((g["domain"], g["risk"]) for g in gaps)
+
+@cached_figure("ui_radar", lambda domain_scores, title, color="#0284c7":
+               (title, color, [(d, v["score"]) for d, v in domain_scores.items()]))
 def create_ui_radar_chart(domain_scores, title, color="#0284c7"):
     """Create an interactive radar chart for domain analysis"""
+    import plotly.graph_objects as go
     categories = list(domain_scores.keys())
     values = [domain_scores[cat]['score'] for cat in categories]
     
@@ -1932,8 +1389,11 @@ def create_ui_radar_chart(domain_scores, title, color="#0284c7"):
     )
     return fig
 
+@cached_figure("ui_horizontal_bar", lambda domain_scores, title, color="#0284c7":
+               (title, color, [(d, v["score"], v["answered"], v["total"]) for d, v in domain_scores.items()]))
 def create_ui_horizontal_bar_chart(domain_scores, title, color="#0284c7"):
     """Create an interactive horizontal bar chart for domain scores"""
+    import plotly.graph_objects as go
     categories = list(domain_scores.keys())
     values = [domain_scores[cat]['score'] for cat in categories]
     answered = [f"{domain_scores[cat]['answered']}/{domain_scores[cat]['total']}" for cat in categories]
@@ -2004,8 +1464,10 @@ def create_ui_horizontal_bar_chart(domain_scores, title, color="#0284c7"):
     )
     return fig
 
+@cached_figure("ui_gap_donut", lambda ct_gaps, ga_gaps: sorted(g["risk"] for g in ct_gaps + ga_gaps))
 def create_ui_gap_donut_chart(ct_gaps, ga_gaps):
     """Create an interactive donut chart for gap distribution"""
+    import plotly.graph_objects as go
     critical = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'critical'])
     high = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'high'])
     medium = len([g for g in ct_gaps + ga_gaps if g['risk'] == 'medium'])
@@ -2060,8 +1522,10 @@ def create_ui_gap_donut_chart(ct_gaps, ga_gaps):
     )
     return fig
 
+@cached_figure("ui_industry_comparison")
 def create_ui_industry_comparison_chart(combined, benchmarks, current_industry):
     """Create an interactive bar chart for industry comparison"""
+    import plotly.graph_objects as go
     industries = [b['name'] for b in benchmarks.values()]
     averages = [b['avg'] for b in benchmarks.values()]
     top_performers = [b['top'] for b in benchmarks.values()]
@@ -2126,6 +1590,7 @@ def create_ui_industry_comparison_chart(combined, benchmarks, current_industry):
 
 def create_ui_maturity_progress_chart(ct_score, ga_score, combined, bench_avg):
     """Create a progress/bullet chart showing maturity progress"""
+    import plotly.graph_objects as go
     categories = ['Control Tower', 'Golden Architecture', 'Combined', 'Industry Benchmark']
     scores = [ct_score, ga_score, combined, bench_avg]
     colors = ['#0284c7', '#7c3aed', '#059669', '#f59e0b']
@@ -2194,19 +1659,23 @@ def create_ui_maturity_progress_chart(ct_score, ga_score, combined, bench_avg):
     
     return fig
 
+@cached_figure("ui_gap_heatmap", lambda ct_gaps, ga_gaps, ct_questions, ga_questions:
+               (list(ct_questions), list(ga_questions), gap_risks(ct_gaps + ga_gaps)))
 def create_ui_gap_heatmap(ct_gaps, ga_gaps, ct_questions, ga_questions):
     """Create a heatmap showing gaps by domain and risk level"""
+    import plotly.graph_objects as go
     all_domains = list(ct_questions.keys()) + list(ga_questions.keys())
     risk_levels = ['Critical', 'High', 'Medium']
     
-    # Build matrix
-    matrix = []
-    for domain in all_domains:
-        row = []
-        for risk in ['critical', 'high', 'medium']:
-            count = len([g for g in ct_gaps + ga_gaps if g['domain'] == domain and g['risk'] == risk])
-            row.append(count)
-        matrix.append(row)
+    # Build matrix in a single pass over the gaps
+    row_of = {domain: i for i, domain in enumerate(all_domains)}
+    col_of = {'critical': 0, 'high': 1, 'medium': 2}
+    matrix = [[0] * len(col_of) for _ in all_domains]
+    for gaps in (ct_gaps, ga_gaps):
+        for g in gaps:
+            row, col = row_of.get(g['domain']), col_of.get(g['risk'])
+            if row is not None and col is not None:
+                matrix[row][col] += 1
     
     # Truncate domain names
     display_domains = [d[:30] + '...' if len(d) > 30 else d for d in all_domains]
@@ -2240,12 +1709,91 @@ def create_ui_gap_heatmap(ct_gaps, ga_gaps, ct_questions, ga_questions):
     )
     return fig
 
+@cached_figure("ui_portfolio_maturity")
+def create_ui_portfolio_maturity_chart(maturity):
+    """Grouped bar chart of assessments per maturity level for CT, GA and combined scores"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    for section, name, color in [('ct', 'Control Tower', '#0284c7'), ('ga', 'Golden Architecture', '#7c3aed'),
+                                 ('combined', 'Combined', '#ff9900')]:
+        levels = list(maturity[section].keys())
+        fig.add_trace(go.Bar(
+            name=name,
+            x=levels,
+            y=[maturity[section][level] for level in levels],
+            marker_color=color,
+            hovertemplate=f'<b>{name}</b><br>%{{x}}: %{{y}} assessments<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=dict(text='Maturity Distribution', font=dict(size=16, color='#1e293b'), x=0),
+        barmode='group',
+        xaxis=dict(tickfont=dict(size=12, color='#1e293b')),
+        yaxis=dict(title='Assessments', gridcolor='#f1f5f9', tickfont=dict(color='#64748b')),
+        height=380,
+        margin=dict(l=20, r=20, t=60, b=40),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
+    )
+    return fig
+
+@cached_figure("ui_domain_distribution")
+def create_ui_domain_distribution_chart(domain_stats, title, color="#0284c7"):
+    """Box plot of per-domain score percentiles (p10 / p25 / median / p75 / p90) across the portfolio"""
+    import plotly.graph_objects as go
+    domains = [d for d, s in domain_stats.items() if s['assessed'] > 0]
+    display_domains = [d[:30] + '...' if len(d) > 30 else d for d in domains]
+    stats = [domain_stats[d] for d in domains]
+    
+    fig = go.Figure(go.Box(
+        y=display_domains,
+        orientation='h',
+        lowerfence=[s['p10'] for s in stats],
+        q1=[s['p25'] for s in stats],
+        median=[s['p50'] for s in stats],
+        q3=[s['p75'] for s in stats],
+        upperfence=[s['p90'] for s in stats],
+        mean=[s['mean'] for s in stats],
+        marker_color=color,
+        fillcolor=f'rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.25)',
+        showlegend=False
+    ))
+    
+    fig.update_layout(
+        title=dict(text=title, font=dict(size=16, color='#1e293b'), x=0),
+        xaxis=dict(title='Score (%) • whiskers p10-p90', range=[0, 100], gridcolor='#f1f5f9', tickfont=dict(color='#64748b')),
+        yaxis=dict(tickfont=dict(size=11, color='#1e293b'), autorange='reversed'),
+        height=max(350, len(domains) * 40),
+        margin=dict(l=20, r=20, t=60, b=40),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
 # =============================================================================
 # COMPREHENSIVE PDF REPORT GENERATOR
 # =============================================================================
+# Bump when a report section's layout or static text changes so cached pages are not reused
+REPORT_SECTION_VERSION = "1"
+
+@timed("pdf_report", log_level=logging.INFO)
 def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_responses, 
-                        ct_questions, ga_questions, benchmarks, ai_analysis):
-    """Generate a comprehensive 30+ page PDF assessment report"""
+                        ct_questions, ga_questions, benchmarks, ai_analysis, progress=None):
+    """Generate a comprehensive 30+ page PDF assessment report
+    
+    progress, if given, is called with a report_jobs.REPORT_SECTIONS key as each section starts.
+    """
+    # PDF stack is imported on first use to keep it out of app cold start
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
+    )
+    from reportlab.graphics.shapes import Drawing, Rect, String
     
     buffer = io.BytesIO()
     
@@ -2326,7 +1874,8 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
         fontName='Helvetica-Bold'
     ))
     
-    styles.add(ParagraphStyle(
+    # The sample sheet already defines BodyText and add() rejects duplicates
+    styles.byName['BodyText'] = ParagraphStyle(
         name='BodyText',
         parent=styles['Normal'],
         fontSize=10,
@@ -2334,7 +1883,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
         alignment=TA_JUSTIFY,
         spaceAfter=8,
         leading=14
-    ))
+    )
     
     styles.add(ParagraphStyle(
         name='SmallText',
@@ -2383,7 +1932,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # Calculate scores
     ct_scores = calc_scores(ct_responses, ct_questions)
     ga_scores = calc_scores(ga_responses, ga_questions)
-    combined = (ct_scores["overall"] + ga_scores["overall"]) / 2 if (ct_scores["overall"] > 0 or ga_scores["overall"] > 0) else 0
+    combined = calc_combined(ct_scores, ga_scores)
     
     # Find gaps
     ct_gaps = find_gaps(ct_responses, ct_questions)
@@ -2391,11 +1940,32 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     
     bench = benchmarks[industry]
     
+    report_progress = progress or (lambda section: None)
+    
+    # Pre-render every chart up front so cache misses render in parallel
+    report_progress("charts")
+    charts = render_report_charts(plan_report_charts(
+        ct_scores, ga_scores, combined, bench, ct_gaps, ga_gaps, benchmarks, industry
+    ))
+    
     story = []
+    sections = []  # [(key, inputs, index of its first flowable)]; each starts on a new page
+    generated_at = datetime.now()
+    
+    def begin_section(key, *inputs, progress=True):
+        """Start a section whose pages depend only on inputs (styles and static text aside)"""
+        if progress:
+            report_progress(key)
+        sections.append((key, inputs, len(story)))
+    
+    def chart_digest(name):
+        return hashlib.sha256(charts[name]).hexdigest() if charts.get(name) else None
     
     # =========================================================================
     # COVER PAGE
     # =========================================================================
+    begin_section("cover", org_name, assessor_name, combined, bench, generated_at.strftime('%B %d, %Y'),
+                  chart_digest("score_gauges"))
     story.append(Spacer(1, 1.5*inch))
     
     # AWS Logo placeholder (orange bar)
@@ -2414,7 +1984,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # Cover info table
     cover_data = [
         ['Organization:', org_name or 'Not Specified'],
-        ['Assessment Date:', datetime.now().strftime('%B %d, %Y')],
+        ['Assessment Date:', generated_at.strftime('%B %d, %Y')],
         ['Assessor:', assessor_name or 'Not Specified'],
         ['Industry Vertical:', bench['name']],
         ['Report Version:', 'v3.0 - Comprehensive Analysis'],
@@ -2471,11 +2041,8 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     story.append(Spacer(1, 0.5*inch))
     
     # Add Score Gauges Visualization
-    try:
-        gauges_img = create_score_gauges(ct_scores["overall"], ga_scores["overall"], combined, bench["avg"])
-        story.append(Image(gauges_img, width=7*inch, height=1.8*inch))
-    except Exception as e:
-        pass  # Skip if chart generation fails
+    if charts.get("score_gauges"):
+        story.append(Image(io.BytesIO(charts["score_gauges"]), width=7*inch, height=1.8*inch))
     
     story.append(Spacer(1, 0.3*inch))
     
@@ -2528,6 +2095,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # EXECUTIVE SUMMARY
     # =========================================================================
+    begin_section("executive_summary", org_name, ct_scores, ga_scores, combined, ct_gaps, ga_gaps, bench)
     story.append(Paragraph("1. Executive Summary", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -2632,6 +2200,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # ASSESSMENT METHODOLOGY
     # =========================================================================
+    begin_section("methodology", industry, ct_questions, ga_questions, ct_scores, ga_scores)
     story.append(Paragraph("2. Assessment Methodology", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -2736,16 +2305,16 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # OVERALL SCORE ANALYSIS
     # =========================================================================
+    begin_section("score_analysis", industry, ct_scores, ga_scores, combined, bench, chart_digest("score_comparison"))
     story.append(Paragraph("3. Overall Score Analysis", styles['SectionTitle']))
     
     # Score comparison visualization using matplotlib
     story.append(Paragraph("Assessment Score Comparison", styles['SubSectionTitle']))
     
     # Add beautiful comparison bar chart
-    try:
-        comparison_img = create_score_comparison_bars(ct_scores["overall"], ga_scores["overall"], combined, bench["avg"])
-        story.append(Image(comparison_img, width=6.5*inch, height=2.6*inch))
-    except Exception as e:
+    if charts.get("score_comparison"):
+        story.append(Image(io.BytesIO(charts["score_comparison"]), width=6.5*inch, height=2.6*inch))
+    else:
         # Fallback to simple text if chart fails
         story.append(Paragraph(f"Control Tower: {ct_scores['overall']:.1f}% | Golden Architecture: {ga_scores['overall']:.1f}% | Combined: {combined:.1f}%", styles['BodyText']))
     
@@ -2806,6 +2375,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # CONTROL TOWER ASSESSMENT DETAILS
     # =========================================================================
+    begin_section("ct_details", ct_responses, ct_questions, ct_scores, ct_gaps, chart_digest("ct_radar"), chart_digest("ct_bar"))
     story.append(Paragraph("4. Control Tower Assessment", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -2843,22 +2413,14 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     story.append(Paragraph("4.1 Domain Analysis", styles['SubSectionTitle']))
     
     # Add Domain Radar Chart
-    if ct_scores["total_answered"] > 0:
-        try:
-            ct_radar_img = create_radar_chart(ct_scores["domains"], "Control Tower Domain Maturity", color='#0284c7')
-            story.append(Image(ct_radar_img, width=5*inch, height=5*inch))
-        except Exception as e:
-            pass
+    if charts.get("ct_radar"):
+        story.append(Image(io.BytesIO(charts["ct_radar"]), width=5*inch, height=5*inch))
     
     story.append(Spacer(1, 0.2*inch))
     
     # Add Horizontal Bar Chart for domains
-    if ct_scores["total_answered"] > 0:
-        try:
-            ct_bar_img = create_horizontal_bar_chart(ct_scores["domains"], "Control Tower Domain Scores", color='#0284c7')
-            story.append(Image(ct_bar_img, width=6.5*inch, height=4*inch))
-        except Exception as e:
-            pass
+    if charts.get("ct_bar"):
+        story.append(Image(io.BytesIO(charts["ct_bar"]), width=6.5*inch, height=4*inch))
     
     story.append(Spacer(1, 0.2*inch))
     
@@ -2925,6 +2487,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # GOLDEN ARCHITECTURE ASSESSMENT DETAILS
     # =========================================================================
+    begin_section("ga_details", ga_responses, ga_questions, ga_scores, ga_gaps, chart_digest("ga_radar"), chart_digest("ga_bar"))
     story.append(Paragraph("5. Golden Architecture Assessment", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -2962,22 +2525,14 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     story.append(Paragraph("5.1 Domain Analysis", styles['SubSectionTitle']))
     
     # Add Domain Radar Chart for Golden Architecture
-    if ga_scores["total_answered"] > 0:
-        try:
-            ga_radar_img = create_radar_chart(ga_scores["domains"], "Golden Architecture Domain Maturity", color='#7c3aed')
-            story.append(Image(ga_radar_img, width=5*inch, height=5*inch))
-        except Exception as e:
-            pass
+    if charts.get("ga_radar"):
+        story.append(Image(io.BytesIO(charts["ga_radar"]), width=5*inch, height=5*inch))
     
     story.append(Spacer(1, 0.2*inch))
     
     # Add Horizontal Bar Chart for GA domains
-    if ga_scores["total_answered"] > 0:
-        try:
-            ga_bar_img = create_horizontal_bar_chart(ga_scores["domains"], "Golden Architecture Domain Scores", color='#7c3aed')
-            story.append(Image(ga_bar_img, width=6.5*inch, height=3.5*inch))
-        except Exception as e:
-            pass
+    if charts.get("ga_bar"):
+        story.append(Image(io.BytesIO(charts["ga_bar"]), width=6.5*inch, height=3.5*inch))
     
     story.append(Spacer(1, 0.2*inch))
     
@@ -3044,6 +2599,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # GAP ANALYSIS
     # =========================================================================
+    begin_section("gap_analysis", ct_gaps, ga_gaps, chart_digest("gap_pie"))
     story.append(Paragraph("6. Gap Analysis", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -3056,11 +2612,8 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     all_gaps = ct_gaps + ga_gaps
     
     # Add Gap Distribution Pie Chart
-    try:
-        gap_pie_img = create_gap_pie_chart(ct_gaps, ga_gaps)
-        story.append(Image(gap_pie_img, width=5*inch, height=3.75*inch))
-    except Exception as e:
-        pass
+    if charts.get("gap_pie"):
+        story.append(Image(io.BytesIO(charts["gap_pie"]), width=5*inch, height=3.75*inch))
     
     story.append(Spacer(1, 0.2*inch))
     
@@ -3129,6 +2682,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # INDUSTRY BENCHMARK
     # =========================================================================
+    begin_section("benchmark", industry, benchmarks, combined, bench, chart_digest("industry_comparison"))
     story.append(Paragraph("7. Industry Benchmark Comparison", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -3138,11 +2692,8 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     ))
     
     # Add Industry Comparison Bar Chart
-    try:
-        industry_chart_img = create_industry_comparison_chart(combined, benchmarks, industry)
-        story.append(Image(industry_chart_img, width=6.5*inch, height=4*inch))
-    except Exception as e:
-        pass
+    if charts.get("industry_comparison"):
+        story.append(Image(io.BytesIO(charts["industry_comparison"]), width=6.5*inch, height=4*inch))
     
     story.append(Spacer(1, 0.2*inch))
     
@@ -3197,14 +2748,12 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # MATURITY ROADMAP
     # =========================================================================
+    begin_section("roadmap", industry, chart_digest("maturity_roadmap"))
     story.append(Paragraph("8. Maturity Roadmap", styles['SectionTitle']))
     
     # Add Maturity Roadmap Visualization
-    try:
-        roadmap_img = create_maturity_roadmap_chart()
-        story.append(Image(roadmap_img, width=7*inch, height=3*inch))
-    except Exception as e:
-        pass
+    if charts.get("maturity_roadmap"):
+        story.append(Image(io.BytesIO(charts["maturity_roadmap"]), width=7*inch, height=3*inch))
     
     story.append(Spacer(1, 0.2*inch))
     
@@ -3289,6 +2838,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # IMPLEMENTATION RECOMMENDATIONS
     # =========================================================================
+    begin_section("recommendations")
     story.append(Paragraph("9. Implementation Recommendations", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -3361,6 +2911,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # RISK ASSESSMENT
     # =========================================================================
+    begin_section("risk", ct_scores, ga_scores, ct_gaps, ga_gaps)
     story.append(Paragraph("10. Risk Assessment", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -3412,6 +2963,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # AI ANALYSIS
     # =========================================================================
+    begin_section("ai_analysis", ai_analysis)
     story.append(Paragraph("11. AI-Powered Analysis", styles['SectionTitle']))
     
     if ai_analysis and not ai_analysis.startswith("⚠️"):
@@ -3443,6 +2995,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # APPENDIX A: Question Details
     # =========================================================================
+    begin_section("appendices", ct_responses, ga_responses, ct_questions, ga_questions)
     story.append(Paragraph("Appendix A: Assessment Question Details", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -3519,6 +3072,7 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # =========================================================================
     # APPENDIX B: Scoring Methodology
     # =========================================================================
+    begin_section("appendix_b", generated_at.strftime('%Y-%m-%d %H:%M:%S'), progress=False)
     story.append(Paragraph("Appendix B: Scoring Methodology", styles['SectionTitle']))
     
     story.append(Paragraph(
@@ -3594,32 +3148,192 @@ def generate_pdf_report(org_name, assessor_name, industry, ct_responses, ga_resp
     # Footer
     story.append(Spacer(1, 0.5*inch))
     story.append(Paragraph(
-        f"<b>Report Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
+        f"<b>Report Generated:</b> {generated_at.strftime('%Y-%m-%d %H:%M:%S')} | "
         f"<b>Platform Version:</b> AWS Enterprise Assessment Platform v3.0",
         styles['Footer']
     ))
     story.append(Paragraph(
-        f"© {datetime.now().year} AWS Enterprise Assessment Platform - Confidential",
+        f"© {generated_at.year} AWS Enterprise Assessment Platform - Confidential",
         styles['Footer']
     ))
     
-    # Build PDF
-    doc.build(story)
+    # Build PDF: sections are laid out separately and cached on their inputs, so re-exporting
+    # an edited assessment only lays out the sections it changed before the pages are merged
+    report_progress("build")
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError:
+        doc.build(story)  # Without pypdf the whole report is laid out in one pass
+        buffer.seek(0)
+        return buffer.getvalue()
+    
+    writer = PdfWriter()
+    ends = [start for _, _, start in sections[1:]] + [len(story)]
+    for (key, inputs, start), end in zip(sections, ends):
+        cache_key = content_key("report-section", REPORT_SECTION_VERSION, key, inputs)
+        data = section_cache.get(cache_key)
+        if data is None:
+            part = io.BytesIO()
+            SimpleDocTemplate(part, pagesize=doc.pagesize, rightMargin=doc.rightMargin, leftMargin=doc.leftMargin,
+                              topMargin=doc.topMargin, bottomMargin=doc.bottomMargin).build(story[start:end])
+            data = part.getvalue()
+            section_cache.put(cache_key, data)
+        writer.append(PdfReader(io.BytesIO(data)))
+    writer.write(buffer)
+    
+    buffer.seek(0)
+    return buffer.getvalue()
+
+def generate_markdown_report(org_name, assessor_name, industry, ct_scores, ga_scores, combined,
+                             ct_gaps, ga_gaps, benchmarks, ai_analysis) -> str:
+    """Markdown summary of the assessment for download"""
+    bench = benchmarks[industry]
+    
+    report = f"""# AWS Enterprise Assessment Report
+
+## Executive Summary
+
+| **Field** | **Value** |
+|-----------|-----------|
+| **Organization** | {org_name or 'Not specified'} |
+| **Assessor** | {assessor_name or 'Not specified'} |
+| **Assessment Date** | {datetime.now().strftime('%Y-%m-%d %H:%M')} |
+| **Industry Vertical** | {bench['name']} |
+| **Industry Benchmark** | {bench['avg']}% |
+
+---
+
+## Assessment Scores
+
+| **Assessment** | **Score** | **Maturity Level** | **vs Industry** |
+|----------------|-----------|-------------------|-----------------|
+| Control Tower | {ct_scores['overall']:.1f}% | {get_maturity(ct_scores['overall'])[0]} | {ct_scores['overall'] - bench['avg']:+.1f}% |
+| Golden Architecture | {ga_scores['overall']:.1f}% | {get_maturity(ga_scores['overall'])[0]} | {ga_scores['overall'] - bench['avg']:+.1f}% |
+| **Combined** | **{combined:.1f}%** | **{get_maturity(combined)[0]}** | **{combined - bench['avg']:+.1f}%** |
+
+---
+
+## Gap Summary
+
+### Control Tower
+- 🔴 **Critical Gaps:** {len([g for g in ct_gaps if g['risk']=='critical'])}
+- 🟠 **High Priority Gaps:** {len([g for g in ct_gaps if g['risk']=='high'])}
+- 🟡 **Medium Priority Gaps:** {len([g for g in ct_gaps if g['risk']=='medium'])}
+
+### Golden Architecture
+- 🔴 **Critical Gaps:** {len([g for g in ga_gaps if g['risk']=='critical'])}
+- 🟠 **High Priority Gaps:** {len([g for g in ga_gaps if g['risk']=='high'])}
+- 🟡 **Medium Priority Gaps:** {len([g for g in ga_gaps if g['risk']=='medium'])}
+
+---
+
+## Domain Analysis
+
+### Control Tower Domains
+"""
+    for dname, data in ct_scores["domains"].items():
+        if data["answered"] > 0:
+            report += f"- **{dname}**: {data['score']:.0f}% ({get_maturity(data['score'])[0]}) - {data['answered']}/{data['total']} answered\n"
+    
+    report += "\n### Golden Architecture Domains\n"
+    for dname, data in ga_scores["domains"].items():
+        if data["answered"] > 0:
+            report += f"- **{dname}**: {data['score']:.0f}% ({get_maturity(data['score'])[0]}) - {data['answered']}/{data['total']} answered\n"
+    
+    report += f"""
+
+---
+
+## Top Priority Gaps
+
+### Control Tower - Critical & High
+"""
+    for g in [gap for gap in ct_gaps if gap['risk'] in ['critical', 'high']][:5]:
+        report += f"- **{g['id']}** ({g['risk'].upper()}): {g['question']}\n"
+    
+    report += "\n### Golden Architecture - Critical & High\n"
+    for g in [gap for gap in ga_gaps if gap['risk'] in ['critical', 'high']][:5]:
+        report += f"- **{g['id']}** ({g['risk'].upper()}): {g['question']}\n"
     
-    buffer.seek(0)
-    return buffer.getvalue()
+    report += f"""
+
+---
+
+## AI Analysis & Recommendations
+
+{ai_analysis or '*Generate AI analysis in the AI Insights tab for detailed recommendations.*'}
+
+---
+
+## Assessment Completion
+
+| **Category** | **Answered** | **Total** | **Completion** |
+|--------------|--------------|-----------|----------------|
+| Control Tower | {ct_scores['total_answered']} | {ct_scores['total_questions']} | {(ct_scores['total_answered']/ct_scores['total_questions']*100):.0f}% |
+| Golden Architecture | {ga_scores['total_answered']} | {ga_scores['total_questions']} | {(ga_scores['total_answered']/ga_scores['total_questions']*100):.0f}% |
+| **Total** | **{ct_scores['total_answered'] + ga_scores['total_answered']}** | **{ct_scores['total_questions'] + ga_scores['total_questions']}** | **{((ct_scores['total_answered'] + ga_scores['total_answered'])/(ct_scores['total_questions'] + ga_scores['total_questions'])*100):.0f}%** |
+
+---
+
+*Report generated by AWS Enterprise Assessment Platform v3.0*
+*© {datetime.now().year} - Enterprise Cloud Assessment*
+"""
+    return report
+
+# =============================================================================
+# BACKGROUND REPORT JOBS
+# =============================================================================
+@st.fragment(run_every=1.0)
+def render_pdf_job_status():
+    """Poll this session's background PDF build without rerunning the whole app"""
+    jobs = get_report_jobs()
+    job = jobs.get(st.session_state.pdf_job_id)
+    
+    if job is None or job.finished:
+        if job is not None and job.status == "done":
+            st.session_state.pdf_report = job.result
+            st.session_state.pdf_job_notice = ("success", job.finished_at - job.started_at)
+        elif job is not None:
+            st.session_state.pdf_job_notice = ("error", job.error)
+        else:
+            st.session_state.pdf_job_notice = ("error", "Report job expired - please generate again")
+        if job is not None:
+            jobs.discard(job.id)
+        st.session_state.pdf_job_id = None
+        st.rerun()
+    
+    if job.status == "queued":
+        st.progress(0.0, text="⏳ Queued - waiting for a free report worker...")
+    else:
+        st.progress(job.progress, text=f"⏳ {job.section_label}...")
+
+def current_benchmarks() -> dict:
+    """Industry benchmarks from stored assessments, falling back to the static table"""
+    try:
+        return get_benchmark_engine().benchmarks()
+    except Exception:
+        return BENCHMARKS
+
+@st.cache_resource(ttl=60, show_spinner="Loading stored assessments...")
+def load_portfolio_records() -> list:
+    """Every stored assessment, shared by all sessions and re-read at most once a minute"""
+    return list(load_all_assessments().values())
 
 # =============================================================================
 # MAIN APPLICATION
 # =============================================================================
 def main():
     init_state()
+    restore_assessment()
+    benchmarks = current_benchmarks()
     
     # Calculate stats for header
     ct_total = count_questions(CT_QUESTIONS)
     ga_total = count_questions(GA_QUESTIONS)
-    ct_answered = count_answered(st.session_state.ct_responses)
-    ga_answered = count_answered(st.session_state.ga_responses)
+    ct_state = get_score_state("ct")
+    ga_state = get_score_state("ga")
+    ct_answered = ct_state.total_answered
+    ga_answered = ga_state.total_answered
     total_domains = len(CT_QUESTIONS) + len(GA_QUESTIONS)
     
     # Professional Header
@@ -3685,26 +3399,34 @@ def main():
         
         # Reset button
         if st.button("🔄 Reset Assessment", type="secondary", use_container_width=True):
-            st.session_state.ct_responses = {}
-            st.session_state.ga_responses = {}
+            ct_state.reset()
+            ga_state.reset()
             st.session_state.ai_analysis = None
+            st.session_state.ai_analyses = {}
             st.session_state.report = None
             st.rerun()
+        
+        st.caption(f"💾 Autosaved as `{st.session_state.assessment_id}` — bookmark this page to resume on any device")
+        if st.session_state.autosave_error:
+            st.caption(f"⚠️ Autosave problem: {st.session_state.autosave_error}")
+        autosave_status = st.session_state.autosave_status
+        if autosave_status and autosave_status["flushes"]:
+            st.caption(
+                f"Write-behind: {autosave_status['flushes']} flushes, "
+                f"avg batch {autosave_status['batch_size_avg']:.1f} keys, "
+                f"p95 flush {autosave_status['flush_latency_p95_s'] * 1000:.0f} ms, "
+                f"{autosave_status['coalesce_ratio']:.1f}× coalescing"
+            )
     
-    # Main Tabs
-    tabs = st.tabs([
-        "📊 Executive Dashboard",
-        "🎛️ Control Tower",
-        "⚡ Golden Architecture",
-        "🔍 Gap Analysis",
-        "🤖 AI Insights",
-        "📄 Reports & Export"
-    ])
+    # Main Tabs - only the active one is built on each run (st.tabs would render all six)
+    active_tab = st.radio("Section", options=APP_TABS, key="active_tab", horizontal=True,
+                          label_visibility="collapsed")
     
     # ==========================================================================
     # TAB 1: Executive Dashboard
     # ==========================================================================
-    with tabs[0]:
+    if active_tab == APP_TABS[0]:
+        started = time.perf_counter()
         st.markdown('''
         <div class="section-header">
             <div class="section-icon">📊</div>
@@ -3715,10 +3437,10 @@ def main():
         </div>
         ''', unsafe_allow_html=True)
         
-        ct_scores = calc_scores(st.session_state.ct_responses, CT_QUESTIONS)
-        ga_scores = calc_scores(st.session_state.ga_responses, GA_QUESTIONS)
-        combined = (ct_scores["overall"] + ga_scores["overall"]) / 2 if (ct_scores["overall"] > 0 or ga_scores["overall"] > 0) else 0
-        bench = BENCHMARKS[st.session_state.industry]
+        ct_scores = ct_state.scores()
+        ga_scores = ga_state.scores()
+        combined = calc_combined(ct_scores, ga_scores)
+        bench = benchmarks[st.session_state.industry]
         
         # Metric Cards
         col1, col2, col3, col4 = st.columns(4)
@@ -3822,73 +3544,33 @@ def main():
         # Industry Benchmark Comparison
         st.markdown("#### 🏆 Industry Benchmark Comparison")
         try:
-            industry_fig = create_ui_industry_comparison_chart(combined, BENCHMARKS, st.session_state.industry)
+            industry_fig = create_ui_industry_comparison_chart(combined, benchmarks, st.session_state.industry)
             st.plotly_chart(industry_fig, use_container_width=True)
+            if bench.get("source") == "assessments":
+                st.caption(f"📈 {bench['name']} average and top quartile computed from {bench['samples']} "
+                           f"completed assessments in the rolling benchmark window")
         except Exception as e:
             st.warning(f"Could not render industry comparison: {e}")
+        
+        record_tab_timing(APP_TABS[0], started)
     
     # ==========================================================================
     # TAB 2: Control Tower Assessment
     # ==========================================================================
-    with tabs[1]:
-        st.markdown('''
-        <div class="section-header">
-            <div class="section-icon">🎛️</div>
-            <div>
-                <div class="section-title">Control Tower Migration Readiness</div>
-                <div class="section-subtitle">Comprehensive assessment across 12 domains</div>
-            </div>
-        </div>
-        ''', unsafe_allow_html=True)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Questions", ct_total)
-        with col2:
-            st.metric("Answered", ct_answered)
-        with col3:
-            st.metric("Completion", f"{ct_pct:.0f}%")
-        with col4:
-            st.metric("Domains", len(CT_QUESTIONS))
-        
-        st.info("💡 **Instructions:** Expand each domain and answer questions. Select '⊘ Not yet assessed' to skip. Progress is saved automatically.")
-        st.markdown("---")
-        
-        render_questions(CT_QUESTIONS, st.session_state.ct_responses, "ct")
+    if active_tab == APP_TABS[1]:
+        render_question_panel("ct")
     
     # ==========================================================================
     # TAB 3: Golden Architecture Assessment
     # ==========================================================================
-    with tabs[2]:
-        st.markdown('''
-        <div class="section-header">
-            <div class="section-icon">⚡</div>
-            <div>
-                <div class="section-title">Golden Architecture (Serverless) Assessment</div>
-                <div class="section-subtitle">Serverless maturity evaluation across 10 domains</div>
-            </div>
-        </div>
-        ''', unsafe_allow_html=True)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Questions", ga_total)
-        with col2:
-            st.metric("Answered", ga_answered)
-        with col3:
-            st.metric("Completion", f"{ga_pct:.0f}%")
-        with col4:
-            st.metric("Domains", len(GA_QUESTIONS))
-        
-        st.info("💡 **Instructions:** Expand each domain and answer questions. Select '⊘ Not yet assessed' to skip. Progress is saved automatically.")
-        st.markdown("---")
-        
-        render_questions(GA_QUESTIONS, st.session_state.ga_responses, "ga")
+    if active_tab == APP_TABS[2]:
+        render_question_panel("ga")
     
     # ==========================================================================
     # TAB 4: Gap Analysis
     # ==========================================================================
-    with tabs[3]:
+    if active_tab == APP_TABS[3]:
+        started = time.perf_counter()
         st.markdown('''
         <div class="section-header">
             <div class="section-icon">🔍</div>
@@ -3899,8 +3581,8 @@ def main():
         </div>
         ''', unsafe_allow_html=True)
         
-        ct_gaps = find_gaps(st.session_state.ct_responses, CT_QUESTIONS)
-        ga_gaps = find_gaps(st.session_state.ga_responses, GA_QUESTIONS)
+        ct_gaps = ct_state.gaps()
+        ga_gaps = ga_state.gaps()
         
         # Gap Distribution Charts
         st.markdown("#### 📊 Gap Overview")
@@ -3989,7 +3671,7 @@ def main():
                     </div>
                     ''', unsafe_allow_html=True)
             else:
-                if count_answered(st.session_state.ct_responses) > 0:
+                if ct_state.total_answered > 0:
                     st.success("✅ No critical gaps identified! All answered questions scored above threshold.")
                 else:
                     st.info("📝 Complete assessment questions to identify gaps")
@@ -4023,15 +3705,18 @@ def main():
                     </div>
                     ''', unsafe_allow_html=True)
             else:
-                if count_answered(st.session_state.ga_responses) > 0:
+                if ga_state.total_answered > 0:
                     st.success("✅ No critical gaps identified! All answered questions scored above threshold.")
                 else:
                     st.info("📝 Complete assessment questions to identify gaps")
+        
+        record_tab_timing(APP_TABS[3], started)
     
     # ==========================================================================
     # TAB 5: AI Insights
     # ==========================================================================
-    with tabs[4]:
+    if active_tab == APP_TABS[4]:
+        started = time.perf_counter()
         st.markdown('''
         <div class="section-header">
             <div class="section-icon">🤖</div>
@@ -4042,138 +3727,110 @@ def main():
         </div>
         ''', unsafe_allow_html=True)
         
-        analysis_type = st.selectbox(
-            "Select Analysis Type",
-            options=[
-                "🎯 Comprehensive Gap Analysis & Prioritization",
-                "🗺️ 12-Month Implementation Roadmap",
-                "⚠️ Risk Assessment Matrix",
-                "💰 Cost-Benefit Analysis",
-                "🏗️ Architecture Recommendations",
-                "📋 Executive Summary for Leadership"
-            ]
+        render_document_prefill()
+        
+        generate_all = st.toggle(
+            "Generate several analyses at once",
+            key="ai_generate_all",
+            help=f"Runs up to {max_concurrency()} analyses concurrently over one shared API connection pool"
         )
+        if generate_all:
+            selected_types = st.multiselect("Analyses to Generate", options=ANALYSIS_TYPES, key="ai_selected_types")
+        else:
+            selected_types = [st.selectbox("Select Analysis Type", options=ANALYSIS_TYPES, key="ai_analysis_type")]
         
         context = st.text_area(
             "Additional Context (optional)",
+            key="ai_context",
             placeholder="Provide any additional context such as:\n• Budget constraints\n• Timeline requirements\n• Team size and skills\n• Regulatory requirements\n• Current pain points",
             height=120
         )
         
         col1, col2 = st.columns([1, 3])
         with col1:
-            generate_btn = st.button("🚀 Generate Analysis", type="primary", use_container_width=True)
+            generate_btn = st.button("🚀 Generate Analyses" if generate_all else "🚀 Generate Analysis",
+                                     type="primary", use_container_width=True)
+        with col2:
+            skip_cache = st.checkbox("Skip cache", key="ai_skip_cache", help="Ask Claude again even if this exact assessment was analysed before")
         
+        streamed_now = False
         if generate_btn:
-            total_answered = count_answered(st.session_state.ct_responses) + count_answered(st.session_state.ga_responses)
+            total_answered = ct_answered + ga_answered
             
             if total_answered < 5:
                 st.warning("⚠️ Please answer at least 5 questions to generate meaningful AI analysis.")
+            elif not selected_types:
+                st.warning("⚠️ Select at least one analysis type.")
             else:
-                with st.spinner("🔄 Generating comprehensive analysis... This may take 30-60 seconds."):
-                    ct_scores = calc_scores(st.session_state.ct_responses, CT_QUESTIONS)
-                    ga_scores = calc_scores(st.session_state.ga_responses, GA_QUESTIONS)
-                    ct_gaps = find_gaps(st.session_state.ct_responses, CT_QUESTIONS)
-                    ga_gaps = find_gaps(st.session_state.ga_responses, GA_QUESTIONS)
-                    combined = (ct_scores["overall"] + ga_scores["overall"]) / 2
+                with st.spinner("🔄 Preparing assessment data..."):
+                    ct_scores = ct_state.scores()
+                    ga_scores = ga_state.scores()
+                    ct_gaps = ct_state.gaps()
+                    ga_gaps = ga_state.gaps()
+                    prompts = {
+                        analysis_type: build_analysis_prompt(analysis_type, context, ct_scores, ga_scores, ct_gaps, ga_gaps)
+                        for analysis_type in selected_types
+                    }
+                
+                try:
+                    cache = get_ai_cache()
+                except Exception as e:
+                    cache = None
+                    st.caption(f"⚠️ AI result cache unavailable: {e}")
+                
+                if generate_all:
+                    st.session_state.ai_analyses = generate_analyses(prompts, cache, skip_cache)
+                    st.session_state.ai_analysis = "\n\n".join(
+                        f"## {name}\n\n{text}" for name, text in st.session_state.ai_analyses.items()
+                    )
+                else:
+                    analysis_type, prompt = next(iter(prompts.items()))
+                    cached = None
+                    if cache and not skip_cache:
+                        cached = cache.get(prompt, CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS)
                     
-                    prompt = f"""
-# AWS Enterprise Assessment Analysis Request
-
-## Analysis Type
-{analysis_type}
-
-## Organization Context
-- **Organization:** {st.session_state.org_name or 'Not specified'}
-- **Assessor:** {st.session_state.assessor_name or 'Not specified'}
-- **Industry:** {BENCHMARKS[st.session_state.industry]['name']}
-- **Industry Average:** {BENCHMARKS[st.session_state.industry]['avg']}%
-- **Industry Top Quartile:** {BENCHMARKS[st.session_state.industry]['top']}%
-
-## Assessment Results
-
-### Control Tower Assessment
-- **Overall Score:** {ct_scores['overall']:.1f}%
-- **Maturity Level:** {get_maturity(ct_scores['overall'])[0]}
-- **Questions Answered:** {ct_scores['total_answered']}/{ct_scores['total_questions']}
-- **Critical Gaps:** {len([g for g in ct_gaps if g['risk']=='critical'])}
-- **High Priority Gaps:** {len([g for g in ct_gaps if g['risk']=='high'])}
-
-**Domain Breakdown:**
-{json.dumps({k: f"{v['score']:.0f}%" for k,v in ct_scores.get('domains',{}).items() if v['answered']>0}, indent=2)}
-
-**Top Gaps (Critical & High):**
-{json.dumps([{"id": g["id"], "question": g["question"][:80], "risk": g["risk"], "score": g["score"]} for g in ct_gaps[:8] if g["risk"] in ["critical", "high"]], indent=2)}
-
-### Golden Architecture Assessment
-- **Overall Score:** {ga_scores['overall']:.1f}%
-- **Maturity Level:** {get_maturity(ga_scores['overall'])[0]}
-- **Questions Answered:** {ga_scores['total_answered']}/{ga_scores['total_questions']}
-- **Critical Gaps:** {len([g for g in ga_gaps if g['risk']=='critical'])}
-- **High Priority Gaps:** {len([g for g in ga_gaps if g['risk']=='high'])}
-
-**Domain Breakdown:**
-{json.dumps({k: f"{v['score']:.0f}%" for k,v in ga_scores.get('domains',{}).items() if v['answered']>0}, indent=2)}
-
-**Top Gaps (Critical & High):**
-{json.dumps([{"id": g["id"], "question": g["question"][:80], "risk": g["risk"], "score": g["score"]} for g in ga_gaps[:8] if g["risk"] in ["critical", "high"]], indent=2)}
-
-### Combined Assessment
-- **Combined Score:** {combined:.1f}%
-- **vs Industry Average:** {combined - BENCHMARKS[st.session_state.industry]['avg']:+.1f}%
-
-## Additional Context from User
-{context or 'None provided'}
-
-## Instructions
-Please provide a comprehensive analysis that includes:
-
-1. **Executive Summary** (2-3 paragraphs)
-   - Key findings and overall assessment
-   - Comparison to industry benchmarks
-   - Critical areas requiring immediate attention
-
-2. **Detailed Analysis** based on the selected type above
-   - Specific to the analysis type requested
-   - Data-driven insights from assessment scores
-
-3. **Prioritized Recommendations**
-   - For each recommendation include:
-     - Specific AWS services and configurations
-     - Effort estimate (person-weeks)
-     - Dependencies and prerequisites
-     - Expected outcome/benefit
-
-4. **Implementation Roadmap**
-   - Quick wins (0-30 days)
-   - Short-term (1-3 months)
-   - Medium-term (3-6 months)
-   - Long-term (6-12 months)
-
-5. **Risk Considerations**
-   - Technical risks
-   - Organizational risks
-   - Mitigation strategies
-
-6. **Success Metrics**
-   - KPIs to track progress
-   - Target improvements
-   - Measurement approach
-
-Format with clear markdown headers and bullet points for readability.
-"""
-                    st.session_state.ai_analysis = call_claude(prompt)
+                    if cached is not None:
+                        st.session_state.ai_analysis = cached
+                        record_ai_timing(analysis_type, {"ttft_s": 0.0, "total_s": 0.0, "cached": True})
+                    else:
+                        # Stream tokens into the tab as they arrive instead of blocking on the full completion
+                        st.markdown("---")
+                        timings = {}
+                        streamed = st.write_stream(stream_claude(prompt, timings))
+                        st.session_state.ai_analysis = (streamed if isinstance(streamed, str) else "".join(map(str, streamed))).strip()
+                        record_ai_timing(analysis_type, timings)
+                        streamed_now = True
+                        # Only a stream that finished is cached; a failure mid-answer leaves stop_reason unset
+                        if cache and timings.get("stop_reason") is not None:
+                            cache.put(prompt, CLAUDE_SYSTEM_PROMPT, CLAUDE_MODEL, CLAUDE_MAX_TOKENS, st.session_state.ai_analysis,
+                                      timings["stop_reason"])
+                    st.session_state.ai_analyses = {analysis_type: st.session_state.ai_analysis}
         
-        if st.session_state.ai_analysis:
-            st.markdown("---")
-            st.markdown('<div class="ai-response">', unsafe_allow_html=True)
-            st.markdown(st.session_state.ai_analysis)
-            st.markdown('</div>', unsafe_allow_html=True)
+        if generate_all:
+            for analysis_type in selected_types:
+                if analysis_type in st.session_state.ai_analyses:
+                    with st.expander(analysis_type, expanded=True):
+                        st.markdown(st.session_state.ai_analyses[analysis_type])
+                        timing = describe_ai_timing(analysis_type)
+                        if timing:
+                            st.caption(timing)
+        elif st.session_state.ai_analysis:
+            if not streamed_now:
+                st.markdown("---")
+                st.markdown('<div class="ai-response">', unsafe_allow_html=True)
+                st.markdown(st.session_state.ai_analysis)
+                st.markdown('</div>', unsafe_allow_html=True)
+            timing = describe_ai_timing(selected_types[0])
+            if timing:
+                st.caption(timing)
+        
+        record_tab_timing(APP_TABS[4], started)
     
     # ==========================================================================
     # TAB 6: Reports & Export
     # ==========================================================================
-    with tabs[5]:
+    if active_tab == APP_TABS[5]:
+        started = time.perf_counter()
         st.markdown('''
         <div class="section-header">
             <div class="section-icon">📄</div>
@@ -4184,9 +3841,9 @@ Format with clear markdown headers and bullet points for readability.
         </div>
         ''', unsafe_allow_html=True)
         
-        ct_scores = calc_scores(st.session_state.ct_responses, CT_QUESTIONS)
-        ga_scores = calc_scores(st.session_state.ga_responses, GA_QUESTIONS)
-        combined = (ct_scores["overall"] + ga_scores["overall"]) / 2 if (ct_scores["overall"] > 0 or ga_scores["overall"] > 0) else 0
+        ct_scores = ct_state.scores()
+        ga_scores = ga_state.scores()
+        combined = calc_combined(ct_scores, ga_scores)
         
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -4197,8 +3854,8 @@ Format with clear markdown headers and bullet points for readability.
         with col3:
             render_metric_card(combined, "Combined Score")
         with col4:
-            total_ans = count_answered(st.session_state.ct_responses) + count_answered(st.session_state.ga_responses)
-            total_q = count_questions(CT_QUESTIONS) + count_questions(GA_QUESTIONS)
+            total_ans = ct_answered + ga_answered
+            total_q = ct_total + ga_total
             completion = (total_ans / total_q * 100) if total_q > 0 else 0
             render_metric_card(completion, "Completion")
         
@@ -4218,24 +3875,38 @@ Format with clear markdown headers and bullet points for readability.
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("📊 Generate Comprehensive PDF Report", type="primary", use_container_width=True):
-                with st.spinner("Generating comprehensive PDF report... This may take a moment."):
-                    try:
-                        pdf_data = generate_pdf_report(
-                            org_name=st.session_state.org_name,
-                            assessor_name=st.session_state.assessor_name,
-                            industry=st.session_state.industry,
-                            ct_responses=st.session_state.ct_responses,
-                            ga_responses=st.session_state.ga_responses,
-                            ct_questions=CT_QUESTIONS,
-                            ga_questions=GA_QUESTIONS,
-                            benchmarks=BENCHMARKS,
-                            ai_analysis=st.session_state.ai_analysis
-                        )
-                        st.session_state.pdf_report = pdf_data
-                        st.success("✅ Comprehensive PDF report generated successfully! (~30 pages)")
-                    except Exception as e:
-                        st.error(f"Error generating PDF: {str(e)}")
+            pdf_job_id = st.session_state.get('pdf_job_id')
+            if st.button("📊 Generate Comprehensive PDF Report", type="primary", use_container_width=True,
+                         disabled=pdf_job_id is not None):
+                try:
+                    # Snapshot inputs - the build runs on a worker thread while the user keeps editing
+                    pdf_job_id = get_report_jobs().submit(
+                        generate_pdf_report,
+                        org_name=st.session_state.org_name,
+                        assessor_name=st.session_state.assessor_name,
+                        industry=st.session_state.industry,
+                        ct_responses=dict(st.session_state.ct_responses),
+                        ga_responses=dict(st.session_state.ga_responses),
+                        ct_questions=CT_QUESTIONS,
+                        ga_questions=GA_QUESTIONS,
+                        benchmarks=benchmarks,
+                        ai_analysis=st.session_state.ai_analysis
+                    )
+                    st.session_state.pdf_job_id = pdf_job_id
+                except JobQueueFull:
+                    st.warning("⏳ The report server is busy with other builds. Please try again in a minute.")
+            
+            if pdf_job_id:
+                render_pdf_job_status()
+            
+            notice = st.session_state.pop('pdf_job_notice', None)
+            if notice and notice[0] == "success":
+                st.success("✅ Comprehensive PDF report generated successfully! (~30 pages)")
+                cache_stats = chart_cache.stats()
+                st.caption(f"Chart cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                           f"({cache_stats['entries']} charts cached) • Built in {notice[1]:.1f}s")
+            elif notice:
+                st.error(f"Error generating PDF: {notice[1]}")
         
         with col2:
             if 'pdf_report' in st.session_state and st.session_state.pdf_report:
@@ -4256,98 +3927,13 @@ Format with clear markdown headers and bullet points for readability.
         
         with col1:
             if st.button("📄 Generate Markdown Summary", use_container_width=True):
-                ct_gaps = find_gaps(st.session_state.ct_responses, CT_QUESTIONS)
-                ga_gaps = find_gaps(st.session_state.ga_responses, GA_QUESTIONS)
-                
-                report = f"""# AWS Enterprise Assessment Report
-
-## Executive Summary
-
-| **Field** | **Value** |
-|-----------|-----------|
-| **Organization** | {st.session_state.org_name or 'Not specified'} |
-| **Assessor** | {st.session_state.assessor_name or 'Not specified'} |
-| **Assessment Date** | {datetime.now().strftime('%Y-%m-%d %H:%M')} |
-| **Industry Vertical** | {BENCHMARKS[st.session_state.industry]['name']} |
-| **Industry Benchmark** | {BENCHMARKS[st.session_state.industry]['avg']}% |
-
----
-
-## Assessment Scores
-
-| **Assessment** | **Score** | **Maturity Level** | **vs Industry** |
-|----------------|-----------|-------------------|-----------------|
-| Control Tower | {ct_scores['overall']:.1f}% | {get_maturity(ct_scores['overall'])[0]} | {ct_scores['overall'] - BENCHMARKS[st.session_state.industry]['avg']:+.1f}% |
-| Golden Architecture | {ga_scores['overall']:.1f}% | {get_maturity(ga_scores['overall'])[0]} | {ga_scores['overall'] - BENCHMARKS[st.session_state.industry]['avg']:+.1f}% |
-| **Combined** | **{combined:.1f}%** | **{get_maturity(combined)[0]}** | **{combined - BENCHMARKS[st.session_state.industry]['avg']:+.1f}%** |
-
----
-
-## Gap Summary
-
-### Control Tower
-- 🔴 **Critical Gaps:** {len([g for g in ct_gaps if g['risk']=='critical'])}
-- 🟠 **High Priority Gaps:** {len([g for g in ct_gaps if g['risk']=='high'])}
-- 🟡 **Medium Priority Gaps:** {len([g for g in ct_gaps if g['risk']=='medium'])}
-
-### Golden Architecture
-- 🔴 **Critical Gaps:** {len([g for g in ga_gaps if g['risk']=='critical'])}
-- 🟠 **High Priority Gaps:** {len([g for g in ga_gaps if g['risk']=='high'])}
-- 🟡 **Medium Priority Gaps:** {len([g for g in ga_gaps if g['risk']=='medium'])}
-
----
-
-## Domain Analysis
-
-### Control Tower Domains
-"""
-                for dname, data in ct_scores["domains"].items():
-                    if data["answered"] > 0:
-                        report += f"- **{dname}**: {data['score']:.0f}% ({get_maturity(data['score'])[0]}) - {data['answered']}/{data['total']} answered\n"
-                
-                report += "\n### Golden Architecture Domains\n"
-                for dname, data in ga_scores["domains"].items():
-                    if data["answered"] > 0:
-                        report += f"- **{dname}**: {data['score']:.0f}% ({get_maturity(data['score'])[0]}) - {data['answered']}/{data['total']} answered\n"
-                
-                report += f"""
-
----
-
-## Top Priority Gaps
-
-### Control Tower - Critical & High
-"""
-                for g in [gap for gap in ct_gaps if gap['risk'] in ['critical', 'high']][:5]:
-                    report += f"- **{g['id']}** ({g['risk'].upper()}): {g['question']}\n"
-                
-                report += "\n### Golden Architecture - Critical & High\n"
-                for g in [gap for gap in ga_gaps if gap['risk'] in ['critical', 'high']][:5]:
-                    report += f"- **{g['id']}** ({g['risk'].upper()}): {g['question']}\n"
+                ct_gaps = ct_state.gaps()
+                ga_gaps = ga_state.gaps()
                 
-                report += f"""
-
----
-
-## AI Analysis & Recommendations
-
-{st.session_state.ai_analysis or '*Generate AI analysis in the AI Insights tab for detailed recommendations.*'}
-
----
-
-## Assessment Completion
-
-| **Category** | **Answered** | **Total** | **Completion** |
-|--------------|--------------|-----------|----------------|
-| Control Tower | {ct_scores['total_answered']} | {ct_scores['total_questions']} | {(ct_scores['total_answered']/ct_scores['total_questions']*100):.0f}% |
-| Golden Architecture | {ga_scores['total_answered']} | {ga_scores['total_questions']} | {(ga_scores['total_answered']/ga_scores['total_questions']*100):.0f}% |
-| **Total** | **{ct_scores['total_answered'] + ga_scores['total_answered']}** | **{ct_scores['total_questions'] + ga_scores['total_questions']}** | **{((ct_scores['total_answered'] + ga_scores['total_answered'])/(ct_scores['total_questions'] + ga_scores['total_questions'])*100):.0f}%** |
-
----
-
-*Report generated by AWS Enterprise Assessment Platform v3.0*
-*© {datetime.now().year} - Enterprise Cloud Assessment*
-"""
+                report = generate_markdown_report(
+                    st.session_state.org_name, st.session_state.assessor_name, st.session_state.industry,
+                    ct_scores, ga_scores, combined, ct_gaps, ga_gaps, benchmarks, st.session_state.ai_analysis
+                )
                 st.session_state.report = report
                 st.success("✅ Markdown summary generated!")
         
@@ -4379,7 +3965,7 @@ Format with clear markdown headers and bullet points for readability.
                 "domain_scores": {k: {"score": v["score"], "answered": v["answered"], "total": v["total"]} 
                                  for k, v in ct_scores.get("domains", {}).items()},
                 "gaps": [{"id": g["id"], "question": g["question"], "risk": g["risk"], "score": g["score"]} 
-                        for g in find_gaps(st.session_state.ct_responses, CT_QUESTIONS)]
+                        for g in ct_state.gaps()]
             },
             "golden_architecture": {
                 "responses": st.session_state.ga_responses,
@@ -4387,7 +3973,7 @@ Format with clear markdown headers and bullet points for readability.
                 "domain_scores": {k: {"score": v["score"], "answered": v["answered"], "total": v["total"]} 
                                  for k, v in ga_scores.get("domains", {}).items()},
                 "gaps": [{"id": g["id"], "question": g["question"], "risk": g["risk"], "score": g["score"]} 
-                        for g in find_gaps(st.session_state.ga_responses, GA_QUESTIONS)]
+                        for g in ga_state.gaps()]
             }
         }
         
@@ -4407,6 +3993,107 @@ Format with clear markdown headers and bullet points for readability.
             st.markdown("#### 📋 Report Preview")
             with st.expander("View Generated Report", expanded=False):
                 st.markdown(st.session_state.report)
+        
+        record_tab_timing(APP_TABS[5], started)
+    
+    # ==========================================================================
+    # TAB 7: Portfolio
+    # ==========================================================================
+    if active_tab == APP_TABS[6]:
+        started = time.perf_counter()
+        st.markdown('''
+        <div class="section-header">
+            <div class="section-icon">📁</div>
+            <div>
+                <div class="section-title">Portfolio Analytics</div>
+                <div class="section-subtitle">Score distributions, maturity and recurring gaps across every stored assessment</div>
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            industries = st.multiselect(
+                "Industries",
+                options=list(BENCHMARKS.keys()),
+                format_func=lambda x: BENCHMARKS[x]["name"],
+                key="portfolio_industries",
+                placeholder="All industries"
+            )
+        with col2:
+            if st.button("🔄 Refresh", use_container_width=True):
+                load_portfolio_records.clear()
+        
+        try:
+            records = load_portfolio_records()
+        except Exception as e:
+            records = []
+            st.warning(f"Could not load stored assessments: {e}")
+        if industries:
+            records = [r for r in records if r["metadata"].get("industry") in industries]
+        
+        if not records:
+            st.info("📝 No stored assessments yet - assessments appear here once they have been autosaved")
+        else:
+            portfolio = aggregate_portfolio(records)
+            combined_stats = portfolio["overall"]["combined"]
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Assessments", portfolio["assessments"])
+            with col2:
+                st.metric("Scored", combined_stats["assessed"])
+            if combined_stats["assessed"]:
+                with col3:
+                    st.metric("Median Combined", f"{combined_stats['p50']:.0f}%")
+                with col4:
+                    st.metric("Top Quartile From", f"{combined_stats['p75']:.0f}%")
+            
+            st.markdown("---")
+            try:
+                st.plotly_chart(create_ui_portfolio_maturity_chart(portfolio["maturity"]), use_container_width=True)
+            except Exception as e:
+                st.warning(f"Could not render maturity distribution: {e}")
+            
+            col1, col2 = st.columns(2)
+            for col, section, name, color in [(col1, "ct", "Control Tower", "#0284c7"),
+                                              (col2, "ga", "Golden Architecture", "#7c3aed")]:
+                with col:
+                    st.markdown(f"#### {name} Domains")
+                    if portfolio["overall"][section]["assessed"]:
+                        try:
+                            fig = create_ui_domain_distribution_chart(portfolio["domains"][section], "Domain Score Distribution", color)
+                            st.plotly_chart(fig, use_container_width=True)
+                        except Exception as e:
+                            st.warning(f"Could not render domain distribution: {e}")
+                    else:
+                        st.info(f"📝 No {name} answers in this portfolio yet")
+            
+            st.markdown("---")
+            st.markdown("#### 🔁 Most Frequent Critical & High Gaps")
+            if portfolio["top_gaps"]:
+                st.dataframe([
+                    {
+                        "ID": g["id"],
+                        "Risk": g["risk"],
+                        "Domain": g["domain"],
+                        "Question": g["question"],
+                        "Assessments with gap": g["count"],
+                        "Share of portfolio": f"{g['share'] * 100:.0f}%"
+                    }
+                    for g in portfolio["top_gaps"]
+                ], use_container_width=True, hide_index=True)
+            else:
+                st.success("✅ No critical or high gaps across this portfolio")
+        
+        record_tab_timing(APP_TABS[6], started)
+    
+    # Autosave last so every change made during this run is captured
+    persist_assessment()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    start_metrics_server()
+    register_caches({"chart": chart_cache, "figure": figure_cache, "section": section_cache,
+                     "extraction": extraction_cache})
+    with timer("script_run", app="assessment"):
+        main()
\ No newline at end of file
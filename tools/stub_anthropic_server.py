@@ -0,0 +1,184 @@
+"""
+Stub Anthropic Messages API
+Local stand-in for POST /v1/messages (blocking and streaming) so concurrent
+analysis generation, retries and timing can be exercised offline. Injects
+429 / 529 responses at a configurable rate.
+
+Usage:
+    python tools/stub_anthropic_server.py --port 8787 --latency 2 --overload-rate 0.2
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8787 ANTHROPIC_API_KEY=stub streamlit run streamlit_app.py
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LOREM = (
+    "Prioritise the critical Control Tower gaps first: enable mandatory guardrails, "
+    "centralise logging in a dedicated Log Archive account and enforce IAM Identity Center "
+    "for workforce access. Then harden the Golden Architecture baseline with least-privilege "
+    "Lambda roles, API Gateway throttling and structured observability. "
+)
+
+
+class StubState:
+    """Knobs and counters shared by all request handler threads"""
+
+    def __init__(self, latency: float, tokens: int, token_delay: float, rate_limit_rate: float, overload_rate: float):
+        self.latency = latency
+        self.tokens = tokens
+        self.token_delay = token_delay
+        self.rate_limit_rate = rate_limit_rate
+        self.overload_rate = overload_rate
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.errors = {429: 0, 529: 0}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StubState = None
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            with self.state.lock:
+                body = {"requests": self.state.requests, "peak_in_flight": self.state.peak_in_flight,
+                        "errors": {str(k): v for k, v in self.state.errors.items()}}
+            self._send_json(200, body)
+        else:
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+
+    def do_POST(self):
+        length = int(self.headers.get("content-length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.startswith("/v1/messages"):
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+            return
+
+        state = self.state
+        with state.lock:
+            state.requests += 1
+            state.in_flight += 1
+            state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+        try:
+            roll = random.random()
+            if roll < state.rate_limit_rate:
+                self._send_error(429, "rate_limit_error", "Stub rate limit", retry_after="1")
+                return
+            if roll < state.rate_limit_rate + state.overload_rate:
+                self._send_error(529, "overloaded_error", "Stub overloaded")
+                return
+
+            time.sleep(state.latency)
+            words = self._words(request)
+            if request.get("stream"):
+                self._stream(request, words)
+            else:
+                self._send_json(200, self._message(request, "".join(words), len(words)))
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _words(self, request: dict) -> list:
+        prompt = request.get("messages", [{}])[-1].get("content", "")
+        heading = prompt.strip().splitlines()[4] if prompt.count("\n") > 4 else "Analysis"
+        text = f"## {heading.strip()}\n\n" + LOREM * max(1, self.state.tokens // 60)
+        return [w + " " for w in text.split(" ")][: max(self.state.tokens, 1)]
+
+    def _message(self, request: dict, text: str, output_tokens: int) -> dict:
+        return {
+            "id": f"msg_stub_{uuid.uuid4().hex[:12]}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get("model", "stub"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(json.dumps(request)) // 4, "output_tokens": output_tokens},
+        }
+
+    def _stream(self, request: dict, words: list):
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("cache-control", "no-cache")
+        self.send_header("connection", "close")
+        self.end_headers()
+        start = self._message(request, "", 0)
+        start["content"] = []
+        start["stop_reason"] = None
+        self._event("message_start", {"type": "message_start", "message": start})
+        self._event("content_block_start", {"type": "content_block_start", "index": 0,
+                                            "content_block": {"type": "text", "text": ""}})
+        for word in words:
+            self._event("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                                "delta": {"type": "text_delta", "text": word}})
+            time.sleep(self.state.token_delay)
+        self._event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        self._event("message_delta", {"type": "message_delta",
+                                      "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                      "usage": {"output_tokens": len(words)}})
+        self._event("message_stop", {"type": "message_stop"})
+        self.close_connection = True
+
+    def _event(self, name: str, data: dict):
+        self.wfile.write(f"event: {name}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _send_error(self, status: int, error_type: str, message: str, retry_after: str = None):
+        with self.state.lock:
+            self.state.errors[status] += 1
+        headers = {"retry-after": retry_after} if retry_after else {}
+        self._send_json(status, {"type": "error", "error": {"type": error_type, "message": message}}, headers)
+
+    def _send_json(self, status: int, body: dict, headers: dict = None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def serve(port: int = 8787, host: str = "127.0.0.1", **knobs) -> ThreadingHTTPServer:
+    """Start the stub in a daemon thread and return the server (call .shutdown() to stop)"""
+    handler = type("BoundStubHandler", (StubHandler,), {"state": StubState(**knobs)})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline stub of the Anthropic Messages API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds before the first token")
+    parser.add_argument("--tokens", type=int, default=400, help="Words returned per response")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="Seconds between streamed words")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--overload-rate", type=float, default=0.0, help="Fraction of requests answered with 529")
+    args = parser.parse_args(argv)
+
+    server = serve(args.port, args.host, latency=args.latency, tokens=args.tokens, token_delay=args.token_delay,
+                   rate_limit_rate=args.rate_limit_rate, overload_rate=args.overload_rate)
+    print(f"Stub Anthropic API on http://{args.host}:{args.port} (GET /stats for counters)", file=sys.stderr)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
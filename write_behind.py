@@ -0,0 +1,187 @@
+"""
+Write-Behind Buffer
+Coalesces key/value mutations per owner (e.g. one assessment) and hands them
+to a sink in batches: on a timer, when the pending size crosses a threshold,
+when an owner's session ends and at interpreter exit.
+
+Ordering: mutations are sequence-numbered, flushes are serialised, and a
+failed batch is merged back *under* anything newer, so the sink never sees an
+older value after a newer one for the same key.
+"""
+
+import atexit
+import threading
+import time
+import weakref
+from collections import deque
+
+
+class ChangeSet:
+    """Coalesced mutations for one owner; only the latest value per key survives"""
+
+    __slots__ = ("changes", "mutations", "first_seq", "last_seq", "first_at")
+
+    def __init__(self):
+        self.changes = {}
+        self.mutations = 0
+        self.first_seq = None
+        self.last_seq = None
+        self.first_at = None
+
+    def add(self, key, value, seq: int):
+        if self.first_seq is None:
+            self.first_seq = seq
+            self.first_at = time.time()
+        self.changes[key] = value
+        self.mutations += 1
+        self.last_seq = seq
+
+    def merge_under(self, newer: "ChangeSet") -> "ChangeSet":
+        """This (older, failed) set overlaid by newer; newer values win"""
+        merged = ChangeSet()
+        merged.changes = {**self.changes, **newer.changes}
+        merged.mutations = self.mutations + newer.mutations
+        merged.first_seq = self.first_seq
+        merged.last_seq = newer.last_seq
+        merged.first_at = self.first_at
+        return merged
+
+
+class WriteBehindBuffer:
+    """Batches ChangeSets into sink({owner: ChangeSet}) calls off the caller's thread"""
+
+    def __init__(self, sink, flush_interval: float = 2.0, max_pending: int = 500, latency_window: int = 256):
+        self.sink = sink
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending = {}
+        self._pending_keys = 0
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._closed = False
+
+        self.flushes = 0
+        self.failures = 0
+        self.mutations_in = 0
+        self.keys_written = 0
+        self.last_error = None
+        self._latencies = deque(maxlen=latency_window)
+        self._batch_sizes = deque(maxlen=latency_window)
+        atexit.register(self.close)
+
+    def record(self, owner: str, key, value):
+        """Queue one mutation (value None means delete); O(1) and never blocks on the sink"""
+        with self._lock:
+            self._seq += 1
+            change_set = self._pending.get(owner)
+            if change_set is None:
+                change_set = self._pending[owner] = ChangeSet()
+            before = len(change_set.changes)
+            change_set.add(key, value, self._seq)
+            self._pending_keys += len(change_set.changes) - before
+            self.mutations_in += 1
+            over_threshold = self._pending_keys >= self.max_pending
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+                self._thread.start()
+        if over_threshold:
+            self._wake.set()
+
+    def pending(self, owner: str) -> dict:
+        """Unflushed changes for owner, so reads on this process can overlay them"""
+        with self._lock:
+            change_set = self._pending.get(owner)
+            return dict(change_set.changes) if change_set else {}
+
+    def flush(self, owner: str = None) -> bool:
+        """Write pending changes (all owners, or just one); returns False if the sink failed"""
+        with self._flush_lock:
+            with self._lock:
+                if owner is None:
+                    batch, self._pending = self._pending, {}
+                elif owner in self._pending:
+                    batch = {owner: self._pending.pop(owner)}
+                else:
+                    batch = {}
+                self._pending_keys -= sum(len(cs.changes) for cs in batch.values())
+            if not batch:
+                return True
+
+            start = time.perf_counter()
+            try:
+                self.sink(batch)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                with self._lock:
+                    for failed_owner, failed in batch.items():
+                        newer = self._pending.get(failed_owner)
+                        merged = failed.merge_under(newer) if newer else failed
+                        self._pending_keys += len(merged.changes) - (len(newer.changes) if newer else 0)
+                        self._pending[failed_owner] = merged
+                return False
+
+            keys = sum(len(cs.changes) for cs in batch.values())
+            self._latencies.append(time.perf_counter() - start)
+            self._batch_sizes.append(keys)
+            self.flushes += 1
+            self.keys_written += keys
+            self.last_error = None
+            return True
+
+    def session(self, owner: str):
+        """Handle whose garbage collection (e.g. a Streamlit session ending) flushes owner"""
+        handle = _SessionHandle(owner)
+        weakref.finalize(handle, self._flush_quietly, owner)
+        return handle
+
+    def _flush_quietly(self, owner: str):
+        if not self._closed:
+            threading.Thread(target=self.flush, args=(owner,), daemon=True).start()
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self.flush()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            pending_owners = len(self._pending)
+            pending_keys = self._pending_keys
+            latencies = sorted(self._latencies)
+            sizes = list(self._batch_sizes)
+
+        def pct(values, q):
+            return values[min(len(values) - 1, int(q * len(values)))] if values else 0.0
+
+        return {
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "mutations_in": self.mutations_in,
+            "keys_written": self.keys_written,
+            "coalesce_ratio": self.mutations_in / self.keys_written if self.keys_written else 0.0,
+            "pending_owners": pending_owners,
+            "pending_keys": pending_keys,
+            "flush_latency_p50_s": pct(latencies, 0.5),
+            "flush_latency_p95_s": pct(latencies, 0.95),
+            "flush_latency_max_s": latencies[-1] if latencies else 0.0,
+            "batch_size_avg": sum(sizes) / len(sizes) if sizes else 0.0,
+            "batch_size_max": max(sizes) if sizes else 0,
+            "last_error": self.last_error,
+        }
+
+
+class _SessionHandle:
+    __slots__ = ("owner", "__weakref__")
+
+    def __init__(self, owner: str):
+        self.owner = owner